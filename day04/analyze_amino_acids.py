@@ -1,4 +1,5 @@
 import json
+import re
 
 # 1. Amino acid categories
 AMINO_ACID_CATEGORIES = {
@@ -34,10 +35,174 @@ def categorize_amino_acids(sequence: str):
     return result
 
 
-# 2. Load JSON file and extract the sequence
-def extract_sequence_from_json(json_path: str):
-    with open(json_path, "r") as f:
-        data = json.load(f)
-    return data["sequence"]["value"]
+# 2. Incremental extraction of (accession, sequence) records
+CHUNK_CHARS = 64 * 1024
+
+_WHITESPACE_RE = re.compile(r"[ \t\n\r]*")
+_NUMBER_TAIL_RE = re.compile(r"[0-9.eE+-]*\Z")
+_DECODER = json.JSONDecoder()
+
+
+class _JsonReader:
+    """A cursor over a text file read in chunks; only the unread tail is kept in memory."""
+
+    def __init__(self, f, chunk_chars):
+        self.f = f
+        self.chunk_chars = chunk_chars
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def more(self):
+        # read at least as much as is buffered, so re-parsing a long value stays linear
+        data = self.f.read(max(self.chunk_chars, len(self.buf) - self.pos))
+        if not data:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + data
+        self.pos = 0
+        return True
+
+    def peek(self):
+        while True:
+            self.pos = _WHITESPACE_RE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.more():
+                raise ValueError("unexpected end of JSON")
+
+    def expect(self, chars):
+        char = self.peek()
+        if char not in chars:
+            raise ValueError(f"expected one of {chars!r} in JSON, got {char!r}")
+        self.pos += 1
+        return char
+
+    def key(self):
+        self.expect('"')
+        while True:
+            try:
+                key, end = json.decoder.scanstring(self.buf, self.pos)
+                break
+            except json.JSONDecodeError:
+                self.pos -= 1           # keep the opening quote
+                if not self.more():
+                    raise
+                self.pos += 1
+        self.pos = end
+        self.expect(":")
+        return key
+
+    def value(self):
+        """The next JSON value, decoded by the C decoder (only used for one field at a time)."""
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if not self.more():
+                    raise
+                continue
+            # a number cut by the chunk end ("5.", "1e", "2.5E+") decodes as its
+            # prefix: read on until something that can't continue it follows
+            if (isinstance(value, (int, float)) and not isinstance(value, bool)
+                    and _NUMBER_TAIL_RE.match(self.buf, end) and self.more()):
+                continue
+            self.pos = end
+            return value
+
+    def members(self):
+        """Keys of the object starting here; the caller must consume each value."""
+        self.expect("{")
+        if self.peek() == "}":
+            self.pos += 1
+            return
+        while True:
+            yield self.key()
+            if self.expect(",}") == "}":
+                return
+
+
+def _read_field(reader, key, record):
+    if key == "primaryAccession":
+        record[0] = reader.value()
+    elif key == "sequence":
+        sequence = reader.value()
+        record[1] = sequence.get("value") if isinstance(sequence, dict) else None
+    else:
+        reader.value()      # decoded and dropped right away
 
 
+def iter_json_records(f, chunk_chars: int = CHUNK_CHARS):
+    """
+    Yields (accession, sequence) for every entry in a UniProt JSON document,
+    either a single entry or a {"results": [...]} search / stream response.
+    The file is read chunk_chars at a time. The document is walked key by key;
+    every other field (features, references, ...) is decoded on its own and
+    dropped, so memory is one field of one entry, never the whole tree.
+    """
+    reader = _JsonReader(f, chunk_chars)
+    root = [None, None]
+
+    for key in reader.members():
+        if key == "results" and reader.peek() == "[":
+            reader.expect("[")
+            if reader.peek() == "]":
+                reader.pos += 1
+                continue
+            while True:
+                record = [None, None]
+                for record_key in reader.members():
+                    _read_field(reader, record_key, record)
+                yield tuple(record)
+                if reader.expect(",]") == "]":
+                    break
+        else:
+            _read_field(reader, key, root)
+
+    if root != [None, None]:
+        yield tuple(root)
+
+
+def fasta_accession(header: str) -> str:
+    """'>sp|P69905|HBA_HUMAN Hemoglobin ...' -> 'P69905'; otherwise the first word."""
+    name = header[1:].split(maxsplit=1)[0] if header[1:].strip() else ""
+    parts = name.split("|")
+    return parts[1] if len(parts) >= 3 else name
+
+
+def iter_fasta_records(f):
+    """Yields (accession, sequence) for every record of a FASTA file, one record in memory at a time."""
+    accession, lines = None, []
+    for line in f:
+        line = line.strip()
+        if not line:
+            continue
+        if line.startswith(">"):
+            if accession is not None:
+                yield accession, "".join(lines)
+            accession, lines = fasta_accession(line), []
+        else:
+            lines.append(line)
+    if accession is not None:
+        yield accession, "".join(lines)
+
+
+def iter_sequence_records(path: str):
+    """(accession, sequence) records of a downloaded file, FASTA or JSON (detected from the first character)."""
+    with open(path, "r", encoding="utf-8") as f:
+        first = f.read(1)
+        while first.isspace():
+            first = f.read(1)
+        f.seek(0)
+        records = iter_fasta_records(f) if first == ">" else iter_json_records(f)
+        yield from records
+
+
+# 3. Load JSON file and extract the sequence
+def extract_sequence_from_json(json_path: str):
+    with open(json_path, "r", encoding="utf-8") as f:
+        for _, sequence in iter_json_records(f):
+            if sequence is not None:
+                return sequence
+    raise ValueError(f"No sequence found in {json_path}")
@@ -0,0 +1,166 @@
+# day04 – bulk downloader benchmark
+#
+# Starts a local stand-in for the UniProt REST API (fixed latency per
+# request, so no network and no load on the real service) and downloads N
+# entries one at a time with plain requests.get, then with
+# download_uniprot_entries. Reports entries/sec for both.
+#
+# Usage:
+#   python day04/bench_downloader.py                  # 500 entries, 20 ms latency
+#   python day04/bench_downloader.py -n 2000 --workers 32 --latency 0.05
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import requests
+
+from uniprot_downloader import MAX_WORKERS, download_uniprot_entries
+
+
+def fake_entry(uniprot_id: str, length: int = 300, version: int = 1) -> dict:
+    sequence = ("MKTAYIAKQRQISFVKSHFSRQ" * (length // 22 + 1))[:length]
+    return {
+        "primaryAccession": uniprot_id,
+        "entryAudit": {"entryVersion": version},
+        "sequence": {"value": sequence, "length": length},
+    }
+
+
+def fake_fasta(uniprot_id: str, length: int = 300) -> str:
+    sequence = fake_entry(uniprot_id, length)["sequence"]["value"]
+    lines = [sequence[i:i + 60] for i in range(0, len(sequence), 60)]
+    return f">sp|{uniprot_id}|{uniprot_id}_STUB Stub protein OS=Homo sapiens\n" + "\n".join(lines) + "\n"
+
+
+class StubUniProtHandler(BaseHTTPRequestHandler):
+    """
+    GET /uniprotkb/<ID>.json, with the behaviour set on the server object.
+    Answers with an ETag + Last-Modified, and 304 to a matching If-None-Match.
+    GET /uniprotkb/stream?query=accession:A OR accession:B&format=fasta|json
+    returns all the listed entries in one response.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server = self.server
+        if urlsplit(self.path).path.endswith("/stream"):
+            return self._stream()
+        uniprot_id = self.path.rsplit("/", 1)[-1].split(".", 1)[0].split("?", 1)[0]
+        with server.lock:
+            server.hits[uniprot_id] = server.hits.get(uniprot_id, 0) + 1
+            attempt = server.hits[uniprot_id]
+        time.sleep(server.latency)
+
+        if uniprot_id in server.missing:
+            self._send(404, {"messages": [f"{uniprot_id} not found"]})
+        elif attempt <= server.flaky.get(uniprot_id, 0):
+            self._send(503, {"messages": ["try again"]}, {"Retry-After": "0"})
+        else:
+            body = json.dumps(fake_entry(uniprot_id, version=server.versions.get(uniprot_id, 1))).encode("utf-8")
+            etag = '"' + hashlib.sha1(body).hexdigest()[:16] + '"'
+            validators = {"ETag": etag, "Last-Modified": "Mon, 06 Oct 2025 00:00:00 GMT"}
+            if self.headers.get("If-None-Match") == etag:
+                with server.lock:
+                    server.not_modified += 1
+                self._send(304, None, validators)
+            else:
+                self._send(200, body, validators)
+
+    def _stream(self):
+        params = parse_qs(urlsplit(self.path).query)
+        ids = re.findall(r"accession:(\w+)", params.get("query", [""])[0])
+        if params.get("format", ["json"])[0] == "fasta":
+            body = "".join(fake_fasta(uid) for uid in ids).encode("utf-8")
+        else:
+            body = json.dumps({"results": [fake_entry(uid) for uid in ids]}, indent=2).encode("utf-8")
+        self._send(200, body)
+
+    def _send(self, status, payload, headers=None):
+        if payload is None:
+            body = b""
+        elif isinstance(payload, bytes):
+            body = payload
+        else:
+            body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        if status != 304:
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_stub_server(latency: float = 0.0, missing=(), flaky=None):
+    """
+    Serves fake entries on a free localhost port from a background thread.
+    missing: IDs answered with 404; flaky: {ID: number of 503s before a 200};
+    server.versions[ID] = n changes an entry's content (and ETag).
+    Returns (server, url_template); call server.shutdown() when done.
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubUniProtHandler)
+    server.daemon_threads = True
+    server.latency = latency
+    server.missing = set(missing)
+    server.flaky = dict(flaky or {})
+    server.versions = {}
+    server.hits = {}
+    server.not_modified = 0
+    server.lock = threading.Lock()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address[:2]
+    return server, f"http://{host}:{port}/uniprotkb/{{}}.json"
+
+
+def sequential_download(uniprot_ids, output_dir, url_template):
+    """The old way: a fresh requests.get (new connection) per ID, one at a time."""
+    for uniprot_id in uniprot_ids:
+        response = requests.get(url_template.format(uniprot_id))
+        with open(os.path.join(output_dir, f"{uniprot_id}.json"), "w", encoding="utf-8") as f:
+            f.write(response.text)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="bulk UniProt download benchmark (local stub server)")
+    parser.add_argument("-n", type=int, default=500, help="number of entries")
+    parser.add_argument("--workers", type=int, default=MAX_WORKERS)
+    parser.add_argument("--latency", type=float, default=0.02, help="stub server latency per request (s)")
+    parser.add_argument("--sequential-n", type=int, default=100, help="entries for the one-at-a-time baseline")
+    args = parser.parse_args()
+
+    server, url_template = start_stub_server(latency=args.latency)
+    ids = [f"P{i:05d}" for i in range(args.n)]
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            m = min(args.sequential_n, args.n)
+            start = time.perf_counter()
+            sequential_download(ids[:m], tmp, url_template)
+            seq_rate = m / (time.perf_counter() - start)
+            print(f"SEQUENTIAL      {seq_rate:>10,.1f} entries/s  ({m:,} entries)")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            start = time.perf_counter()
+            saved, errors = download_uniprot_entries(ids, tmp, max_workers=args.workers, url_template=url_template)
+            rate = len(saved) / (time.perf_counter() - start)
+            print(f"POOLED x{args.workers:<6} {rate:>10,.1f} entries/s  ({len(saved):,} saved, {len(errors)} errors)")
+    finally:
+        server.shutdown()
+
+    print(f"SPEEDUP: x{rate / seq_rate:.1f}")
+
+
+if __name__ == "__main__":
+    main()
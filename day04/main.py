@@ -1,14 +1,16 @@
-from uniprot_downloader import download_uniprot_entry
-from analyze_amino_acids import extract_sequence_from_json, categorize_amino_acids
+import argparse
+import os
+
+from uniprot_downloader import MAX_WORKERS, download_uniprot_entry, download_uniprot_entries, download_uniprot_stream
+from analyze_amino_acids import extract_sequence_from_json, categorize_amino_acids, iter_sequence_records
+from uniprot_cache import CACHE_DIR, UniProtCache
 
-def main():
-    print("=== UniProt Data Downloader ===")
-    uniprot_id = input("Enter UniProt ID (example: Q9LQT8 for Arabidopsis FLC): ")
 
+def download_one(uniprot_id, cache=None):
     output_file = f"{uniprot_id}.json"
 
     try:
-        download_uniprot_entry(uniprot_id, output_file)
+        download_uniprot_entry(uniprot_id, output_file, cache=cache)
         print(f"Data saved successfully to: {output_file}")
 
         sequence = extract_sequence_from_json(output_file)
@@ -22,6 +24,67 @@ def main():
     except Exception as e:
         print(f"Error: {e}")
 
+
+def download_many(uniprot_ids, output_dir, workers, rate, cache=None):
+    saved, errors = download_uniprot_entries(uniprot_ids, output_dir, max_workers=workers,
+                                             requests_per_second=rate, cache=cache)
+    print(f"Saved {len(saved)} entries to: {output_dir}")
+    for uniprot_id, message in errors.items():
+        print(f"Error ({uniprot_id}): {message}")
+
+
+def download_query(query, output_dir, fmt):
+    os.makedirs(output_dir, exist_ok=True)
+    output_file = os.path.join(output_dir, f"query_results.{fmt}")
+
+    try:
+        written = download_uniprot_stream(query, output_file, fmt=fmt)
+        print(f"Saved {written / 1024 ** 2:.1f} MB to: {output_file}")
+
+        records = residues = 0
+        for _, sequence in iter_sequence_records(output_file):
+            records += 1
+            residues += len(sequence or "")
+        print(f"{records} entries, {residues} amino acids")
+    except Exception as e:
+        print(f"Error: {e}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="UniProt Data Downloader")
+    parser.add_argument("ids", nargs="*", help="UniProt IDs to download in bulk")
+    parser.add_argument("--ids-file", help="text file with one UniProt ID per line")
+    parser.add_argument("--query", help='UniProt query for the stream endpoint, e.g. "organism_id:9606 AND reviewed:true"')
+    parser.add_argument("--format", choices=["fasta", "json"], default="fasta", help="format for --query")
+    parser.add_argument("--out-dir", default="uniprot_entries")
+    parser.add_argument("--workers", type=int, default=MAX_WORKERS)
+    parser.add_argument("--rate", type=float, default=None, help="max requests per second")
+    parser.add_argument("--cache-dir", default=CACHE_DIR)
+    parser.add_argument("--ttl-hours", type=float, default=24, help="revalidate cached entries older than this")
+    parser.add_argument("--no-cache", action="store_true", help="always download")
+    parser.add_argument("--offline", action="store_true", help="serve from the cache only")
+    args = parser.parse_args()
+
+    cache = None
+    if not args.no_cache:
+        cache = UniProtCache(args.cache_dir, ttl=args.ttl_hours * 3600, offline=args.offline)
+
+    uniprot_ids = list(args.ids)
+    if args.ids_file:
+        with open(args.ids_file, "r", encoding="utf-8") as f:
+            uniprot_ids += f.read().split()
+
+    if args.query:
+        download_query(args.query, args.out_dir, args.format)
+    elif uniprot_ids:
+        download_many(uniprot_ids, args.out_dir, args.workers, args.rate, cache)
+    else:
+        print("=== UniProt Data Downloader ===")
+        uniprot_id = input("Enter UniProt ID (example: Q9LQT8 for Arabidopsis FLC): ")
+        download_one(uniprot_id, cache)
+
+    if cache is not None:
+        print(cache.summary())
+
 if __name__ == "__main__":
     main()
-
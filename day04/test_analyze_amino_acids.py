@@ -0,0 +1,63 @@
+import io
+import json
+
+import pytest
+
+import analyze_amino_acids as analysis
+
+ENTRY = {
+    "entryType": "UniProtKB reviewed (Swiss-Prot)",
+    "primaryAccession": "P69905",
+    "features": [{"type": "Chain", "alternativeSequence": {"value": "XX"}, "sequence": {"value": "no"}}],
+    "comments": [{"texts": [{"value": 'quotes " braces {} [brackets], backslash \\ é'}]}],
+    "annotationScore": 5.0,
+    "sequence": {"value": "MVLSPADKTNVKAAW", "length": 15},
+}
+
+
+@pytest.mark.parametrize("chunk_chars", [1, 3, 16, 64 * 1024])
+def test_json_records_single_entry_and_stream_in_any_chunk_size(chunk_chars):
+    other = dict(ENTRY, primaryAccession="P68871", sequence={"length": 4, "value": "MVHL"})
+
+    single = json.dumps(ENTRY, ensure_ascii=False)
+    stream = json.dumps({"results": [ENTRY, other]}, indent=2)
+
+    assert list(analysis.iter_json_records(io.StringIO(single), chunk_chars)) == [("P69905", "MVLSPADKTNVKAAW")]
+    assert list(analysis.iter_json_records(io.StringIO(stream), chunk_chars)) == [
+        ("P69905", "MVLSPADKTNVKAAW"), ("P68871", "MVHL"),
+    ]
+    assert list(analysis.iter_json_records(io.StringIO('{"results": []}'), chunk_chars)) == []
+
+
+def test_numbers_split_at_every_chunk_boundary():
+    entry = dict(ENTRY, annotationScore=5.0, mass=1.5e-07, counts=[-12, 2.5E+30, 0.125, 7])
+    doc = json.dumps({"results": [entry, dict(entry, primaryAccession="P68871")]}).replace("e-07", "E-07")
+
+    for chunk_chars in range(1, len(doc) + 1):
+        assert list(analysis.iter_json_records(io.StringIO(doc), chunk_chars)) == [
+            ("P69905", "MVLSPADKTNVKAAW"), ("P68871", "MVLSPADKTNVKAAW"),
+        ], chunk_chars
+
+
+def test_truncated_json_raises():
+    with pytest.raises(ValueError):
+        list(analysis.iter_json_records(io.StringIO(json.dumps(ENTRY)[:-20]), 8))
+
+
+def test_fasta_records():
+    fasta = ">sp|P69905|HBA_HUMAN Hemoglobin subunit alpha\nMVLSPADK\nTNVKAAW\n\n>tr|A0A024|A0A024_HUMAN x\nMK\n>custom\nAC\n"
+
+    assert list(analysis.iter_fasta_records(io.StringIO(fasta))) == [
+        ("P69905", "MVLSPADKTNVKAAW"), ("A0A024", "MK"), ("custom", "AC"),
+    ]
+
+
+def test_file_helpers_detect_the_format(tmp_path):
+    json_path = tmp_path / "P69905.json"
+    json_path.write_text(json.dumps(ENTRY), encoding="utf-8")
+    fasta_path = tmp_path / "hits.fasta"
+    fasta_path.write_text("\n>sp|P69905|HBA_HUMAN\nMVLS\n", encoding="utf-8")
+
+    assert analysis.extract_sequence_from_json(str(json_path)) == "MVLSPADKTNVKAAW"
+    assert list(analysis.iter_sequence_records(str(json_path))) == [("P69905", "MVLSPADKTNVKAAW")]
+    assert list(analysis.iter_sequence_records(str(fasta_path))) == [("P69905", "MVLS")]
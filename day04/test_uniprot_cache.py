@@ -0,0 +1,132 @@
+import json
+import os
+
+import pytest
+
+pytest.importorskip("requests")
+
+from bench_downloader import start_stub_server
+from uniprot_cache import UniProtCache
+from uniprot_downloader import download_uniprot_entries
+
+
+@pytest.fixture
+def stub():
+    server, url_template = start_stub_server()
+    yield server, url_template
+    server.shutdown()
+    server.server_close()
+
+
+def _version(data):
+    return json.loads(data)["entryAudit"]["entryVersion"]
+
+
+def test_hit_is_served_without_a_request(tmp_path, stub):
+    server, url_template = stub
+    cache = UniProtCache(str(tmp_path))
+
+    first = cache.get("P00001", url_template=url_template)
+    second = cache.get("P00001", url_template=url_template)
+
+    assert first == second and json.loads(first)["primaryAccession"] == "P00001"
+    assert server.hits == {"P00001": 1}
+    assert (cache.stats["misses"], cache.stats["hits"]) == (1, 1)
+    assert os.path.exists(tmp_path / "P00001.json.gz") and os.path.exists(tmp_path / "P00001.meta.json")
+
+
+def test_expired_entries_are_revalidated(tmp_path, stub):
+    server, url_template = stub
+    cache = UniProtCache(str(tmp_path), ttl=0)
+
+    cache.get("P00001", url_template=url_template)
+    assert _version(cache.get("P00001", url_template=url_template)) == 1
+    assert server.not_modified == 1 and cache.stats["revalidated"] == 1
+
+    server.versions["P00001"] = 2
+    assert _version(cache.get("P00001", url_template=url_template)) == 2
+    assert cache.stats["updated"] == 1
+
+
+def test_offline_and_unreachable_server(tmp_path, stub):
+    server, url_template = stub
+    UniProtCache(str(tmp_path)).get("P00001", url_template=url_template)
+    server.shutdown()
+    server.server_close()
+
+    offline = UniProtCache(str(tmp_path), offline=True)
+    assert _version(offline.get("P00001")) == 1
+    with pytest.raises(ValueError, match="offline"):
+        offline.get("P00002")
+
+    # expired + server gone -> the stale copy is served
+    stale = UniProtCache(str(tmp_path), ttl=0)
+    assert _version(stale.get("P00001", url_template=url_template, retries=0, timeout=1)) == 1
+    assert stale.stats["stale"] == 1
+
+
+def test_lru_eviction_keeps_recently_used(tmp_path, stub):
+    _, url_template = stub
+    cache = UniProtCache(str(tmp_path))
+    cache.get("P00001", url_template=url_template)
+    entry_size = cache.size_bytes()
+    cache.max_bytes = 2 * entry_size + entry_size // 2
+
+    cache.get("P00002", url_template=url_template)
+    os.utime(tmp_path / "P00001.json.gz", (1, 1))
+    os.utime(tmp_path / "P00002.json.gz", (2, 2))
+    cache.get("P00001", url_template=url_template)   # hit -> most recently used
+    cache.get("P00003", url_template=url_template)   # over the limit -> P00002 goes
+
+    assert sorted(p.name for p in tmp_path.glob("*.json.gz")) == ["P00001.json.gz", "P00003.json.gz"]
+    assert cache.stats["evictions"] == 1
+    assert not os.path.exists(tmp_path / "P00002.meta.json")
+
+    # a new instance takes the LRU order from the files' mtimes
+    os.utime(tmp_path / "P00003.json.gz", (1, 1))
+    restarted = UniProtCache(str(tmp_path), max_bytes=cache.max_bytes)
+    assert restarted.size_bytes() == cache.size_bytes()
+    restarted.get("P00004", url_template=url_template)
+    assert sorted(p.name for p in tmp_path.glob("*.json.gz")) == ["P00001.json.gz", "P00004.json.gz"]
+
+
+def test_corrupt_entry_is_refetched(tmp_path, stub):
+    server, url_template = stub
+    cache = UniProtCache(str(tmp_path))
+    cache.get("P00001", url_template=url_template)
+    (tmp_path / "P00001.json.gz").write_bytes(b"not gzip")
+
+    assert _version(cache.get("P00001", url_template=url_template)) == 1
+    assert server.hits["P00001"] == 2
+
+
+def test_bulk_download_through_the_cache(tmp_path, stub):
+    server, url_template = stub
+    cache = UniProtCache(str(tmp_path / "cache"))
+    ids = ["P00001", "P00002", "P00003"]
+
+    for _ in range(2):
+        saved, errors = download_uniprot_entries(ids, str(tmp_path / "out"), url_template=url_template, cache=cache)
+        assert sorted(saved) == ids and not errors
+
+    assert server.hits == {uid: 1 for uid in ids}
+    assert cache.stats["hits"] == 3
+
+
+def test_download_to_streams_misses_and_hits_to_disk(tmp_path, stub):
+    server, url_template = stub
+    cache = UniProtCache(str(tmp_path / "cache"))
+    out = tmp_path / "P00001.json"
+
+    written = cache.download_to("P00001", str(out), url_template=url_template)
+    assert written == out.stat().st_size and json.loads(out.read_bytes())["primaryAccession"] == "P00001"
+
+    (tmp_path / "cache" / "P00001.json.gz").write_bytes(b"not gzip")
+    out.unlink()
+    cache.download_to("P00001", str(out), url_template=url_template)   # corrupt -> refetched
+    cache.download_to("P00001", str(out), url_template=url_template)   # hit, decompressed from the cache
+
+    assert json.loads(out.read_bytes()) == json.loads(cache.get("P00001"))
+    assert server.hits == {"P00001": 2}
+    assert (cache.stats["misses"], cache.stats["hits"]) == (2, 2)
+    assert not os.path.exists(f"{out}.part")
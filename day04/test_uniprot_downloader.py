@@ -0,0 +1,118 @@
+import json
+import time
+
+import pytest
+
+pytest.importorskip("requests")
+
+import requests
+
+import uniprot_downloader
+from analyze_amino_acids import iter_sequence_records
+from bench_downloader import start_stub_server
+
+
+@pytest.fixture
+def stub():
+    servers = []
+
+    def start(**kwargs):
+        server, url_template = start_stub_server(**kwargs)
+        servers.append(server)
+        return server, url_template
+
+    yield start
+    for server in servers:
+        server.shutdown()
+
+
+def test_bulk_download_reports_errors_per_id(tmp_path, stub):
+    server, url_template = stub(missing={"BAD01"}, flaky={"P00002": 2})
+    ids = ["P00001", "P00002", "BAD01", "P00003", "P00001"]
+
+    saved, errors = uniprot_downloader.download_uniprot_entries(
+        ids, str(tmp_path), max_workers=4, url_template=url_template, backoff=0.01
+    )
+
+    assert sorted(saved) == ["P00001", "P00002", "P00003"]
+    assert list(errors) == ["BAD01"] and "404" in errors["BAD01"]
+    with open(saved["P00002"], encoding="utf-8") as f:
+        assert json.load(f)["primaryAccession"] == "P00002"
+    # 404 is not retried, 503 is; duplicates are downloaded once
+    assert server.hits == {"P00001": 1, "P00002": 3, "BAD01": 1, "P00003": 1}
+
+
+def test_gives_up_after_retries(tmp_path, stub):
+    server, url_template = stub(flaky={"P00001": 10})
+
+    with pytest.raises(ValueError, match="503"):
+        uniprot_downloader.download_uniprot_entry(
+            "P00001", str(tmp_path / "x.json"), url_template=url_template, retries=2, backoff=0.01
+        )
+    assert server.hits["P00001"] == 3
+
+
+def test_rate_limit_spaces_requests(tmp_path, stub):
+    _, url_template = stub()
+
+    start = time.perf_counter()
+    saved, _ = uniprot_downloader.download_uniprot_entries(
+        [f"P{i:05d}" for i in range(11)], str(tmp_path), max_workers=8,
+        requests_per_second=50, url_template=url_template,
+    )
+
+    assert len(saved) == 11
+    assert time.perf_counter() - start >= 10 / 50 * 0.9
+
+
+def test_connection_errors_are_reported(tmp_path):
+    _, errors = uniprot_downloader.download_uniprot_entries(
+        ["P00001"], str(tmp_path), url_template="http://127.0.0.1:9/{}.json", retries=1, backoff=0.01,
+        timeout=1,
+    )
+    assert "ConnectionError" in errors["P00001"]
+
+
+def test_entry_is_streamed_to_disk(tmp_path, stub):
+    _, url_template = stub()
+    path = tmp_path / "P00001.json"
+
+    uniprot_downloader.download_uniprot_entry("P00001", str(path), url_template=url_template)
+
+    assert json.loads(path.read_text(encoding="utf-8"))["primaryAccession"] == "P00001"
+    assert [p.name for p in tmp_path.iterdir()] == ["P00001.json"]
+
+
+def test_throwaway_session_is_closed(tmp_path, stub, monkeypatch):
+    _, url_template = stub()
+    closed = []
+
+    class RecordingSession(requests.Session):
+        def close(self):
+            closed.append(self)
+            super().close()
+
+    monkeypatch.setattr(requests, "Session", RecordingSession)
+    path = tmp_path / "P00001.json"
+
+    uniprot_downloader.download_uniprot_entry("P00001", str(path), url_template=url_template)
+
+    # closed before the streamed body was read, which must still work
+    assert len(closed) == 1
+    assert json.loads(path.read_text(encoding="utf-8"))["primaryAccession"] == "P00001"
+
+
+@pytest.mark.parametrize("fmt", ["fasta", "json"])
+def test_bulk_stream_download(tmp_path, stub, fmt):
+    _, url_template = stub()
+    stream_url = url_template.rsplit("/", 1)[0] + "/stream"
+    path = tmp_path / f"hits.{fmt}"
+
+    written = uniprot_downloader.download_uniprot_stream(
+        "accession:P00001 OR accession:P00002", str(path), fmt=fmt, url=stream_url
+    )
+
+    assert written == path.stat().st_size
+    records = list(iter_sequence_records(str(path)))
+    assert [accession for accession, _ in records] == ["P00001", "P00002"]
+    assert all(len(sequence) == 300 for _, sequence in records)
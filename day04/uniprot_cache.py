@@ -0,0 +1,235 @@
+import gzip
+import hashlib
+import io
+import json
+import os
+import threading
+import time
+import zlib
+from collections import OrderedDict
+
+import requests
+
+from uniprot_downloader import CHUNK_SIZE, fetch_uniprot_entry
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".uniprot_cache")
+TTL = 24 * 3600                 # seconds before an entry is revalidated with the server
+MAX_BYTES = 500 * 1024 ** 2     # compressed size on disk before LRU eviction
+
+
+class UniProtCache:
+    """
+    On-disk cache of UniProt entries, one gzip-compressed JSON per accession
+    (<ACC>.json.gz) plus its metadata (<ACC>.meta.json: ETag, Last-Modified,
+    fetch time, sha256 of the JSON).
+
+    - fresh entries (younger than ttl) are served without any network access
+    - stale entries are revalidated with If-None-Match / If-Modified-Since;
+      a 304 only refreshes the fetch time, a 200 replaces the entry
+    - if revalidation fails (no network), the stale copy is served
+    - offline=True never touches the network; a miss raises ValueError
+    - the least recently used entries are evicted when the compressed total
+      goes over max_bytes (LRU order is kept in memory; a hit also touches
+      the file's mtime, so the order survives restarts)
+    - bodies are streamed: download_to() never holds an entry in memory
+    """
+
+    def __init__(self, cache_dir: str = CACHE_DIR, ttl: float = TTL, max_bytes: int = MAX_BYTES,
+                 offline: bool = False):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.offline = offline
+        self.stats = {"hits": 0, "misses": 0, "revalidated": 0, "updated": 0, "stale": 0, "evictions": 0}
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+        # accession -> compressed size, least recently used first (seeded from
+        # the files' mtimes, then kept in order in memory)
+        entries = []
+        for name in os.listdir(cache_dir):
+            if name.endswith(".json.gz"):
+                st = os.stat(os.path.join(cache_dir, name))
+                entries.append((st.st_mtime, name[:-len(".json.gz")], st.st_size))
+        self._sizes = OrderedDict((accession, size) for _, accession, size in sorted(entries))
+        self._total_bytes = sum(self._sizes.values())
+
+    # ---------- files ----------
+    def _data_path(self, accession):
+        return os.path.join(self.cache_dir, f"{accession}.json.gz")
+
+    def _meta_path(self, accession):
+        return os.path.join(self.cache_dir, f"{accession}.meta.json")
+
+    def _read_meta(self, accession):
+        """The entry's metadata, or None when missing or unreadable."""
+        try:
+            with open(self._meta_path(accession), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _copy_cached(self, accession, meta, dst) -> bool:
+        """
+        Decompresses the cached JSON into the binary file dst chunk by chunk,
+        checking its sha256 on the way. False when missing or corrupt.
+        """
+        dst.seek(0)
+        dst.truncate()
+        digest = hashlib.sha256()
+        try:
+            with gzip.open(self._data_path(accession), "rb") as f:
+                for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+                    digest.update(chunk)
+                    dst.write(chunk)
+        except (OSError, EOFError, zlib.error):
+            return False
+        return digest.hexdigest() == meta.get("sha256")
+
+    def _write_json(self, path, meta):
+        tmp = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        os.replace(tmp, path)
+
+    def _store(self, accession, response, dst):
+        """
+        Streams a (stream=True) response into the gzip cache file and into
+        dst at the same time, so the body is never held in memory.
+        """
+        path = self._data_path(accession)
+        tmp = f"{path}.{threading.get_ident()}.tmp"
+        dst.seek(0)
+        dst.truncate()
+        digest = hashlib.sha256()
+        try:
+            with response, gzip.open(tmp, "wb", compresslevel=6) as f:
+                for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                    digest.update(chunk)
+                    f.write(chunk)
+                    dst.write(chunk)
+            os.replace(tmp, path)
+        except requests.RequestException as e:
+            raise ValueError(f"Download of {accession} interrupted. {type(e).__name__}: {e}") from e
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+        self._write_json(self._meta_path(accession), {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "fetched_at": time.time(),
+            "sha256": digest.hexdigest(),
+        })
+        size = os.path.getsize(path)
+        with self._lock:
+            self._total_bytes += size - self._sizes.get(accession, 0)
+            self._sizes[accession] = size
+            self._sizes.move_to_end(accession)
+        self._evict(keep=accession)
+
+    def _evict(self, keep):
+        with self._lock:
+            while self._total_bytes > self.max_bytes and len(self._sizes) > 1:
+                accession = next(iter(self._sizes))   # least recently used
+                if accession == keep:
+                    self._sizes.move_to_end(keep)
+                    continue
+                self._total_bytes -= self._sizes.pop(accession)
+                for path in (self._data_path(accession), self._meta_path(accession)):
+                    if os.path.exists(path):
+                        os.remove(path)
+                self.stats["evictions"] += 1
+
+    def _touch(self, accession):
+        with self._lock:
+            if accession in self._sizes:
+                self._sizes.move_to_end(accession)
+        try:
+            os.utime(self._data_path(accession))   # keeps the order for the next run
+        except OSError:  # evicted meanwhile by another thread
+            pass
+
+    def _count(self, stat):
+        with self._lock:
+            self.stats[stat] += 1
+
+    def _fetch_into(self, accession, dst, session, fetch_options):
+        """Writes the entry's JSON into dst, from the cache or the server."""
+        meta = self._read_meta(accession)
+
+        if meta is not None and (self.offline or time.time() - meta.get("fetched_at", 0) < self.ttl):
+            if self._copy_cached(accession, meta, dst):
+                self._touch(accession)
+                self._count("hits")
+                return
+            meta = None  # corrupt: fetch it again
+
+        if meta is not None:
+            headers = {}
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+            try:
+                response = fetch_uniprot_entry(accession, session, headers=headers, stream=True, **fetch_options)
+            except ValueError:
+                if self._copy_cached(accession, meta, dst):
+                    self._count("stale")
+                    self._touch(accession)
+                    return
+            else:
+                if response.status_code != 304:
+                    self._count("updated")
+                    self._store(accession, response, dst)
+                    return
+                response.close()
+                if self._copy_cached(accession, meta, dst):
+                    meta["fetched_at"] = time.time()
+                    self._write_json(self._meta_path(accession), meta)
+                    self._touch(accession)
+                    self._count("revalidated")
+                    return
+
+        self._count("misses")
+        if self.offline:
+            raise ValueError(f"{accession} is not in the cache (offline)")
+        response = fetch_uniprot_entry(accession, session, stream=True, **fetch_options)
+        self._store(accession, response, dst)
+
+    # ---------- public API ----------
+    def get(self, accession: str, session: requests.Session = None, **fetch_options) -> bytes:
+        """
+        The entry's JSON (bytes). fetch_options go to fetch_uniprot_entry
+        (url_template, timeout, retries, backoff, rate_limiter).
+        """
+        buffer = io.BytesIO()
+        self._fetch_into(accession, buffer, session, fetch_options)
+        return buffer.getvalue()
+
+    def download_to(self, accession: str, output_path: str, session: requests.Session = None,
+                    **fetch_options) -> int:
+        """
+        Writes the entry's JSON to output_path without holding it in memory:
+        hits are decompressed from the cache chunk by chunk, misses are
+        streamed into the cache and output_path at once. Goes through a
+        temporary file, like stream_to_file. Returns the number of bytes written.
+        """
+        tmp = f"{output_path}.part"
+        try:
+            with open(tmp, "wb") as f:
+                self._fetch_into(accession, f, session, fetch_options)
+                written = f.tell()
+            os.replace(tmp, output_path)
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+        return written
+
+    def size_bytes(self) -> int:
+        with self._lock:
+            return self._total_bytes
+
+    def summary(self) -> str:
+        s = self.stats
+        return (f"CACHE: {len(self._sizes)} entries, {self.size_bytes() / 1024 ** 2:.1f} MB"
+                f" | hits={s['hits']} misses={s['misses']} revalidated={s['revalidated']}"
+                f" updated={s['updated']} stale={s['stale']} evictions={s['evictions']}")
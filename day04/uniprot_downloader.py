@@ -1,16 +1,187 @@
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
+from requests.adapters import HTTPAdapter
 
 UNIPROT_URL = "https://rest.uniprot.org/uniprotkb/{}.json"
+UNIPROT_STREAM_URL = "https://rest.uniprot.org/uniprotkb/stream"
+
+TIMEOUT = 10            # seconds, per request (connect + read)
+RETRIES = 3             # extra attempts after the first one
+BACKOFF = 0.5           # first retry waits ~0.5s, then 1s, 2s, ...
+MAX_BACKOFF = 30.0
+MAX_WORKERS = 8
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+CHUNK_SIZE = 64 * 1024  # bytes per write when streaming to disk
+
+
+class RateLimiter:
+    """
+    Spaces request starts at least 1/per_second apart, across all threads.
+    """
+
+    def __init__(self, per_second: float):
+        self.interval = 1.0 / per_second
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
+def make_session(pool_size: int = MAX_WORKERS) -> requests.Session:
+    """
+    A session whose connection pool has room for pool_size concurrent
+    requests, so every worker thread reuses a keep-alive connection.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _retry_delay(response, attempt: int, backoff: float) -> float:
+    retry_after = response.headers.get("Retry-After") if response is not None else None
+    if retry_after and retry_after.isdigit():
+        return min(float(retry_after), MAX_BACKOFF)
+    delay = backoff * 2 ** attempt
+    return min(delay + random.uniform(0, delay / 2), MAX_BACKOFF)
+
 
-def download_uniprot_entry(uniprot_id: str, output_path: str) -> None:
+def get_with_retries(url: str, session: requests.Session = None, timeout: float = TIMEOUT,
+                     retries: int = RETRIES, backoff: float = BACKOFF, rate_limiter: RateLimiter = None,
+                     headers: dict = None, params: dict = None, stream: bool = False,
+                     label: str = None) -> requests.Response:
+    """
+    GET with retries: timeouts, connection errors and HTTP 429/5xx are retried
+    with exponential backoff (Retry-After is honoured); any other status but
+    200 (or 304 for a conditional request) fails straight away.
+    Raises ValueError on failure.
+    Without a session, one is opened just for this call and closed again
+    (a streamed response keeps its own connection until it is read).
+    """
+    if session is None:
+        with requests.Session() as session:
+            return get_with_retries(url, session, timeout, retries, backoff, rate_limiter,
+                                    headers, params, stream, label)
+
+    for attempt in range(retries + 1):
+        if rate_limiter is not None:
+            rate_limiter.wait()
+        response = None
+        try:
+            response = session.get(url, timeout=timeout, headers=headers, params=params, stream=stream)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            error = f"{type(e).__name__}: {e}"
+        else:
+            if response.status_code == 200 or (response.status_code == 304 and headers):
+                return response
+            error = f"HTTP status: {response.status_code}"
+            response.close()
+            if response.status_code not in RETRY_STATUSES:
+                break
+        if attempt < retries:
+            time.sleep(_retry_delay(response, attempt, backoff))
+
+    raise ValueError(f"Failed to download {label or url}. {error}")
+
+
+def fetch_uniprot_entry(uniprot_id: str, session: requests.Session = None, url_template: str = UNIPROT_URL,
+                        **options) -> requests.Response:
+    """
+    GETs one UniProt entry (see get_with_retries for the options).
+    """
+    return get_with_retries(url_template.format(uniprot_id), session, label=uniprot_id, **options)
+
+
+def stream_to_file(response: requests.Response, output_path: str, chunk_size: int = CHUNK_SIZE) -> int:
+    """
+    Writes a streamed response to output_path chunk by chunk (never the whole
+    body in memory), via a temporary file so a broken download leaves nothing
+    behind. Returns the number of bytes written.
+    """
+    tmp = f"{output_path}.part"
+    written = 0
+    try:
+        with response, open(tmp, "wb") as f:
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                f.write(chunk)
+                written += len(chunk)
+        os.replace(tmp, output_path)
+    except requests.RequestException as e:
+        raise ValueError(f"Download interrupted after {written} bytes. {type(e).__name__}: {e}") from e
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+    return written
+
+
+def download_uniprot_entry(uniprot_id: str, output_path: str, session: requests.Session = None,
+                           cache=None, **fetch_options) -> None:
     """
     Downloads a UniProt entry in JSON format and saves it locally.
+    With a UniProtCache, the entry comes from (and goes into) the cache.
+    """
+    if cache is not None:
+        cache.download_to(uniprot_id, output_path, session, **fetch_options)
+        return
+
+    response = fetch_uniprot_entry(uniprot_id, session, stream=True, **fetch_options)
+    stream_to_file(response, output_path)
+
+
+def download_uniprot_stream(query: str, output_path: str, fmt: str = "fasta", session: requests.Session = None,
+                            url: str = UNIPROT_STREAM_URL, **options) -> int:
+    """
+    Downloads every entry matching a UniProt query (e.g. "accession:P69905 OR
+    accession:P68871", "organism_id:9606 AND reviewed:true") from the stream
+    endpoint in one request, as FASTA or JSON, straight to disk.
+    Returns the number of bytes written.
+    """
+    if fmt not in ("fasta", "json"):
+        raise ValueError(f"unsupported format: {fmt}")
+    response = get_with_retries(url, session, params={"query": query, "format": fmt}, stream=True,
+                                label=f"query {query!r}", **options)
+    return stream_to_file(response, output_path)
+
+
+def download_uniprot_entries(uniprot_ids, output_dir: str, max_workers: int = MAX_WORKERS,
+                             requests_per_second: float = None, url_template: str = UNIPROT_URL,
+                             timeout: float = TIMEOUT, retries: int = RETRIES, backoff: float = BACKOFF,
+                             cache=None):
+    """
+    Downloads many UniProt entries concurrently (a thread pool over one pooled
+    session) into output_dir/<ID>.json. One failing ID never stops the batch.
+
+    Returns (saved, errors): {id: path} and {id: error message}.
     """
-    url = UNIPROT_URL.format(uniprot_id)
-    response = requests.get(url)
+    os.makedirs(output_dir, exist_ok=True)
+    ids = list(dict.fromkeys(uid.strip() for uid in uniprot_ids if uid.strip()))
+    rate_limiter = RateLimiter(requests_per_second) if requests_per_second else None
+    session = make_session(max_workers)
 
-    if response.status_code != 200:
-        raise ValueError(f"Failed to download data. HTTP status: {response.status_code}")
+    def download(uniprot_id):
+        path = os.path.join(output_dir, f"{uniprot_id}.json")
+        download_uniprot_entry(uniprot_id, path, session, cache, url_template=url_template, timeout=timeout,
+                               retries=retries, backoff=backoff, rate_limiter=rate_limiter)
+        return path
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(response.text)
+    saved, errors = {}, {}
+    with session, ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {uniprot_id: pool.submit(download, uniprot_id) for uniprot_id in ids}
+        for uniprot_id, future in futures.items():
+            try:
+                saved[uniprot_id] = future.result()
+            except Exception as e:
+                errors[uniprot_id] = str(e)
+    return saved, errors
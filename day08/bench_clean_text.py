@@ -0,0 +1,93 @@
+# ============================================================
+# DAY08 – TEXT CLEANING BENCHMARK (TWEETS / SEC)
+# ============================================================
+#
+# Compares CLEAN_TEXT (one tweet at a time) with clean_texts, and with
+# clean_texts chunked over a process pool, on synthetic tweets that contain
+# URLs, mentions, hashtags, contractions, digits and noise words.
+# Every variant is checked to give exactly the same output as CLEAN_TEXT.
+#
+# Usage:
+#   python day08/bench_clean_text.py
+#   python day08/bench_clean_text.py -n 1000000 --workers 4
+
+import argparse
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from text_cleaning import CHUNK_ROWS, CLEAN_TEXT, clean_texts
+
+# =========================
+# SYNTHETIC TWEETS
+# =========================
+WORDS = [
+    "i", "love", "this", "day", "you", "are", "so", "stupid", "what", "a",
+    "the", "people", "never", "hate", "happy", "father's", "it's", "can't",
+    "won't", "dont", "RT", "via", "amp", "&amp;", "2016", "!!!", "...", "Bihday",
+]
+EXTRAS = [
+    "@user", "@user_42", "#love", "#Happy", "http://t.co/AbC123", "https://x.com/a?b=1",
+    "www.example.com/page", "😀", "café", "@userhttp://t.co/x", "\n",
+]
+
+
+def synthetic_tweets(n, seed=0):
+    rng = random.Random(seed)
+    tweets = []
+    for _ in range(n):
+        tokens = [rng.choice(WORDS) for _ in range(rng.randint(4, 20))]
+        for _ in range(rng.randint(0, 3)):
+            tokens.insert(rng.randint(0, len(tokens)), rng.choice(EXTRAS))
+        tweets.append(" ".join(tokens))
+    return tweets
+
+
+# =========================
+# BENCHMARK
+# =========================
+def clean_parallel(tweets, workers):
+    chunks = [tweets[i:i + CHUNK_ROWS] for i in range(0, len(tweets), CHUNK_ROWS)]
+    out = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for part in pool.map(clean_texts, chunks):
+            out.extend(part)
+    return out
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CLEAN_TEXT vs clean_texts throughput")
+    parser.add_argument("-n", type=int, default=500_000, help="number of synthetic tweets")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    tweets = synthetic_tweets(args.n, args.seed)
+
+    variants = [
+        ("CLEAN_TEXT (apply)", lambda: [CLEAN_TEXT(t) for t in tweets]),
+        ("clean_texts", lambda: clean_texts(tweets)),
+        (f"clean_texts x{args.workers} procs", lambda: clean_parallel(tweets, args.workers)),
+    ]
+
+    print(f"TWEETS: {args.n:,}")
+    reference = None
+    base_rate = None
+    for name, run in variants:
+        start = time.perf_counter()
+        result = run()
+        seconds = time.perf_counter() - start
+
+        if reference is None:
+            reference = result
+        elif result != reference:
+            raise SystemExit(f"{name}: output differs from CLEAN_TEXT")
+
+        rate = args.n / seconds
+        base_rate = base_rate or rate
+        print(f"{name:<26} {seconds:>7.2f} s  {rate:>12,.0f} tweets/s  x{rate / base_rate:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+# ============================================================
+# DAY08 – EVALUATION BENCHMARK (THRESHOLD SWEEP + BOOTSTRAP CI)
+# ============================================================
+#
+# Times threshold_sweep and bootstrap_auc_ci on N synthetic predictions and,
+# when scikit-learn is installed, compares them with precision_recall_curve
+# and with a naive bootstrap that calls roc_auc_score on every resample
+# (timed on a few resamples and extrapolated).
+#
+# Usage:
+#   python day08/bench_evaluation.py                    # 1,000,000 predictions
+#   python day08/bench_evaluation.py -n 200000 --n-boot 2000
+
+import argparse
+import time
+
+import numpy as np
+
+from evaluation import N_BINS, N_BOOT, best_threshold, bootstrap_auc_ci, threshold_sweep
+
+
+# =========================
+# SYNTHETIC DATA
+# =========================
+def synthetic_predictions(n, toxic_share=0.1, seed=0):
+    rng = np.random.default_rng(seed)
+    y = rng.random(n) < toxic_share
+    s = 1 / (1 + np.exp(-rng.normal(np.where(y, 1.5, -1.5), 1.5)))
+    return y, s.astype(np.float32)
+
+
+def naive_bootstrap_seconds(y, s, n_resamples, seed=0):
+    """Seconds per resample for index resampling + roc_auc_score."""
+    from sklearn.metrics import roc_auc_score
+
+    rng = np.random.default_rng(seed)
+    start = time.perf_counter()
+    for _ in range(n_resamples):
+        idx = rng.integers(0, y.size, size=y.size)
+        roc_auc_score(y[idx], s[idx])
+    return (time.perf_counter() - start) / n_resamples
+
+
+# =========================
+# MAIN
+# =========================
+def main():
+    parser = argparse.ArgumentParser(description="threshold sweep / bootstrap CI benchmark")
+    parser.add_argument("-n", type=int, default=1_000_000, help="number of predictions")
+    parser.add_argument("--n-boot", type=int, default=N_BOOT)
+    parser.add_argument("--n-bins", type=int, default=N_BINS)
+    parser.add_argument("--naive-resamples", type=int, default=5)
+    args = parser.parse_args()
+
+    y, s = synthetic_predictions(args.n)
+    print(f"PREDICTIONS: {args.n:,}  TOXIC: {int(y.sum()):,}")
+
+    start = time.perf_counter()
+    sweep = threshold_sweep(y, s)
+    best = best_threshold(sweep)
+    sweep_seconds = time.perf_counter() - start
+    print(f"SWEEP      {sweep_seconds:>7.2f} s  {sweep['thresholds'].size:,} thresholds"
+          f"  best F1 {best['f1']:.4f} at {best['thresholds']:.4f}")
+
+    start = time.perf_counter()
+    ci = bootstrap_auc_ci(y, s, n_boot=args.n_boot, n_bins=args.n_bins)
+    ci_seconds = time.perf_counter() - start
+    print(f"BOOTSTRAP  {ci_seconds:>7.2f} s  {ci['n_boot']} resamples over {ci['bins']:,} bins"
+          f"  AUC {ci['auc']:.4f} [{ci['low']:.4f}, {ci['high']:.4f}]")
+
+    try:
+        from sklearn.metrics import precision_recall_curve, roc_auc_score
+    except ImportError:
+        print("scikit-learn not installed; skipping the comparison")
+        return
+
+    start = time.perf_counter()
+    precision, recall, _ = precision_recall_curve(y, s)
+    sk_seconds = time.perf_counter() - start
+    f1 = 2 * precision * recall / np.maximum(precision + recall, 1e-12)
+    print(f"SKLEARN PR {sk_seconds:>7.2f} s  best F1 {f1.max():.4f}"
+          f"  AUC {roc_auc_score(y, s):.4f}")
+
+    per_resample = naive_bootstrap_seconds(y, s, args.naive_resamples)
+    naive_total = per_resample * args.n_boot
+    print(f"NAIVE BOOTSTRAP ~{naive_total:>6.1f} s for {args.n_boot} resamples"
+          f"  ({per_resample:.3f} s each)  SPEEDUP: x{naive_total / ci_seconds:.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+# ============================================================
+# DAY08 – PER-TWEET EXPLANATION BENCHMARK
+# ============================================================
+#
+# Explains N synthetic "tweets" (random CSR rows shaped like TF-IDF output:
+# 20k features, ~12 non-zeros per row) with top_contributions, and compares
+# it with a per-row Python loop on a subset (results must be identical).
+# Reports tweets/sec and the tracemalloc peak (numpy allocations included).
+#
+# Usage:
+#   python day08/bench_explain.py                 # 1,000,000 tweets
+#   python day08/bench_explain.py -n 200000 -k 10
+
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+from scipy import sparse
+
+from explain import BATCH_ROWS, top_contributions
+
+
+# =========================
+# SYNTHETIC DATA
+# =========================
+def synthetic_tfidf(n_rows, n_features=20_000, mean_nnz=12, seed=0):
+    rng = np.random.default_rng(seed)
+    lengths = rng.poisson(mean_nnz, size=n_rows)
+    indptr = np.concatenate([[0], np.cumsum(lengths)])
+    # Zipf-like feature popularity, as in real text
+    indices = np.minimum(rng.zipf(1.3, size=indptr[-1]) - 1, n_features - 1).astype(np.int32)
+    data = rng.random(indptr[-1], dtype=np.float32)
+    X = sparse.csr_matrix((data, indices, indptr), shape=(n_rows, n_features))
+    X.sum_duplicates()
+    coef = rng.normal(0, 1, size=n_features)
+    return X, coef
+
+
+def loop_top_contributions(X, coef, k):
+    """Reference: one row at a time."""
+    out_idx = np.full((X.shape[0], k), -1, dtype=np.int32)
+    out_val = np.full((X.shape[0], k), np.nan, dtype=np.float32)
+    for i in range(X.shape[0]):
+        row = X.getrow(i)
+        contrib = row.data * coef[row.indices]
+        order = np.argsort(-contrib, kind="stable")[:k]
+        out_idx[i, :len(order)] = row.indices[order]
+        out_val[i, :len(order)] = contrib[order]
+    return out_idx, out_val
+
+
+# =========================
+# MAIN
+# =========================
+def main():
+    parser = argparse.ArgumentParser(description="top_contributions benchmark")
+    parser.add_argument("-n", type=int, default=1_000_000, help="number of tweets")
+    parser.add_argument("-k", type=int, default=5)
+    parser.add_argument("--batch-rows", type=int, default=BATCH_ROWS)
+    parser.add_argument("--loop-rows", type=int, default=20_000, help="rows for the per-row loop comparison")
+    args = parser.parse_args()
+
+    X, coef = synthetic_tfidf(args.n)
+    print(f"TWEETS: {args.n:,}  FEATURES: {X.shape[1]:,}  NON-ZEROS: {X.nnz:,}  K: {args.k}")
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    idx, vals = top_contributions(X, coef, k=args.k, batch_rows=args.batch_rows)
+    seconds = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"VECTORIZED  {seconds:>8.2f} s  {args.n / seconds:>12,.0f} tweets/s"
+          f"  peak {peak / 2**20:,.0f} MiB (output {(idx.nbytes + vals.nbytes) / 2**20:,.0f} MiB)")
+
+    m = min(args.loop_rows, args.n)
+    start = time.perf_counter()
+    ref_idx, ref_vals = loop_top_contributions(X[:m], coef, args.k)
+    loop_seconds = time.perf_counter() - start
+    print(f"PER-ROW LOOP {loop_seconds:>7.2f} s  {m / loop_seconds:>12,.0f} tweets/s  (first {m:,} rows)")
+
+    same = np.array_equal(idx[:m], ref_idx) and np.allclose(vals[:m], ref_vals, equal_nan=True)
+    print(f"SPEEDUP: x{(args.n / seconds) / (m / loop_seconds):.0f}  IDENTICAL: {same}")
+
+
+if __name__ == "__main__":
+    main()
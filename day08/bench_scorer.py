@@ -0,0 +1,136 @@
+# ============================================================
+# DAY08 – LOAD TEST (BENCHMARK) FOR THE TOXICITY SCORING SERVICE
+# ============================================================
+#
+# Starts N concurrent clients; each sends POST /score requests with a batch
+# of synthetic tweets until the duration is over. Reports request latency
+# percentiles (p50 / p90 / p99) and the overall tweets/sec.
+#
+# Usage:
+#   python day08/toxicity_scorer.py --port 8808 &
+#   python day08/bench_scorer.py --url http://127.0.0.1:8808 --clients 32 --batch 1 --duration 20
+#   python day08/bench_scorer.py --unix /tmp/toxicity.sock --clients 8 --batch 16
+
+import argparse
+import http.client
+import json
+import socket
+import threading
+import time
+from urllib.parse import urlparse
+
+from bench_clean_text import synthetic_tweets
+
+
+# =========================
+# CLIENT
+# =========================
+class UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, path, timeout=30):
+        super().__init__("localhost", timeout=timeout)
+        self.unix_path = path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.unix_path)
+
+
+def make_connection(url=None, unix_path=None):
+    if unix_path is not None:
+        return UnixHTTPConnection(unix_path)
+    parsed = urlparse(url)
+    return http.client.HTTPConnection(parsed.hostname, parsed.port or 80, timeout=30)
+
+
+def score_request(conn, tweets):
+    body = json.dumps({"tweets": tweets})
+    conn.request("POST", "/score", body=body, headers={"Content-Type": "application/json"})
+    response = conn.getresponse()
+    payload = response.read()
+    if response.status != 200:
+        raise RuntimeError(f"HTTP {response.status}: {payload[:200]!r}")
+    return json.loads(payload)["scores"]
+
+
+# =========================
+# LOAD TEST
+# =========================
+def percentile(sorted_values, p):
+    if not sorted_values:
+        return float("nan")
+    idx = min(len(sorted_values) - 1, int(round(p / 100 * (len(sorted_values) - 1))))
+    return sorted_values[idx]
+
+
+def run_load_test(url=None, unix_path=None, clients=16, batch=1, duration=10.0, seed=0):
+    """Returns a dict with requests, tweets, errors, seconds, tweets_per_sec and latency percentiles (ms)."""
+    tweets = synthetic_tweets(10_000, seed)
+    latencies = []
+    errors = []
+    lock = threading.Lock()
+    stop_at = time.perf_counter() + duration
+
+    def client(client_id):
+        conn = make_connection(url, unix_path)
+        local = []
+        i = client_id * batch
+        try:
+            while time.perf_counter() < stop_at:
+                payload = [tweets[(i + k) % len(tweets)] for k in range(batch)]
+                i += batch
+                start = time.perf_counter()
+                try:
+                    score_request(conn, payload)
+                except (OSError, RuntimeError, http.client.HTTPException) as e:
+                    with lock:
+                        errors.append(str(e))
+                    conn.close()
+                    conn = make_connection(url, unix_path)
+                    continue
+                local.append(time.perf_counter() - start)
+        finally:
+            conn.close()
+            with lock:
+                latencies.extend(local)
+
+    start = time.perf_counter()
+    threads = [threading.Thread(target=client, args=(c,)) for c in range(clients)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    seconds = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "tweets": len(latencies) * batch,
+        "errors": len(errors),
+        "seconds": seconds,
+        "tweets_per_sec": len(latencies) * batch / seconds,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p90_ms": percentile(latencies, 90) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test for toxicity_scorer.py")
+    parser.add_argument("--url", default="http://127.0.0.1:8808")
+    parser.add_argument("--unix", default=None, help="Unix socket path (instead of --url)")
+    parser.add_argument("--clients", type=int, default=16, help="concurrent connections")
+    parser.add_argument("--batch", type=int, default=1, help="tweets per request")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds")
+    args = parser.parse_args()
+
+    result = run_load_test(args.url, args.unix, args.clients, args.batch, args.duration)
+
+    print(f"CLIENTS: {args.clients}  TWEETS/REQUEST: {args.batch}  DURATION: {result['seconds']:.1f}s")
+    print(f"REQUESTS: {result['requests']:,}  ERRORS: {result['errors']:,}")
+    print(f"LATENCY p50 {result['p50_ms']:.2f} ms  p90 {result['p90_ms']:.2f} ms  p99 {result['p99_ms']:.2f} ms")
+    print(f"THROUGHPUT: {result['tweets_per_sec']:,.0f} tweets/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,203 +1,442 @@
 # ============================================================
 # DAY08 – TOXIC TWEETS ANALYSIS + INTERPRETABILITY
 # ============================================================
+#
+# THE PIPELINE IS SPLIT INTO STAGES (PLAIN FUNCTIONS, IMPORTABLE WITHOUT
+# SIDE EFFECTS):
+#   load -> clean -> split -> vectorize -> train -> evaluate -> visualize
+#
+# HEAVY DEPENDENCIES ARE ONLY IMPORTED BY THE STAGE THAT NEEDS THEM:
+#   kagglehub              : load (only on a cold cache)
+#   sklearn                : split / vectorize / train / evaluate
+#   wordcloud + matplotlib : visualize (word clouds: wordclouds.py)
+#
+# USAGE:
+#   python day08/day08.py                      # full run, figures shown in windows
+#   python day08/day08.py --headless           # figures saved to day08/figures/, never blocks
+#   python day08/day08.py --until evaluate     # metrics only (no plotting imports at all)
+#   python day08/day08.py --low-memory         # compact dtypes, float32 TF-IDF, frames dropped early
 
 # =========================
 # IMPORTS
 # =========================
+import time
+
+STARTED = time.perf_counter()
+
+import argparse
+import importlib.util
 import os
-import re
-import numpy as np
-import pandas as pd
-import kagglehub
+import sys
+import tracemalloc
 
-from sklearn.model_selection import train_test_split
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.linear_model import LogisticRegression
-from sklearn.metrics import (
-    classification_report,
-    confusion_matrix,
-    roc_auc_score,
-    roc_curve
-)
+try:
+    import resource
+except ImportError:  # NOT AVAILABLE ON WINDOWS
+    resource = None
 
-from wordcloud import WordCloud
-import matplotlib.pyplot as plt
+from text_cleaning import clean_series
 
 # =========================
-# 1) DOWNLOAD + LOAD DATA
+# CONFIG
 # =========================
 DATASET_REF = "umitka/twitter-toxic-tweets"
-DATASET_PATH = kagglehub.dataset_download(DATASET_REF)
-
 CSV_FILE = "twitter_toxic_tweets.csv"
-CSV_PATH = os.path.join(DATASET_PATH, CSV_FILE)
-
-print("DATASET PATH:", DATASET_PATH)
-print("FILES:", os.listdir(DATASET_PATH))
-
-DF = pd.read_csv(CSV_PATH)
-
-print("\nDF SHAPE:", DF.shape)
-print("DF COLUMNS:", list(DF.columns))
-print("\nDF HEAD:")
-print(DF.head())
 
 TEXT_COL = "tweet"
 LABEL_COL = "label"
+CLEAN_COL = "CLEAN_TWEET"
+
+# CLEAN_TEXT LIVES IN text_cleaning.py; clean_series GIVES THE SAME OUTPUT,
+# FASTER, AND SPLITS LARGE FRAMES ACROSS CPU CORES
+# BUMP THIS WHENEVER THE CLEANING CHANGES (INVALIDATES THE CACHED FRAME)
+CLEAN_VERSION = "1"
+
+STAGES = ["load", "clean", "split", "vectorize", "train", "evaluate", "visualize"]
+FIG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "figures")
 
-print("\nLABEL VALUE COUNTS:")
-print(DF[LABEL_COL].value_counts())
 
 # =========================
-# 2) TEXT CLEANING (PRIMARY + SECONDARY)
+# MEMORY HELPERS (LOW-MEMORY MODE + PER-STAGE REPORT)
 # =========================
-def CLEAN_TEXT(TEXT: str) -> str:
-    TEXT = str(TEXT).lower()
+def STRING_DTYPE():
+    # ARROW-BACKED STRINGS (ONE CONTIGUOUS BUFFER) WHEN pyarrow IS INSTALLED
+    return "string[pyarrow]" if importlib.util.find_spec("pyarrow") else "string"
 
-    # PRIMARY CLEANING
-    TEXT = re.sub(r"http\S+|www\.\S+", " ", TEXT)
-    TEXT = re.sub(r"@\w+", " ", TEXT)
-    TEXT = re.sub(r"#", " ", TEXT)
-    TEXT = re.sub(r"[^a-z\s']", " ", TEXT)
-    TEXT = re.sub(r"\s+", " ", TEXT).strip()
 
-    TOKENS = TEXT.split()
+def LOW_MEMORY_READ_OPTIONS():
+    # ONLY THE TWO COLUMNS WE USE, WITH EXPLICIT COMPACT DTYPES
+    return {
+        "usecols": [TEXT_COL, LABEL_COL],
+        "dtype": {TEXT_COL: STRING_DTYPE(), LABEL_COL: "int8"},
+    }
 
-    # REMOVE CONTRACTION ARTIFACTS
-    CONTRACTION_FRAGMENTS = {"ve", "ll", "re", "d", "m", "s", "amp"}
 
-    # TWITTER / GENERIC NOISE WORDS (EDIT THIS LIST FREELY)
-    NOISE_WORDS = {
-        "rt", "via", "retweet",
-        "listen", "watch", "look",
-        "will", "im", "dont", "cant",
-        "http", "https", "co"
-    }
+def PEAK_RSS_MB():
+    # PROCESS PEAK RSS SO FAR (LINUX REPORTS KiB, macOS BYTES)
+    if resource is None:
+        return None
+    PEAK = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return PEAK / 2**20 if sys.platform == "darwin" else PEAK / 2**10
+
+
+# =========================
+# 1) DOWNLOAD + LOAD DATA
+# =========================
+def LOAD_DATA(USE_CACHE=True, LOW_MEMORY=False):
+    READ_OPTIONS = LOW_MEMORY_READ_OPTIONS() if LOW_MEMORY else None
+
+    if USE_CACHE:
+        # FIRST RUN: kagglehub DOWNLOAD + read_csv + CLEANING, SAVED UNDER day08/.cache
+        # LATER RUNS: LOADED FROM THE CACHE (NO PARSING, NO CLEANING, WORKS OFFLINE)
+        from tweet_cache import load_clean_tweets
+
+        DF = load_clean_tweets(
+            DATASET_REF,
+            CSV_FILE,
+            TEXT_COL,
+            clean_series=clean_series,
+            clean_version=CLEAN_VERSION,
+            clean_col=CLEAN_COL,
+            read_options=READ_OPTIONS,
+            string_dtype=STRING_DTYPE() if LOW_MEMORY else None
+        )
+    else:
+        import kagglehub
+        import pandas as pd
+
+        DATASET_PATH = kagglehub.dataset_download(DATASET_REF)
+        print("DATASET PATH:", DATASET_PATH)
+        print("FILES:", os.listdir(DATASET_PATH))
+        DF = pd.read_csv(os.path.join(DATASET_PATH, CSV_FILE), **(READ_OPTIONS or {}))
+
+    print("\nDF SHAPE:", DF.shape)
+    print("DF COLUMNS:", list(DF.columns))
+    print("\nDF HEAD:")
+    print(DF.head())
+
+    print("\nLABEL VALUE COUNTS:")
+    print(DF[LABEL_COL].value_counts())
+    return DF
 
-    CLEAN_TOKENS = [
-        T for T in TOKENS
-        if T not in CONTRACTION_FRAGMENTS
-        and T not in NOISE_WORDS
-    ]
 
-    return " ".join(CLEAN_TOKENS)
+# =========================
+# 2) TEXT CLEANING (PRIMARY + SECONDARY)
+# =========================
+def CLEAN_DATA(DF, LOW_MEMORY=False):
+    # CREATE CLEAN COLUMN (CRITICAL – BEFORE ANY USE); ALREADY THERE WHEN LOADED FROM THE CACHE
+    if CLEAN_COL not in DF.columns:
+        DF[CLEAN_COL] = clean_series(DF[TEXT_COL])
+        if LOW_MEMORY:
+            DF[CLEAN_COL] = DF[CLEAN_COL].astype(STRING_DTYPE())
 
-# CREATE CLEAN COLUMN (CRITICAL – BEFORE ANY USE)
-DF["CLEAN_TWEET"] = DF[TEXT_COL].apply(CLEAN_TEXT)
+    print("\nTEXT CLEANING EXAMPLE:")
+    print("RAW  :", DF[TEXT_COL].iloc[0])
+    print("CLEAN:", DF[CLEAN_COL].iloc[0])
+    return DF
 
-print("\nTEXT CLEANING EXAMPLE:")
-print("RAW  :", DF[TEXT_COL].iloc[0])
-print("CLEAN:", DF["CLEAN_TWEET"].iloc[0])
 
 # =========================
 # 3) TRAIN / TEST SPLIT
 # =========================
-X = DF["CLEAN_TWEET"]
-Y = DF[LABEL_COL]
+def SPLIT_DATA(DF):
+    from sklearn.model_selection import train_test_split
 
-X_TRAIN, X_TEST, Y_TRAIN, Y_TEST = train_test_split(
-    X,
-    Y,
-    test_size=0.2,
-    random_state=42,
-    stratify=Y
-)
+    X = DF[CLEAN_COL]
+    Y = DF[LABEL_COL]
+
+    X_TRAIN, X_TEST, Y_TRAIN, Y_TEST = train_test_split(
+        X,
+        Y,
+        test_size=0.2,
+        random_state=42,
+        stratify=Y
+    )
+
+    print("\nTRAIN SIZE:", X_TRAIN.shape)
+    print("TEST SIZE :", X_TEST.shape)
+    return X_TRAIN, X_TEST, Y_TRAIN, Y_TEST
 
-print("\nTRAIN SIZE:", X_TRAIN.shape)
-print("TEST SIZE :", X_TEST.shape)
 
 # =========================
 # 4) TF-IDF VECTORIZATION
 # =========================
-VECTORIZER = TfidfVectorizer(
-    max_features=20000,
-    ngram_range=(1, 2),
-    stop_words="english"
-)
+def VECTORIZE(X_TRAIN, X_TEST, LOW_MEMORY=False):
+    import numpy as np
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
+    VECTORIZER = TfidfVectorizer(
+        max_features=20000,
+        ngram_range=(1, 2),
+        stop_words="english",
+        # float32 CSR: HALF THE MEMORY FOR THE TRAIN + TEST MATRICES
+        dtype=np.float32 if LOW_MEMORY else np.float64
+    )
+
+    X_TRAIN_VEC = VECTORIZER.fit_transform(X_TRAIN)
+    X_TEST_VEC = VECTORIZER.transform(X_TEST)
+
+    print("VECTORIZED TRAIN SHAPE:", X_TRAIN_VEC.shape)
+    print(f"TF-IDF MATRICES: {(SPARSE_MB(X_TRAIN_VEC) + SPARSE_MB(X_TEST_VEC)):.1f} MiB ({X_TRAIN_VEC.dtype})")
+    return VECTORIZER, X_TRAIN_VEC, X_TEST_VEC
 
-X_TRAIN_VEC = VECTORIZER.fit_transform(X_TRAIN)
-X_TEST_VEC = VECTORIZER.transform(X_TEST)
 
-print("VECTORIZED TRAIN SHAPE:", X_TRAIN_VEC.shape)
+def SPARSE_MB(X):
+    return (X.data.nbytes + X.indices.nbytes + X.indptr.nbytes) / 2**20
+
 
 # =========================
 # 5) BASE MODEL
 # =========================
-MODEL = LogisticRegression(max_iter=1000)
-MODEL.fit(X_TRAIN_VEC, Y_TRAIN)
-
-Y_PRED = MODEL.predict(X_TEST_VEC)
-Y_PROBA = MODEL.predict_proba(X_TEST_VEC)[:, 1]
-
-print("\nCONFUSION MATRIX:")
-print(confusion_matrix(Y_TEST, Y_PRED))
+def TRAIN_MODEL(X_TRAIN_VEC, Y_TRAIN):
+    from sklearn.linear_model import LogisticRegression
 
-print("\nCLASSIFICATION REPORT:")
-print(classification_report(Y_TEST, Y_PRED, digits=3))
+    MODEL = LogisticRegression(max_iter=1000)
+    MODEL.fit(X_TRAIN_VEC, Y_TRAIN)
+    return MODEL
 
-print("ROC-AUC:", roc_auc_score(Y_TEST, Y_PROBA))
 
 # =========================
-# 6) GLOBAL FEATURE IMPORTANCE
+# 6) EVALUATION + GLOBAL FEATURE IMPORTANCE
 # =========================
-FEATURE_NAMES = VECTORIZER.get_feature_names_out()
-COEFS = MODEL.coef_[0]
+def EVALUATE_MODEL(MODEL, VECTORIZER, X_TEST_VEC, Y_TEST, X_TEST=None):
+    import numpy as np
+    from sklearn.metrics import classification_report, confusion_matrix, roc_auc_score
 
-SORTED_IDX = np.argsort(COEFS)
+    Y_PRED = MODEL.predict(X_TEST_VEC)
+    Y_PROBA = MODEL.predict_proba(X_TEST_VEC)[:, 1]
 
-TOP_TOXIC = SORTED_IDX[-20:][::-1]
-TOP_NON_TOXIC = SORTED_IDX[:20]
+    print("\nCONFUSION MATRIX:")
+    print(confusion_matrix(Y_TEST, Y_PRED))
 
-print("\nTOP WORDS PUSHING TOXIC:")
-for IDX in TOP_TOXIC:
-    print(f"{FEATURE_NAMES[IDX]:<25} {COEFS[IDX]:.3f}")
+    print("\nCLASSIFICATION REPORT:")
+    print(classification_report(Y_TEST, Y_PRED, digits=3))
 
-print("\nTOP WORDS PUSHING NON-TOXIC:")
-for IDX in TOP_NON_TOXIC:
-    print(f"{FEATURE_NAMES[IDX]:<25} {COEFS[IDX]:.3f}")
+    ROC_AUC = roc_auc_score(Y_TEST, Y_PROBA)
+    print("ROC-AUC:", ROC_AUC)
 
-# =========================
-# 7) WORD CLOUDS
-# =========================
-NON_TOXIC_TEXT = " ".join(DF[DF[LABEL_COL] == 0]["CLEAN_TWEET"])
-TOXIC_TEXT = " ".join(DF[DF[LABEL_COL] == 1]["CLEAN_TWEET"])
+    # BEST-F1 THRESHOLD (ALL THRESHOLDS AT ONCE) + BOOTSTRAP 95% CI FOR ROC-AUC
+    from evaluation import best_threshold, bootstrap_auc_ci, threshold_sweep
 
-WC_NON = WordCloud(
-    width=800,
-    height=400,
-    background_color="white",
-    max_words=200
-).generate(NON_TOXIC_TEXT)
+    BEST = best_threshold(threshold_sweep(Y_TEST, Y_PROBA))
+    print(
+        f"BEST-F1 THRESHOLD: {BEST['thresholds']:.3f}"
+        f"  (PRECISION {BEST['precision']:.3f}, RECALL {BEST['recall']:.3f}, F1 {BEST['f1']:.3f})"
+    )
+    CI = bootstrap_auc_ci(Y_TEST, Y_PROBA)
+    print(f"ROC-AUC 95% CI: [{CI['low']:.3f}, {CI['high']:.3f}]  ({CI['n_boot']} BOOTSTRAP RESAMPLES)")
 
-WC_TOX = WordCloud(
-    width=800,
-    height=400,
-    background_color="white",
-    max_words=200
-).generate(TOXIC_TEXT)
+    FEATURE_NAMES = VECTORIZER.get_feature_names_out()
+    COEFS = MODEL.coef_[0]
 
-plt.figure()
-plt.imshow(WC_NON)
-plt.axis("off")
-plt.title("Word Cloud – Non-toxic Tweets")
-plt.show()
+    SORTED_IDX = np.argsort(COEFS)
+
+    TOP_TOXIC = SORTED_IDX[-20:][::-1]
+    TOP_NON_TOXIC = SORTED_IDX[:20]
+
+    print("\nTOP WORDS PUSHING TOXIC:")
+    for IDX in TOP_TOXIC:
+        print(f"{FEATURE_NAMES[IDX]:<25} {COEFS[IDX]:.3f}")
+
+    print("\nTOP WORDS PUSHING NON-TOXIC:")
+    for IDX in TOP_NON_TOXIC:
+        print(f"{FEATURE_NAMES[IDX]:<25} {COEFS[IDX]:.3f}")
+
+    # PER-TWEET EXPLANATIONS: TOP N-GRAMS BEHIND THE 5 MOST TOXIC TEST PREDICTIONS
+    if X_TEST is not None:
+        from explain import format_explanations, top_contributions
+
+        ROWS = np.argsort(Y_PROBA)[-5:][::-1]
+        TOP_IDX, TOP_VALS = top_contributions(X_TEST_VEC[ROWS], COEFS, k=5)
+        EXPLANATIONS = format_explanations(TOP_IDX, TOP_VALS, FEATURE_NAMES)
+
+        print("\nMOST TOXIC TEST TWEETS, EXPLAINED:")
+        for ROW, REASONS in zip(ROWS, EXPLANATIONS):
+            print(f"{Y_PROBA[ROW]:.3f}  {X_TEST.iloc[ROW]}")
+            print("       " + ", ".join(f"{NGRAM} ({VALUE:+.2f})" for NGRAM, VALUE in REASONS))
+
+    return Y_PROBA, ROC_AUC
 
-plt.figure()
-plt.imshow(WC_TOX)
-plt.axis("off")
-plt.title("Word Cloud – Toxic Tweets")
-plt.show()
 
 # =========================
-# 8) ROC CURVE
+# 7) WORD CLOUDS + ROC CURVE
 # =========================
-FPR, TPR, _ = roc_curve(Y_TEST, Y_PROBA)
+def VISUALIZE(DF, Y_TEST, Y_PROBA, HEADLESS=False, FIG_DIR=FIG_DIR):
+    import matplotlib
+
+    if HEADLESS:
+        matplotlib.use("Agg")  # NO WINDOWS, NEVER BLOCKS
+
+    import matplotlib.pyplot as plt
+    from sklearn.metrics import roc_curve
+
+    from wordclouds import class_term_frequencies, render_wordclouds
+
+    def SHOW_OR_SAVE(NAME):
+        if HEADLESS:
+            os.makedirs(FIG_DIR, exist_ok=True)
+            PATH = os.path.join(FIG_DIR, NAME)
+            plt.savefig(PATH, dpi=120, bbox_inches="tight")
+            plt.close()
+            print("SAVED FIGURE:", PATH)
+        else:
+            plt.show()
+
+    # TERM COUNTS PER LABEL FROM ONE SPARSE COUNT MATRIX (NO GIANT JOINED STRINGS),
+    # BOTH CLOUDS RENDERED IN PARALLEL STRAIGHT TO PNG FILES
+    FREQS = class_term_frequencies(DF[CLEAN_COL], DF[LABEL_COL].to_numpy(), max_words=200)
+    CLOUDS = render_wordclouds(
+        {
+            "wordcloud_non_toxic.png": FREQS.get(0, {}),
+            "wordcloud_toxic.png": FREQS.get(1, {}),
+        },
+        FIG_DIR
+    )
+    for NAME, PATH in CLOUDS.items():
+        print("SAVED WORD CLOUD:", PATH)
+
+    if not HEADLESS:
+        for NAME, TITLE in [
+            ("wordcloud_non_toxic.png", "Word Cloud – Non-toxic Tweets"),
+            ("wordcloud_toxic.png", "Word Cloud – Toxic Tweets"),
+        ]:
+            plt.figure()
+            plt.imshow(plt.imread(CLOUDS[NAME]))
+            plt.axis("off")
+            plt.title(TITLE)
+            plt.show()
+
+    # ROC CURVE
+    FPR, TPR, _ = roc_curve(Y_TEST, Y_PROBA)
+
+    plt.figure()
+    plt.plot(FPR, TPR)
+    plt.plot([0, 1], [0, 1], linestyle="--")
+    plt.xlabel("False Positive Rate")
+    plt.ylabel("True Positive Rate")
+    plt.title("ROC Curve")
+    SHOW_OR_SAVE("roc_curve.png")
+
 
-plt.figure()
-plt.plot(FPR, TPR)
-plt.plot([0, 1], [0, 1], linestyle="--")
-plt.xlabel("False Positive Rate")
-plt.ylabel("True Positive Rate")
-plt.title("ROC Curve")
-plt.show()
+# =========================
+# PIPELINE
+# =========================
+def RUN_PIPELINE(UNTIL="visualize", HEADLESS=False, FIG_DIR=FIG_DIR, USE_CACHE=True, SAVE_MODEL=True,
+                 LOW_MEMORY=False, TRACE_MEMORY=False):
+    """
+    RUNS THE STAGES IN ORDER, UP TO AND INCLUDING `UNTIL`.
+    RETURNS A DICT WITH EVERYTHING PRODUCED (DF, VECTORIZER, MODEL, Y_PROBA, ...),
+    "TIMINGS" (SECONDS PER STAGE) AND "MEMORY" (PEAK MiB PER STAGE).
+
+    LOW_MEMORY: ONLY THE NEEDED COLUMNS, int8 LABELS, ARROW STRINGS, float32 TF-IDF,
+                INTERMEDIATE FRAMES / TEXTS DROPPED AS SOON AS NO LATER STAGE NEEDS THEM
+    TRACE_MEMORY: ALSO TRACK EACH STAGE'S OWN PEAK WITH tracemalloc (PYTHON + NUMPY
+                  ALLOCATIONS; SLOWER)
+    """
+    LAST = STAGES.index(UNTIL)
+    RESULT = {"TIMINGS": {}, "MEMORY": {}}
+
+    def RUNS(STAGE):
+        return STAGES.index(STAGE) <= LAST
+
+    def TIMED(STAGE, FN, *ARGS, **KWARGS):
+        if TRACE_MEMORY:
+            tracemalloc.reset_peak()
+        T0 = time.perf_counter()
+        OUT = FN(*ARGS, **KWARGS)
+        RESULT["TIMINGS"][STAGE] = time.perf_counter() - T0
+        RESULT["MEMORY"][STAGE] = {
+            "stage_peak_mb": tracemalloc.get_traced_memory()[1] / 2**20 if TRACE_MEMORY else None,
+            "peak_rss_mb": PEAK_RSS_MB(),
+        }
+        return OUT
+
+    if TRACE_MEMORY:
+        tracemalloc.start()
+    try:
+        RESULT["DF"] = TIMED("load", LOAD_DATA, USE_CACHE, LOW_MEMORY)
+        if RUNS("clean"):
+            RESULT["DF"] = TIMED("clean", CLEAN_DATA, RESULT["DF"], LOW_MEMORY)
+        if RUNS("split"):
+            X_TRAIN, X_TEST, Y_TRAIN, Y_TEST = TIMED("split", SPLIT_DATA, RESULT["DF"])
+            TRAIN_ROWS = int(X_TRAIN.shape[0])
+            RESULT.update(X_TRAIN=X_TRAIN, X_TEST=X_TEST, Y_TRAIN=Y_TRAIN, Y_TEST=Y_TEST)
+
+            if LOW_MEMORY:
+                if RUNS("visualize"):
+                    # THE WORD CLOUDS ONLY NEED THE CLEAN TEXT + LABEL
+                    RESULT["DF"] = RESULT["DF"][[CLEAN_COL, LABEL_COL]]
+                else:
+                    del RESULT["DF"]
+        if RUNS("vectorize"):
+            VECTORIZER, X_TRAIN_VEC, X_TEST_VEC = TIMED("vectorize", VECTORIZE, X_TRAIN, X_TEST, LOW_MEMORY)
+            RESULT.update(VECTORIZER=VECTORIZER, X_TRAIN_VEC=X_TRAIN_VEC, X_TEST_VEC=X_TEST_VEC)
+
+            if LOW_MEMORY:
+                # THE TRAIN TEXTS ARE NOT NEEDED ONCE VECTORIZED
+                del X_TRAIN, RESULT["X_TRAIN"]
+        if RUNS("train"):
+            RESULT["MODEL"] = TIMED("train", TRAIN_MODEL, X_TRAIN_VEC, Y_TRAIN)
+
+            if LOW_MEMORY:
+                del X_TRAIN_VEC, RESULT["X_TRAIN_VEC"]
+        if RUNS("evaluate"):
+            Y_PROBA, ROC_AUC = TIMED("evaluate", EVALUATE_MODEL, RESULT["MODEL"], VECTORIZER, X_TEST_VEC, Y_TEST, X_TEST)
+            RESULT.update(Y_PROBA=Y_PROBA, ROC_AUC=ROC_AUC)
+
+            if SAVE_MODEL:
+                # SAVE VECTORIZER + MODEL AS A NEW VERSIONED ARTIFACT (USED BY toxicity_scorer.py)
+                from model_artifact import save_artifact
+
+                RESULT["ARTIFACT_DIR"] = save_artifact(
+                    VECTORIZER,
+                    RESULT["MODEL"],
+                    metadata={"clean_version": CLEAN_VERSION, "roc_auc": float(ROC_AUC), "train_rows": TRAIN_ROWS}
+                )
+                print("SAVED MODEL ARTIFACT:", RESULT["ARTIFACT_DIR"])
+        if RUNS("visualize"):
+            TIMED("visualize", VISUALIZE, RESULT["DF"], Y_TEST, Y_PROBA, HEADLESS, FIG_DIR)
+    finally:
+        if TRACE_MEMORY:
+            tracemalloc.stop()
+
+    return RESULT
+
+
+def MAIN(ARGV=None):
+    PARSER = argparse.ArgumentParser(description="Day08 toxic tweets pipeline")
+    PARSER.add_argument("--until", choices=STAGES, default="visualize", help="last stage to run")
+    PARSER.add_argument("--headless", action="store_true", help="save figures to --fig-dir instead of showing them")
+    PARSER.add_argument("--fig-dir", default=FIG_DIR)
+    PARSER.add_argument("--no-cache", action="store_true", help="always download, parse and clean the CSV")
+    PARSER.add_argument("--no-save-model", action="store_true", help="don't write a model artifact")
+    PARSER.add_argument("--low-memory", action="store_true",
+                        help="needed columns only, int8 labels, Arrow strings, float32 TF-IDF, drop frames early")
+    PARSER.add_argument("--trace-memory", action="store_true", help="per-stage peak with tracemalloc (slower)")
+    ARGS = PARSER.parse_args(ARGV)
+
+    # TIME FROM THE FIRST LINE OF THIS MODULE TO HERE (IMPORTS + CLI PARSING)
+    print(f"STARTUP: {(time.perf_counter() - STARTED) * 1000:.1f} ms")
+
+    RESULT = RUN_PIPELINE(
+        UNTIL=ARGS.until,
+        HEADLESS=ARGS.headless,
+        FIG_DIR=ARGS.fig_dir,
+        USE_CACHE=not ARGS.no_cache,
+        SAVE_MODEL=not ARGS.no_save_model,
+        LOW_MEMORY=ARGS.low_memory,
+        TRACE_MEMORY=ARGS.trace_memory
+    )
+
+    print("\nSTAGE TIMINGS + MEMORY:")
+    print(f"{'STAGE':<10} {'SECONDS':>9} {'STAGE PEAK':>12} {'PEAK RSS':>12}")
+    for STAGE, SECONDS in RESULT["TIMINGS"].items():
+        MEM = RESULT["MEMORY"][STAGE]
+        STAGE_PEAK = f"{MEM['stage_peak_mb']:.0f} MiB" if MEM["stage_peak_mb"] is not None else "-"
+        RSS = f"{MEM['peak_rss_mb']:.0f} MiB" if MEM["peak_rss_mb"] is not None else "-"
+        print(f"{STAGE:<10} {SECONDS:>9.2f} {STAGE_PEAK:>12} {RSS:>12}")
+    return RESULT
+
+
+if __name__ == "__main__":
+    MAIN()
@@ -0,0 +1,168 @@
+# ============================================================
+# DAY08 – EVALUATION: THRESHOLD SWEEP + BOOTSTRAP ROC-AUC CI
+# ============================================================
+#
+# threshold_sweep  : precision / recall / F1 at EVERY distinct threshold, from
+#                    one sort of the scores + cumulative sums (no loop over
+#                    thresholds)
+# bootstrap_auc_ci : ROC-AUC with a stratified bootstrap confidence interval,
+#                    all resamples computed at once as arrays (no refits,
+#                    no Python loop over resamples)
+#
+# How the bootstrap stays fast for 1M predictions:
+#   the scores are sorted once and grouped into ordered bins (one bin per
+#   distinct score when there are few, else ~N_BINS rank bins). Drawing n
+#   indices with replacement and counting them per bin is the same as drawing
+#   the bin counts from a multinomial, so every resample is one row of a
+#   (n_boot x bins) count array, and its AUC is a cumulative sum over bins.
+#   With rank bins, scores that share a bin count as ties; the error is at
+#   most half the share of (positive, negative) pairs that land in one bin.
+#
+# Usage:
+#   SWEEP = threshold_sweep(Y_TEST, Y_PROBA); best_threshold(SWEEP)
+#   bootstrap_auc_ci(Y_TEST, Y_PROBA, n_boot=1000)
+
+import numpy as np
+
+# =========================
+# CONFIG
+# =========================
+N_BOOT = 1000
+ALPHA = 0.05
+N_BINS = 2000
+
+
+# =========================
+# HELPERS
+# =========================
+def _as_arrays(y_true, y_score):
+    y = np.asarray(y_true).astype(bool).ravel()
+    s = np.asarray(y_score, dtype=np.float64).ravel()
+    if y.shape != s.shape:
+        raise ValueError(f"y_true and y_score have different lengths: {y.size} != {s.size}")
+    if y.all() or not y.any():
+        raise ValueError("need both positive and negative labels")
+    return y, s
+
+
+def histogram_auc(pos_hist, neg_hist):
+    """ROC-AUC from per-bin counts of ordered score bins (ties inside a bin count half)."""
+    pos_hist = np.asarray(pos_hist, dtype=np.float64)
+    neg_hist = np.asarray(neg_hist, dtype=np.float64)
+    n_pos, n_neg = pos_hist.sum(), neg_hist.sum()
+    if n_pos == 0 or n_neg == 0:
+        return float("nan")
+    neg_below = np.cumsum(neg_hist) - neg_hist
+    return float((pos_hist * (neg_below + 0.5 * neg_hist)).sum() / (n_pos * n_neg))
+
+
+def _tie_groups(y, s):
+    """Sorts by score once; returns (labels sorted, group start flags, group id per element)."""
+    order = np.argsort(s, kind="mergesort")
+    s_sorted = s[order]
+    new_group = np.empty(s_sorted.size, dtype=bool)
+    new_group[0] = True
+    np.not_equal(s_sorted[1:], s_sorted[:-1], out=new_group[1:])
+    return y[order], new_group, np.cumsum(new_group) - 1
+
+
+def _bin_counts(y_sorted, bins, n_out):
+    return np.bincount(bins[y_sorted], minlength=n_out), np.bincount(bins[~y_sorted], minlength=n_out)
+
+
+def _binned(y_sorted, new_group, group, n_bins):
+    n_groups = int(group[-1]) + 1
+    if n_groups <= n_bins:
+        return _bin_counts(y_sorted, group, n_groups) + (True,)
+    # rank bins; a tie group always lands in the bin of its first element
+    group_start = np.flatnonzero(new_group)[group]
+    return _bin_counts(y_sorted, group_start * n_bins // y_sorted.size, n_bins) + (False,)
+
+
+def score_bins(y_true, y_score, n_bins=N_BINS):
+    """
+    Returns (pos_hist, neg_hist, exact): label counts per ordered score bin.
+    exact=True when every bin is one distinct score.
+    """
+    y, s = _as_arrays(y_true, y_score)
+    return _binned(*_tie_groups(y, s), n_bins)
+
+
+def roc_auc(y_true, y_score):
+    """Exact ROC-AUC (ties count half), from one sort."""
+    y, s = _as_arrays(y_true, y_score)
+    y_sorted, _, group = _tie_groups(y, s)
+    return histogram_auc(*_bin_counts(y_sorted, group, int(group[-1]) + 1))
+
+
+# =========================
+# THRESHOLD SWEEP
+# =========================
+def threshold_sweep(y_true, y_score):
+    """
+    Metrics for "predict toxic if score >= threshold" at every distinct score,
+    highest threshold first. Returns a dict of equal-length arrays:
+    thresholds, tp, fp, precision, recall, f1.
+    """
+    y, s = _as_arrays(y_true, y_score)
+    order = np.argsort(-s, kind="mergesort")
+    s_sorted = s[order]
+    tp_cum = np.cumsum(y[order])
+
+    # last position of every group of equal scores
+    last = np.r_[np.flatnonzero(s_sorted[1:] != s_sorted[:-1]), s_sorted.size - 1]
+    tp = tp_cum[last]
+    fp = last + 1 - tp
+    n_pos = tp_cum[-1]
+
+    return {
+        "thresholds": s_sorted[last],
+        "tp": tp,
+        "fp": fp,
+        "precision": tp / (tp + fp),
+        "recall": tp / n_pos,
+        "f1": 2 * tp / (tp + fp + n_pos),
+    }
+
+
+def best_threshold(sweep, metric="f1"):
+    """The sweep row (as a dict of floats) with the highest `metric`."""
+    i = int(np.argmax(sweep[metric]))
+    return {name: float(values[i]) for name, values in sweep.items()}
+
+
+# =========================
+# BOOTSTRAP CI
+# =========================
+def bootstrap_auc_ci(y_true, y_score, n_boot=N_BOOT, alpha=ALPHA, n_bins=N_BINS, seed=0):
+    """
+    ROC-AUC and its (1 - alpha) percentile confidence interval from n_boot
+    stratified bootstrap resamples (positives and negatives resampled
+    separately, so every resample has both classes).
+
+    Returns {"auc", "low", "high", "n_boot", "bins", "exact_bins"}.
+    """
+    y, s = _as_arrays(y_true, y_score)
+    y_sorted, new_group, group = _tie_groups(y, s)
+    pos_hist, neg_hist, exact = _binned(y_sorted, new_group, group, n_bins)
+    n_pos, n_neg = int(pos_hist.sum()), int(neg_hist.sum())
+
+    # the point estimate is always exact (one bin per distinct score)
+    auc = histogram_auc(*_bin_counts(y_sorted, group, int(group[-1]) + 1))
+
+    rng = np.random.default_rng(seed)
+    pos_boot = rng.multinomial(n_pos, pos_hist / n_pos, size=n_boot).astype(np.float64)
+    neg_boot = rng.multinomial(n_neg, neg_hist / n_neg, size=n_boot).astype(np.float64)
+
+    neg_below = np.cumsum(neg_boot, axis=1) - neg_boot
+    aucs = (pos_boot * (neg_below + 0.5 * neg_boot)).sum(axis=1) / (n_pos * n_neg)
+
+    low, high = np.quantile(aucs, [alpha / 2, 1 - alpha / 2])
+    return {
+        "auc": auc,
+        "low": float(low),
+        "high": float(high),
+        "n_boot": n_boot,
+        "bins": int(pos_hist.size),
+        "exact_bins": exact,
+    }
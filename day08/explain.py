@@ -0,0 +1,105 @@
+# ============================================================
+# DAY08 – PER-TWEET EXPLANATIONS (TOP CONTRIBUTING N-GRAMS)
+# ============================================================
+#
+# For a linear model, the contribution of n-gram j to a tweet's score is
+# X[i, j] * coef[j]. top_contributions() finds the k largest contributions of
+# every row of a CSR matrix without per-row Python loops:
+#   1) elementwise product of the CSR values with coef[indices]
+#   2) rows are scattered into a padded (rows x longest row) block
+#   3) np.argpartition picks the top k per row, then only those k are sorted
+# Rows are processed in batches, so memory is bounded by
+# batch_rows x (longest row in the batch), not by the number of tweets.
+#
+# Usage:
+#   IDX, VALS = top_contributions(X_TEST_VEC, MODEL.coef_[0], k=5)
+#   format_explanations(IDX[:3], VALS[:3], VECTORIZER.get_feature_names_out())
+
+import numpy as np
+from scipy import sparse
+
+# =========================
+# CONFIG
+# =========================
+TOP_K = 5
+BATCH_ROWS = 100_000
+DIRECTIONS = ("toxic", "non_toxic", "abs")
+
+
+# =========================
+# CORE
+# =========================
+def top_contributions(X, coef, k=TOP_K, direction="toxic", batch_rows=BATCH_ROWS):
+    """
+    X: (tweets x features) sparse matrix, coef: (features,) model weights.
+    direction: "toxic" (largest X*coef first), "non_toxic" (most negative
+    first) or "abs" (largest magnitude first).
+
+    Returns (feature indices, contributions), both (tweets x k), best first.
+    Rows with fewer than k non-zero features are padded with -1 / nan.
+    """
+    if direction not in DIRECTIONS:
+        raise ValueError(f"direction must be one of {DIRECTIONS}, got {direction!r}")
+
+    X = sparse.csr_matrix(X)
+    coef = np.asarray(coef, dtype=np.float64).ravel()
+    n_rows = X.shape[0]
+
+    out_idx = np.full((n_rows, k), -1, dtype=np.int32)
+    out_val = np.full((n_rows, k), np.nan, dtype=np.float32)
+
+    for start in range(0, n_rows, batch_rows):
+        stop = min(start + batch_rows, n_rows)
+        indptr = X.indptr[start:stop + 1]
+        lo, hi = indptr[0], indptr[-1]
+        if hi == lo:
+            continue  # no features in this batch
+
+        cols = X.indices[lo:hi]
+        contrib = X.data[lo:hi] * coef[cols]
+        if direction == "toxic":
+            key = contrib
+        elif direction == "non_toxic":
+            key = -contrib
+        else:
+            key = np.abs(contrib)
+
+        # scatter row i's entries into padded[i, 0:len_i]
+        row_start = indptr[:-1] - lo
+        lengths = np.diff(indptr)
+        width = int(lengths.max())
+        rows = stop - start
+        row_ids = np.repeat(np.arange(rows), lengths)
+        pos = np.arange(hi - lo) - np.repeat(row_start, lengths)
+
+        padded = np.full((rows, width), -np.inf)
+        padded[row_ids, pos] = key
+
+        kk = min(k, width)
+        top = np.argpartition(-padded, kk - 1, axis=1)[:, :kk]
+        top_keys = np.take_along_axis(padded, top, axis=1)
+        order = np.argsort(-top_keys, axis=1, kind="stable")
+        top = np.take_along_axis(top, order, axis=1)
+        valid = np.isfinite(np.take_along_axis(top_keys, order, axis=1))
+
+        flat = np.where(valid, row_start[:, None] + top, 0)
+        out_idx[start:stop, :kk] = np.where(valid, cols[flat], -1)
+        out_val[start:stop, :kk] = np.where(valid, contrib[flat], np.nan)
+
+    return out_idx, out_val
+
+
+# =========================
+# HELPERS
+# =========================
+def explain_texts(texts, vectorizer, model, k=TOP_K, direction="toxic"):
+    """Vectorizes `texts` (already cleaned) and returns top_contributions for them."""
+    return top_contributions(vectorizer.transform(texts), model.coef_[0], k=k, direction=direction)
+
+
+def format_explanations(idx, vals, feature_names):
+    """[(n-gram, contribution), ...] per row, for printing a handful of rows."""
+    return [
+        [(str(feature_names[j]), float(v)) for j, v in zip(row_idx, row_val) if j >= 0]
+        for row_idx, row_val in zip(idx, vals)
+    ]
@@ -0,0 +1,256 @@
+# ============================================================
+# DAY08 – CROSS-VALIDATED HYPERPARAMETER SEARCH (CACHED TF-IDF FOLDS)
+# ============================================================
+#
+# Tunes the TfidfVectorizer + LogisticRegression settings that day08.py
+# hardcodes, with stratified K-fold CV on the training split.
+#
+#   1) For every (fold, vectorizer config) the vectorizer is fitted ONCE and
+#      the train / validation matrices are saved to disk (.npz). The cache is
+#      keyed by a hash of the texts + labels + folds, so re-runs (or a bigger
+#      model grid) never re-vectorize.
+#   2) Every trial (vectorizer config x model params) loads the cached
+#      matrices and fits the model on each fold. Trials run in parallel.
+#   3) Trials are ranked by mean validation ROC-AUC, with per-trial timing.
+#
+# Usage:
+#   python day08/hparam_search.py --folds 5 --workers 8
+#   python day08/hparam_search.py --sample 20000 --out day08/hparam_results.csv
+
+import argparse
+import csv
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from scipy import sparse
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import f1_score, roc_auc_score
+from sklearn.model_selection import StratifiedKFold
+
+# =========================
+# CONFIG
+# =========================
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "tfidf_folds")
+RESULTS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "hparam_results.csv")
+
+VECTORIZER_GRID = [
+    {"max_features": 20000, "ngram_range": [1, 2]},   # day08.py default
+    {"max_features": 50000, "ngram_range": [1, 2]},
+    {"max_features": 20000, "ngram_range": [1, 1]},
+    {"max_features": 100000, "ngram_range": [1, 3]},
+]
+MODEL_GRID = [
+    {"C": C, "class_weight": class_weight}
+    for C in (0.25, 1.0, 4.0, 16.0)
+    for class_weight in (None, "balanced")
+]
+
+N_FOLDS = 5
+SEED = 42
+
+
+# =========================
+# CACHE KEYS
+# =========================
+def _params_key(params):
+    return hashlib.sha256(json.dumps(params, sort_keys=True).encode("utf-8")).hexdigest()[:12]
+
+
+def data_key(texts, labels, n_folds, seed):
+    digest = hashlib.sha256()
+    for text in texts:
+        digest.update(text.encode("utf-8"))
+        digest.update(b"\0")
+    digest.update(np.asarray(labels, dtype=np.int8).tobytes())
+    digest.update(f"{n_folds}:{seed}".encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def fold_paths(cache_dir, dkey, vec_params, fold):
+    base = os.path.join(cache_dir, dkey, _params_key(vec_params), f"fold{fold}")
+    return {name: f"{base}_{name}.npz" for name in ("X_train", "X_val")} | {
+        name: f"{base}_{name}.npy" for name in ("y_train", "y_val")
+    }
+
+
+# =========================
+# WORKERS
+# =========================
+_TEXTS = None
+_LABELS = None
+
+
+def _init_worker(texts, labels):
+    global _TEXTS, _LABELS
+    _TEXTS = texts
+    _LABELS = labels
+
+
+def _save_atomic(path, save):
+    tmp = path[:-4] + ".tmp" + path[-4:]  # keep the .npz / .npy suffix
+    save(tmp)
+    os.replace(tmp, path)
+
+
+def build_fold(job):
+    """Fits one vectorizer on one fold and caches the matrices. Returns (vec_params, fold, seconds, cached)."""
+    cache_dir, dkey, vec_params, fold, train_idx, val_idx = job
+    paths = fold_paths(cache_dir, dkey, vec_params, fold)
+    if all(os.path.exists(p) for p in paths.values()):
+        return vec_params, fold, 0.0, True
+
+    start = time.perf_counter()
+    params = dict(vec_params, ngram_range=tuple(vec_params["ngram_range"]))
+    vectorizer = TfidfVectorizer(stop_words="english", **params)
+    X_train = vectorizer.fit_transform(_TEXTS[train_idx])
+    X_val = vectorizer.transform(_TEXTS[val_idx])
+
+    os.makedirs(os.path.dirname(paths["X_train"]), exist_ok=True)
+    _save_atomic(paths["X_train"], lambda p: sparse.save_npz(p, X_train, compressed=False))
+    _save_atomic(paths["X_val"], lambda p: sparse.save_npz(p, X_val, compressed=False))
+    _save_atomic(paths["y_train"], lambda p: np.save(p, _LABELS[train_idx]))
+    _save_atomic(paths["y_val"], lambda p: np.save(p, _LABELS[val_idx]))
+    return vec_params, fold, time.perf_counter() - start, False
+
+
+def run_trial(job):
+    """Fits the model on every cached fold; returns one result row."""
+    cache_dir, dkey, vec_params, model_params, n_folds = job
+    aucs, f1s, fit_seconds = [], [], []
+
+    start = time.perf_counter()
+    for fold in range(n_folds):
+        paths = fold_paths(cache_dir, dkey, vec_params, fold)
+        X_train = sparse.load_npz(paths["X_train"])
+        X_val = sparse.load_npz(paths["X_val"])
+        y_train = np.load(paths["y_train"])
+        y_val = np.load(paths["y_val"])
+
+        fit_start = time.perf_counter()
+        model = LogisticRegression(max_iter=1000, **model_params)
+        model.fit(X_train, y_train)
+        fit_seconds.append(time.perf_counter() - fit_start)
+
+        proba = model.predict_proba(X_val)[:, 1]
+        aucs.append(roc_auc_score(y_val, proba))
+        f1s.append(f1_score(y_val, proba >= 0.5))
+
+    return {
+        "max_features": vec_params["max_features"],
+        "ngram_range": tuple(vec_params["ngram_range"]),
+        "C": model_params["C"],
+        "class_weight": model_params["class_weight"],
+        "mean_auc": float(np.mean(aucs)),
+        "std_auc": float(np.std(aucs)),
+        "mean_f1": float(np.mean(f1s)),
+        "fit_seconds_per_fold": float(np.mean(fit_seconds)),
+        "trial_seconds": time.perf_counter() - start,
+    }
+
+
+# =========================
+# SEARCH
+# =========================
+def search(texts, labels, vectorizer_grid=VECTORIZER_GRID, model_grid=MODEL_GRID,
+           n_folds=N_FOLDS, workers=None, cache_dir=CACHE_DIR, seed=SEED):
+    """
+    Returns (ranked trial rows, vectorize info). Trial rows are sorted by
+    mean_auc (best first) and carry a "rank"; vectorize info has one
+    (vec_params, fold, seconds, cached) tuple per fitted fold.
+    """
+    texts = np.asarray(texts, dtype=object)
+    labels = np.asarray(labels, dtype=np.int8)
+    dkey = data_key(texts, labels, n_folds, seed)
+    folds = list(StratifiedKFold(n_splits=n_folds, shuffle=True, random_state=seed).split(texts, labels))
+
+    build_jobs = [
+        (cache_dir, dkey, vec_params, fold, train_idx, val_idx)
+        for vec_params in vectorizer_grid
+        for fold, (train_idx, val_idx) in enumerate(folds)
+    ]
+    trial_jobs = [
+        (cache_dir, dkey, vec_params, model_params, n_folds)
+        for vec_params in vectorizer_grid
+        for model_params in model_grid
+    ]
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        _init_worker(texts, labels)
+        built = [build_fold(job) for job in build_jobs]
+        results = [run_trial(job) for job in trial_jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(texts, labels)) as pool:
+            built = list(pool.map(build_fold, build_jobs))
+            results = list(pool.map(run_trial, trial_jobs))
+
+    results.sort(key=lambda r: r["mean_auc"], reverse=True)
+    for rank, row in enumerate(results, start=1):
+        row["rank"] = rank
+    return results, built
+
+
+# =========================
+# OUTPUT
+# =========================
+RESULT_FIELDS = [
+    "rank", "mean_auc", "std_auc", "mean_f1", "max_features", "ngram_range",
+    "C", "class_weight", "fit_seconds_per_fold", "trial_seconds",
+]
+
+
+def print_results(results, built):
+    fitted = [b for b in built if not b[3]]
+    print(f"\nVECTORIZER FITS: {len(fitted)} new, {len(built) - len(fitted)} from cache"
+          f" ({sum(b[2] for b in fitted):.1f}s)")
+    print(f"\n{'RANK':>4} {'AUC':>7} {'±':>6} {'F1':>6} {'FEATURES':>9} {'NGRAMS':>7} {'C':>6} "
+          f"{'WEIGHT':>9} {'FIT/FOLD':>9} {'TRIAL':>8}")
+    for r in results:
+        print(
+            f"{r['rank']:>4} {r['mean_auc']:>7.4f} {r['std_auc']:>6.4f} {r['mean_f1']:>6.3f}"
+            f" {r['max_features']:>9} {'%d-%d' % r['ngram_range']:>7} {r['C']:>6g}"
+            f" {str(r['class_weight']):>9} {r['fit_seconds_per_fold']:>8.2f}s {r['trial_seconds']:>7.1f}s"
+        )
+
+
+def write_results_csv(results, path):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=RESULT_FIELDS, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(results)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cross-validated TF-IDF + LogisticRegression search")
+    parser.add_argument("--folds", type=int, default=N_FOLDS)
+    parser.add_argument("--workers", type=int, default=None, help="processes (default: all cores)")
+    parser.add_argument("--sample", type=int, default=None, help="use only N training tweets")
+    parser.add_argument("--cache-dir", default=CACHE_DIR)
+    parser.add_argument("--out", default=RESULTS_PATH)
+    args = parser.parse_args()
+
+    import day08
+
+    DF = day08.CLEAN_DATA(day08.LOAD_DATA())
+    X_TRAIN, _, Y_TRAIN, _ = day08.SPLIT_DATA(DF)
+    if args.sample is not None and args.sample < len(X_TRAIN):
+        X_TRAIN = X_TRAIN.sample(args.sample, random_state=SEED)
+        Y_TRAIN = Y_TRAIN.loc[X_TRAIN.index]
+
+    start = time.perf_counter()
+    results, built = search(
+        X_TRAIN.tolist(), Y_TRAIN.to_numpy(), n_folds=args.folds, workers=args.workers, cache_dir=args.cache_dir
+    )
+    print_results(results, built)
+    write_results_csv(results, args.out)
+    print(f"\nSEARCH TIME: {time.perf_counter() - start:.1f}s")
+    print("WROTE:", args.out)
+
+
+if __name__ == "__main__":
+    main()
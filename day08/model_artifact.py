@@ -0,0 +1,108 @@
+# ============================================================
+# DAY08 – VERSIONED MODEL ARTIFACTS (VECTORIZER + MODEL)
+# ============================================================
+#
+# save_artifact() writes the fitted vectorizer + classifier as one joblib
+# file plus a meta.json, in a new version directory:
+#
+#   day08/artifacts/
+#       toxicity-20260118T101500Z-3f2a9c1e/
+#           pipeline.joblib
+#           meta.json        (version, created, sha256, sklearn version, metrics, ...)
+#       LATEST               (name of the newest version)
+#
+# load_artifact() loads LATEST (or a given version / directory) and checks
+# the sha256 before unpickling.
+
+import hashlib
+import json
+import os
+import time
+import uuid
+
+# =========================
+# CONFIG
+# =========================
+ARTIFACTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "artifacts")
+ARTIFACT_FILE = "pipeline.joblib"
+META_FILE = "meta.json"
+LATEST_FILE = "LATEST"
+ARTIFACT_PREFIX = "toxicity"
+
+
+# =========================
+# HELPERS
+# =========================
+def _sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def resolve_artifact_dir(version=None, artifacts_dir=ARTIFACTS_DIR):
+    """version: None (LATEST), a version name, or a path to a version directory."""
+    if version is not None and os.path.isdir(version):
+        return version
+    if version is None:
+        latest_path = os.path.join(artifacts_dir, LATEST_FILE)
+        if not os.path.exists(latest_path):
+            raise FileNotFoundError(f"No model artifact in {artifacts_dir} (train with day08.py first)")
+        with open(latest_path, "r", encoding="utf-8") as f:
+            version = f.read().strip()
+    path = os.path.join(artifacts_dir, version)
+    if not os.path.isdir(path):
+        raise FileNotFoundError(f"Unknown model artifact version: {version}")
+    return path
+
+
+# =========================
+# PUBLIC API
+# =========================
+def save_artifact(vectorizer, model, metadata=None, artifacts_dir=ARTIFACTS_DIR):
+    """Saves a new version and points LATEST at it. Returns the version directory."""
+    import joblib
+    import sklearn
+
+    created = time.strftime("%Y%m%dT%H%M%SZ", time.gmtime())
+    version = f"{ARTIFACT_PREFIX}-{created}-{uuid.uuid4().hex[:8]}"
+    version_dir = os.path.join(artifacts_dir, version)
+    os.makedirs(version_dir)
+
+    artifact_path = os.path.join(version_dir, ARTIFACT_FILE)
+    joblib.dump({"vectorizer": vectorizer, "model": model}, artifact_path, compress=3)
+
+    meta = {
+        "version": version,
+        "created": created,
+        "sha256": _sha256(artifact_path),
+        "sklearn_version": sklearn.__version__,
+        "vectorizer": type(vectorizer).__name__,
+        "model": type(model).__name__,
+    }
+    meta.update(metadata or {})
+    with open(os.path.join(version_dir, META_FILE), "w", encoding="utf-8") as f:
+        json.dump(meta, f, indent=2)
+
+    tmp_latest = os.path.join(artifacts_dir, LATEST_FILE + ".tmp")
+    with open(tmp_latest, "w", encoding="utf-8") as f:
+        f.write(version + "\n")
+    os.replace(tmp_latest, os.path.join(artifacts_dir, LATEST_FILE))
+    return version_dir
+
+
+def load_artifact(version=None, artifacts_dir=ARTIFACTS_DIR):
+    """Returns (vectorizer, model, meta)."""
+    import joblib
+
+    version_dir = resolve_artifact_dir(version, artifacts_dir)
+    with open(os.path.join(version_dir, META_FILE), "r", encoding="utf-8") as f:
+        meta = json.load(f)
+
+    artifact_path = os.path.join(version_dir, ARTIFACT_FILE)
+    if _sha256(artifact_path) != meta["sha256"]:
+        raise ValueError(f"Checksum mismatch for {artifact_path}; refusing to load it")
+
+    pipeline = joblib.load(artifact_path)
+    return pipeline["vectorizer"], pipeline["model"], meta
@@ -0,0 +1,194 @@
+# ============================================================
+# DAY08 – OUT-OF-CORE (STREAMING) TOXICITY TRAINING
+# ============================================================
+#
+# For tweet archives that don't fit in memory. Instead of loading the whole
+# CSV and fitting TfidfVectorizer + LogisticRegression:
+#   - the CSV is read in chunks (only the text + label columns)
+#   - every chunk is cleaned with clean_texts and vectorized with a stateless
+#     HashingVectorizer (no vocabulary to fit / keep in memory)
+#   - an SGDClassifier (logistic loss) is trained with partial_fit
+#   - a fixed share of tweets (chosen by a hash of the raw text, so the split
+#     is the same on every pass) is held out, and evaluated in a second pass
+#
+# Memory is one chunk + the model weights, whatever the dataset size.
+# Throughput (read + clean + vectorize + fit) is printed for every chunk.
+#
+# Usage:
+#   python day08/streaming_train.py --csv /data/tweets_archive.csv
+#   python day08/streaming_train.py --csv big.csv --chunk-rows 200000 --epochs 2
+
+import argparse
+import os
+import time
+import zlib
+
+import numpy as np
+import pandas as pd
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.linear_model import SGDClassifier
+
+from evaluation import histogram_auc
+from text_cleaning import clean_texts
+
+# =========================
+# CONFIG
+# =========================
+DATASET_REF = "umitka/twitter-toxic-tweets"
+CSV_FILE = "twitter_toxic_tweets.csv"
+TEXT_COL = "tweet"
+LABEL_COL = "label"
+
+CHUNK_ROWS = 100_000
+N_FEATURES = 2 ** 20
+HOLDOUT_PERCENT = 20
+AUC_BINS = 10_000
+CLASSES = np.array([0, 1])
+
+
+# =========================
+# HELPERS
+# =========================
+def make_vectorizer(n_features=N_FEATURES):
+    """Same n-grams / stop words as the in-memory TF-IDF, but stateless."""
+    return HashingVectorizer(
+        n_features=n_features,
+        ngram_range=(1, 2),
+        stop_words="english",
+        alternate_sign=False,
+        norm="l2",
+        dtype=np.float32,
+    )
+
+
+def holdout_mask(raw_texts, percent=HOLDOUT_PERCENT):
+    """True for held-out tweets; stable across passes and runs (CRC32 of the raw text)."""
+    return np.fromiter(
+        (zlib.crc32(str(t).encode("utf-8")) % 100 < percent for t in raw_texts),
+        dtype=bool,
+        count=len(raw_texts),
+    )
+
+
+def iter_chunks(csv_path, chunk_rows=CHUNK_ROWS, text_col=TEXT_COL, label_col=LABEL_COL,
+                holdout_percent=HOLDOUT_PERCENT):
+    """Yields (cleaned texts as an object array, int8 labels, holdout mask) per chunk."""
+    reader = pd.read_csv(csv_path, usecols=[text_col, label_col], chunksize=chunk_rows)
+    for chunk in reader:
+        chunk = chunk.dropna(subset=[label_col])
+        raw = chunk[text_col].tolist()
+        texts = np.asarray(clean_texts(raw), dtype=object)
+        labels = chunk[label_col].to_numpy(dtype=np.int8)
+        yield texts, labels, holdout_mask(raw, holdout_percent)
+
+
+# =========================
+# TRAIN
+# =========================
+def train_streaming(csv_path, chunk_rows=CHUNK_ROWS, n_features=N_FEATURES, epochs=1,
+                    holdout_percent=HOLDOUT_PERCENT, alpha=1e-5, random_state=42):
+    """Returns (vectorizer, model) trained on every non-held-out row of csv_path."""
+    vectorizer = make_vectorizer(n_features)
+    model = SGDClassifier(loss="log_loss", alpha=alpha, random_state=random_state)
+
+    total_rows = 0
+    total_seconds = 0.0
+    for epoch in range(1, epochs + 1):
+        chunks = iter_chunks(csv_path, chunk_rows, holdout_percent=holdout_percent)
+        # the clock runs while the next chunk is read + cleaned, so rows/s is end to end
+        start = time.perf_counter()
+        for i, (texts, labels, holdout) in enumerate(chunks, start=1):
+            train = ~holdout
+            if train.any():
+                X = vectorizer.transform(texts[train])
+                model.partial_fit(X, labels[train], classes=CLASSES)
+            seconds = time.perf_counter() - start
+            start = time.perf_counter()
+
+            total_rows += len(labels)
+            total_seconds += seconds
+            print(
+                f"EPOCH {epoch} CHUNK {i:>4}: {len(labels):>8,} rows ({int(train.sum()):,} train)"
+                f"  {len(labels) / seconds if seconds else 0:>10,.0f} rows/s"
+                f"  total {total_rows:,} rows, {total_rows / total_seconds if total_seconds else 0:,.0f} rows/s"
+            )
+
+    return vectorizer, model
+
+
+# =========================
+# EVALUATE (HELD-OUT STREAM)
+# =========================
+def evaluate_streaming(csv_path, vectorizer, model, chunk_rows=CHUNK_ROWS,
+                       holdout_percent=HOLDOUT_PERCENT, threshold=0.5):
+    """Metrics over the held-out rows, from running counts (bounded memory)."""
+    tp = fp = tn = fn = 0
+    pos_hist = np.zeros(AUC_BINS, dtype=np.int64)
+    neg_hist = np.zeros(AUC_BINS, dtype=np.int64)
+
+    for texts, labels, holdout in iter_chunks(csv_path, chunk_rows, holdout_percent=holdout_percent):
+        if not holdout.any():
+            continue
+        y = labels[holdout]
+        proba = model.predict_proba(vectorizer.transform(texts[holdout]))[:, 1]
+
+        pred = proba >= threshold
+        actual = y == 1
+        tp += int(np.sum(pred & actual))
+        fp += int(np.sum(pred & ~actual))
+        fn += int(np.sum(~pred & actual))
+        tn += int(np.sum(~pred & ~actual))
+
+        bins = np.minimum((proba * AUC_BINS).astype(np.int64), AUC_BINS - 1)
+        pos_hist += np.bincount(bins[actual], minlength=AUC_BINS)
+        neg_hist += np.bincount(bins[~actual], minlength=AUC_BINS)
+
+    n = tp + fp + tn + fn
+    precision = tp / (tp + fp) if tp + fp else 0.0
+    recall = tp / (tp + fn) if tp + fn else 0.0
+    return {
+        "rows": n,
+        "confusion_matrix": [[tn, fp], [fn, tp]],
+        "accuracy": (tp + tn) / n if n else 0.0,
+        "precision": precision,
+        "recall": recall,
+        "f1": 2 * precision * recall / (precision + recall) if precision + recall else 0.0,
+        "roc_auc": histogram_auc(pos_hist, neg_hist),
+    }
+
+
+# =========================
+# MAIN
+# =========================
+def default_csv_path():
+    import kagglehub  # only when no --csv is given
+
+    return os.path.join(kagglehub.dataset_download(DATASET_REF), CSV_FILE)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Out-of-core toxicity training (HashingVectorizer + SGD)")
+    parser.add_argument("--csv", default=None, help="CSV with tweet/label columns (default: the Kaggle dataset)")
+    parser.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS)
+    parser.add_argument("--n-features", type=int, default=N_FEATURES)
+    parser.add_argument("--epochs", type=int, default=1)
+    parser.add_argument("--holdout-percent", type=int, default=HOLDOUT_PERCENT)
+    args = parser.parse_args()
+
+    csv_path = args.csv or default_csv_path()
+
+    start = time.perf_counter()
+    vectorizer, model = train_streaming(
+        csv_path, args.chunk_rows, args.n_features, args.epochs, args.holdout_percent
+    )
+    print(f"\nTRAINING TIME: {time.perf_counter() - start:.1f}s")
+
+    metrics = evaluate_streaming(csv_path, vectorizer, model, args.chunk_rows, args.holdout_percent)
+    print(f"\nHELD-OUT ROWS: {metrics['rows']:,}")
+    print("CONFUSION MATRIX:", metrics["confusion_matrix"])
+    for name in ("accuracy", "precision", "recall", "f1", "roc_auc"):
+        print(f"{name.upper():<10} {metrics[name]:.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,23 @@
+import os
+import subprocess
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+HEAVY = ("numpy", "pandas", "sklearn", "matplotlib", "wordcloud", "kagglehub")
+
+
+def test_import_has_no_side_effects_and_no_heavy_imports():
+    code = (
+        "import sys, day08; "
+        f"print(','.join(m for m in {HEAVY!r} if m in sys.modules))"
+    )
+    out = subprocess.run([sys.executable, "-c", code], cwd=HERE, capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == ""
+
+
+def test_cli_help_lists_stages_and_headless():
+    out = subprocess.run(
+        [sys.executable, "day08.py", "--help"], cwd=HERE, capture_output=True, text=True, check=True
+    )
+    assert "--headless" in out.stdout
+    assert "visualize" in out.stdout
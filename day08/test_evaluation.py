@@ -0,0 +1,58 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+import evaluation
+
+
+def _data(n=3000, seed=0, decimals=2):
+    rng = np.random.default_rng(seed)
+    y = rng.random(n) < 0.3
+    # rounded scores -> many ties
+    s = np.round(np.clip(rng.normal(0.35 + 0.3 * y, 0.2), 0, 1), decimals)
+    return y, s
+
+
+def _brute_auc(y, s):
+    pos, neg = s[y][:, None], s[~y][None, :]
+    return ((pos > neg).sum() + 0.5 * (pos == neg).sum()) / (pos.size * neg.size)
+
+
+def test_sweep_matches_brute_force_with_ties():
+    y, s = _data(500)
+    sweep = evaluation.threshold_sweep(y, s)
+
+    assert np.all(np.diff(sweep["thresholds"]) < 0)
+    for i, t in enumerate(sweep["thresholds"]):
+        pred = s >= t
+        tp, fp = int((pred & y).sum()), int((pred & ~y).sum())
+        assert (sweep["tp"][i], sweep["fp"][i]) == (tp, fp)
+        assert sweep["f1"][i] == pytest.approx(2 * tp / (2 * tp + fp + int((~pred & y).sum())))
+
+    best = evaluation.best_threshold(sweep)
+    assert best["f1"] == pytest.approx(sweep["f1"].max())
+
+
+def test_roc_auc_matches_pairwise_count():
+    y, s = _data(800, seed=1)
+    assert evaluation.roc_auc(y, s) == pytest.approx(_brute_auc(y, s))
+
+
+def test_bootstrap_ci_exact_and_rank_bins():
+    y, s = _data(seed=2)
+    exact = evaluation.bootstrap_auc_ci(y, s, n_boot=300)
+    assert exact["exact_bins"]
+    assert exact["auc"] == pytest.approx(_brute_auc(y, s))
+    assert exact["low"] < exact["auc"] < exact["high"]
+
+    y, s = _data(seed=2, decimals=6)
+    binned = evaluation.bootstrap_auc_ci(y, s, n_boot=300, n_bins=200)
+    assert not binned["exact_bins"] and binned["bins"] == 200
+    assert binned["auc"] == pytest.approx(_brute_auc(y, s))
+    assert binned["low"] < binned["auc"] < binned["high"]
+    assert binned["high"] - binned["low"] < 0.1
+
+
+def test_single_class_is_rejected():
+    with pytest.raises(ValueError):
+        evaluation.roc_auc([1, 1, 1], [0.1, 0.2, 0.3])
@@ -0,0 +1,39 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+sparse = pytest.importorskip("scipy.sparse")
+
+import explain
+from bench_explain import loop_top_contributions, synthetic_tfidf
+
+
+def test_matches_per_row_loop_in_every_batch_size():
+    X, coef = synthetic_tfidf(2000, n_features=300, mean_nnz=6, seed=1)
+    ref_idx, ref_vals = loop_top_contributions(X, coef, 4)
+
+    for batch_rows in (1, 7, 2000):
+        idx, vals = explain.top_contributions(X, coef, k=4, batch_rows=batch_rows)
+        assert np.array_equal(idx, ref_idx)
+        assert np.allclose(vals, ref_vals, equal_nan=True)
+
+
+def test_short_and_empty_rows_are_padded():
+    X = sparse.csr_matrix(np.array([[0.0, 0.0, 0.0], [1.0, 0.0, 2.0], [0.0, 0.0, 0.0]]))
+    coef = np.array([0.5, 9.0, -1.0])
+
+    idx, vals = explain.top_contributions(X, coef, k=3)
+
+    assert idx.tolist() == [[-1, -1, -1], [0, 2, -1], [-1, -1, -1]]
+    assert vals[1, :2].tolist() == [0.5, -2.0]
+    assert np.isnan(vals[0]).all() and np.isnan(vals[1, 2])
+
+
+def test_directions():
+    X = sparse.csr_matrix(np.array([[1.0, 1.0, 1.0]]))
+    coef = np.array([2.0, -3.0, 0.5])
+
+    assert explain.top_contributions(X, coef, k=1, direction="toxic")[0].tolist() == [[0]]
+    assert explain.top_contributions(X, coef, k=1, direction="non_toxic")[0].tolist() == [[1]]
+    assert explain.top_contributions(X, coef, k=2, direction="abs")[0].tolist() == [[1, 0]]
+    with pytest.raises(ValueError):
+        explain.top_contributions(X, coef, direction="sideways")
@@ -0,0 +1,41 @@
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("scipy")
+pytest.importorskip("sklearn")
+
+import hparam_search
+
+
+TOXIC = ["you are a stupid idiot", "i hate you loser", "ugly stupid troll"]
+NON_TOXIC = ["what a lovely sunny day", "happy birthday my friend", "great game last night"]
+
+
+def _data(n=120):
+    texts, labels = [], []
+    for i in range(n):
+        toxic = i % 3 == 0
+        texts.append(f"{(TOXIC if toxic else NON_TOXIC)[i % 3]} number {i}")
+        labels.append(int(toxic))
+    return texts, labels
+
+
+def test_search_ranks_trials_and_reuses_cached_folds(tmp_path):
+    texts, labels = _data()
+    vec_grid = [{"max_features": 50, "ngram_range": [1, 1]}, {"max_features": 100, "ngram_range": [1, 2]}]
+    model_grid = [{"C": 0.5, "class_weight": None}, {"C": 2.0, "class_weight": "balanced"}]
+
+    results, built = hparam_search.search(
+        texts, labels, vec_grid, model_grid, n_folds=3, workers=1, cache_dir=str(tmp_path)
+    )
+
+    assert len(results) == 4
+    assert [r["rank"] for r in results] == [1, 2, 3, 4]
+    aucs = [r["mean_auc"] for r in results]
+    assert aucs == sorted(aucs, reverse=True)
+    assert not any(cached for _, _, _, cached in built)
+
+    _, built_again = hparam_search.search(
+        texts, labels, vec_grid, model_grid, n_folds=3, workers=1, cache_dir=str(tmp_path)
+    )
+    assert all(cached for _, _, _, cached in built_again)
@@ -0,0 +1,44 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("pandas")
+pytest.importorskip("sklearn")
+
+import streaming_train
+
+
+def _write_csv(path, n=3000):
+    rng = np.random.default_rng(0)
+    toxic = ["you are stupid idiot", "hate you loser", "stupid ugly idiot"]
+    clean = ["lovely sunny day", "happy birthday friend", "great game tonight"]
+    lines = ["id,label,tweet"]
+    for i in range(n):
+        label = int(rng.random() < 0.3)
+        words = toxic if label else clean
+        lines.append(f"{i},{label},@user {words[i % 3]} #{i}")
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return path
+
+
+def test_histogram_auc_matches_exact_auc_without_ties():
+    assert streaming_train.histogram_auc([0, 0, 2], [2, 0, 0]) == 1.0
+    assert streaming_train.histogram_auc([1, 1], [1, 1]) == 0.5
+    assert streaming_train.histogram_auc([0, 1], [1, 0]) == 1.0
+
+
+def test_holdout_mask_is_stable():
+    texts = [f"tweet {i}" for i in range(1000)]
+    first = streaming_train.holdout_mask(texts, 20)
+    assert (first == streaming_train.holdout_mask(texts, 20)).all()
+    assert 100 < first.sum() < 300
+
+
+def test_streaming_train_and_evaluate(tmp_path):
+    csv_path = _write_csv(tmp_path / "tweets.csv")
+
+    vectorizer, model = streaming_train.train_streaming(csv_path, chunk_rows=500, n_features=2 ** 12)
+    metrics = streaming_train.evaluate_streaming(csv_path, vectorizer, model, chunk_rows=700)
+
+    assert 0 < metrics["rows"] < 3000
+    assert metrics["roc_auc"] > 0.95
+    assert metrics["f1"] > 0.9
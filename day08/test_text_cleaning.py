@@ -0,0 +1,41 @@
+import pytest
+
+from bench_clean_text import synthetic_tweets
+from text_cleaning import CLEAN_TEXT, clean_series, clean_texts
+
+
+EDGE_CASES = [
+    "",
+    "   ",
+    "RT @user: I love this!!! http://t.co/abc #happy",
+    "@userhttp://t.co/x still here",
+    "see www.example.com/page and https://x.com/a?b=1",
+    "it's father's day, can't wait &amp; you'll see",
+    "line one\nline two\ttabbed nbsp",
+    "CAFÉ Ünïcödé ΣΊΣΥΦΟΣ İstanbul 😀",
+    "@ @@ ## '' ' don't",
+    "email me: a.b@c.com 2016 #1",
+    float("nan"),
+    12345,
+    None,
+]
+
+
+def test_clean_texts_matches_clean_text_on_edge_cases():
+    assert clean_texts(EDGE_CASES) == [CLEAN_TEXT(t) for t in EDGE_CASES]
+
+
+def test_clean_texts_matches_clean_text_on_synthetic_tweets():
+    tweets = synthetic_tweets(5000, seed=3)
+    assert clean_texts(tweets) == [CLEAN_TEXT(t) for t in tweets]
+
+
+def test_clean_series_keeps_index_and_output():
+    pd = pytest.importorskip("pandas")
+    series = pd.Series(synthetic_tweets(300, seed=1), index=range(1000, 1300), name="tweet")
+
+    cleaned = clean_series(series, workers=1)
+
+    assert list(cleaned.index) == list(series.index)
+    assert cleaned.name == "tweet"
+    assert cleaned.tolist() == series.apply(CLEAN_TEXT).tolist()
@@ -0,0 +1,121 @@
+import http.client
+import json
+import socket
+import threading
+
+import bench_scorer
+import toxicity_scorer
+
+
+class FakeScorer:
+    """Scores a tweet by its length; records the size of every batch."""
+
+    version = "fake-1"
+
+    def __init__(self):
+        self.batch_sizes = []
+
+    def score(self, tweets):
+        self.batch_sizes.append(len(tweets))
+        return [float(len(t)) for t in tweets]
+
+
+def test_micro_batcher_coalesces_concurrent_requests():
+    scorer = FakeScorer()
+    batcher = toxicity_scorer.MicroBatcher(scorer, max_batch=1000, max_wait_ms=50)
+    try:
+        futures = [batcher.submit(["x" * i, "y"]) for i in range(20)]
+        results = [f.result(timeout=5) for f in futures]
+    finally:
+        batcher.close()
+
+    assert results == [[float(i), 1.0] for i in range(20)]
+    assert sum(scorer.batch_sizes) == 40
+    assert len(scorer.batch_sizes) < 20
+
+
+def test_micro_batcher_respects_max_batch():
+    scorer = FakeScorer()
+    batcher = toxicity_scorer.MicroBatcher(scorer, max_batch=4, max_wait_ms=50)
+    try:
+        futures = [batcher.submit(["a", "b"]) for _ in range(6)]
+        for f in futures:
+            f.result(timeout=5)
+    finally:
+        batcher.close()
+
+    assert all(size <= 4 for size in scorer.batch_sizes)
+
+
+def test_http_score_endpoint_and_bench_scorer():
+    batcher = toxicity_scorer.MicroBatcher(FakeScorer(), max_wait_ms=1)
+    server = toxicity_scorer.make_server(batcher, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        url = "http://%s:%d" % server.server_address[:2]
+        conn = bench_scorer.make_connection(url)
+        assert bench_scorer.score_request(conn, ["abc", ""]) == [3.0, 0.0]
+        conn.close()
+
+        result = bench_scorer.run_load_test(url, clients=4, batch=3, duration=0.3)
+        assert result["requests"] > 0
+        assert result["errors"] == 0
+        assert result["p50_ms"] <= result["p99_ms"]
+    finally:
+        server.shutdown()
+        server.server_close()
+        batcher.close()
+
+
+def test_http_scorer_failure_returns_500():
+    class BrokenScorer(FakeScorer):
+        def score(self, tweets):
+            raise RuntimeError("model not loaded")
+
+    batcher = toxicity_scorer.MicroBatcher(BrokenScorer(), max_wait_ms=1)
+    server = toxicity_scorer.make_server(batcher, port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        conn = http.client.HTTPConnection(*server.server_address[:2], timeout=5)
+        conn.request("POST", "/score", body=json.dumps({"tweets": ["abc"]}),
+                     headers={"Content-Type": "application/json"})
+        response = conn.getresponse()
+        assert response.status == 500
+        assert "model not loaded" in json.loads(response.read())["error"]
+        conn.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+        batcher.close()
+
+
+def test_http_connection_stays_usable_after_error_responses():
+    batcher = toxicity_scorer.MicroBatcher(FakeScorer(), max_wait_ms=1)
+    server = toxicity_scorer.make_server(batcher, port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    body = json.dumps({"tweets": ["abc"]})
+    try:
+        conn = http.client.HTTPConnection(*server.server_address[:2], timeout=5)
+        conn.request("POST", "/nope", body=body)
+        response = conn.getresponse()
+        assert response.status == 404 and not response.will_close
+        response.read()
+        sock = conn.sock
+
+        for _ in range(2):  # same socket: the 404's body was not taken for a request
+            conn.request("POST", "/score", body=body)
+            response = conn.getresponse()
+            assert response.status == 200 and json.loads(response.read())["scores"] == [3.0]
+        assert conn.sock is sock
+        conn.close()
+
+        for length in ("abc", "-1", str(toxicity_scorer.MAX_REQUEST_BYTES + 1)):
+            with socket.create_connection(server.server_address[:2], timeout=5) as raw:
+                raw.sendall(f"POST /score HTTP/1.1\r\nHost: x\r\nContent-Length: {length}\r\n\r\n".encode())
+                reply = raw.makefile("rb").read()  # server closes the connection
+            assert reply.split(b" ", 2)[1] in (b"400", b"413") and b"Connection: close" in reply
+    finally:
+        server.shutdown()
+        server.server_close()
+        batcher.close()
@@ -0,0 +1,72 @@
+import sys
+import types
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+import tweet_cache
+from text_cleaning import clean_series
+
+
+def _setup(tmp_path, monkeypatch):
+    data_dir = tmp_path / "dataset"
+    data_dir.mkdir()
+    (data_dir / "tweets.csv").write_text(
+        "id,label,tweet\n1,0,@user Happy day! http://t.co/x\n2,1,you are STUPID #rt\n", encoding="utf-8"
+    )
+    downloads = []
+    fake = types.SimpleNamespace(dataset_download=lambda ref: downloads.append(ref) or str(data_dir))
+    monkeypatch.setitem(sys.modules, "kagglehub", fake)
+    return data_dir, downloads
+
+
+def _load(cache_dir, **kwargs):
+    return tweet_cache.load_clean_tweets(
+        "owner/tweets", "tweets.csv", "tweet", clean_series=clean_series, clean_version="1",
+        cache_dir=str(cache_dir), **kwargs
+    )
+
+
+def test_miss_then_hit_without_download(tmp_path, monkeypatch, capsys):
+    data_dir, downloads = _setup(tmp_path, monkeypatch)
+
+    first = _load(tmp_path / "cache")
+    second = _load(tmp_path / "cache")
+
+    assert downloads == ["owner/tweets"]
+    assert first["CLEAN_TWEET"].tolist() == ["happy day", "you are stupid"]
+    assert str(first["label"].dtype) == "int8"
+    pd.testing.assert_frame_equal(first, second)
+    out = capsys.readouterr().out
+    assert "CACHE MISS" in out and "CACHE HIT" in out and "hits=1 misses=1" in out
+
+
+def test_offline_hit_and_rebuild_on_change(tmp_path, monkeypatch):
+    data_dir, downloads = _setup(tmp_path, monkeypatch)
+    csv_path = data_dir / "tweets.csv"
+    _load(tmp_path / "cache")
+
+    # changed source -> rebuilt from the recorded CSV, no new download
+    csv_path.write_text(csv_path.read_text(encoding="utf-8") + "3,0,lovely game\n", encoding="utf-8")
+    assert len(_load(tmp_path / "cache")) == 3
+
+    # source gone (offline / kagglehub cache cleared) -> still served from the cache
+    csv_path.unlink()
+    assert len(_load(tmp_path / "cache")) == 3
+    assert downloads == ["owner/tweets"]
+
+
+def test_low_memory_variant_is_cached_separately(tmp_path, monkeypatch):
+    _setup(tmp_path, monkeypatch)
+    _load(tmp_path / "cache")
+
+    lean = _load(
+        tmp_path / "cache",
+        read_options={"usecols": ["tweet", "label"], "dtype": {"tweet": "string", "label": "int8"}},
+        string_dtype="string",
+    )
+
+    assert list(lean.columns) == ["label", "tweet", "CLEAN_TWEET"]
+    assert str(lean["CLEAN_TWEET"].dtype) == "string"
+    assert "id" in _load(tmp_path / "cache").columns
@@ -0,0 +1,34 @@
+from collections import Counter
+
+import pytest
+
+pytest.importorskip("scipy")
+pytest.importorskip("sklearn")
+wordcloud = pytest.importorskip("wordcloud")
+
+import wordclouds
+
+
+def test_class_term_frequencies_match_per_class_counts():
+    texts = ["hate hate idiot", "lovely day", "lovely lovely game 2016", "idiot troll", "the day"]
+    labels = [1, 0, 0, 1, 0]
+
+    freqs = wordclouds.class_term_frequencies(texts, labels, max_words=10)
+
+    for label in (0, 1):
+        expected = Counter(
+            w for t, y in zip(texts, labels) if y == label
+            for w in t.split() if w not in wordcloud.STOPWORDS and not w.isdigit()
+        )
+        assert freqs[label] == dict(expected)
+
+
+def test_max_words_keeps_the_most_frequent_terms():
+    freqs = wordclouds.class_term_frequencies(["aa aa aa bb bb cc"], [0], max_words=2)
+    assert freqs == {0: {"aa": 3, "bb": 2}}
+
+
+def test_render_wordclouds_writes_files(tmp_path):
+    paths = wordclouds.render_wordclouds({"a.png": {"hello": 3, "world": 1}, "b.png": {"toxic": 2}}, str(tmp_path))
+    assert sorted(paths) == ["a.png", "b.png"]
+    assert all((tmp_path / name).stat().st_size > 0 for name in paths)
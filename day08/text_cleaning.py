@@ -0,0 +1,123 @@
+# ============================================================
+# DAY08 – TWEET TEXT CLEANING (REFERENCE + FAST BATCH VERSION)
+# ============================================================
+#
+# CLEAN_TEXT      : the original per-tweet cleaner (reference, unchanged)
+# clean_texts     : same output for a list of tweets, ~2x faster
+# clean_series    : clean_texts for a pandas Series, chunked across processes
+#
+# Why clean_texts gives exactly the same output as CLEAN_TEXT:
+#   - "#" -> " " is already covered by [^a-z\s'] -> " "
+#   - after [^a-z\s'] -> " ", only a-z, ' and whitespace are left, so
+#     collapsing whitespace + split() == re.findall(r"[a-z']+")
+#   - the URL and mention passes only run when the text can match them
+#   - the two drop-word sets are built once, as a single frozenset
+# The URL pass must still run before the mention pass ("@userhttp://x.co").
+
+import os
+import re
+
+# =========================
+# CONFIG
+# =========================
+# REMOVE CONTRACTION ARTIFACTS
+CONTRACTION_FRAGMENTS = frozenset({"ve", "ll", "re", "d", "m", "s", "amp"})
+
+# TWITTER / GENERIC NOISE WORDS (EDIT THIS LIST FREELY)
+NOISE_WORDS = frozenset({
+    "rt", "via", "retweet",
+    "listen", "watch", "look",
+    "will", "im", "dont", "cant",
+    "http", "https", "co"
+})
+
+DROP_TOKENS = CONTRACTION_FRAGMENTS | NOISE_WORDS
+
+# BELOW THIS MANY TWEETS, A PROCESS POOL COSTS MORE THAN IT SAVES
+PARALLEL_MIN_ROWS = 200_000
+CHUNK_ROWS = 50_000
+
+
+# =========================
+# REFERENCE CLEANER
+# =========================
+def CLEAN_TEXT(TEXT: str) -> str:
+    TEXT = str(TEXT).lower()
+
+    # PRIMARY CLEANING
+    TEXT = re.sub(r"http\S+|www\.\S+", " ", TEXT)
+    TEXT = re.sub(r"@\w+", " ", TEXT)
+    TEXT = re.sub(r"#", " ", TEXT)
+    TEXT = re.sub(r"[^a-z\s']", " ", TEXT)
+    TEXT = re.sub(r"\s+", " ", TEXT).strip()
+
+    TOKENS = TEXT.split()
+
+    CLEAN_TOKENS = [
+        T for T in TOKENS
+        if T not in CONTRACTION_FRAGMENTS
+        and T not in NOISE_WORDS
+    ]
+
+    return " ".join(CLEAN_TOKENS)
+
+
+# =========================
+# FAST BATCH CLEANER
+# =========================
+_URL_RE = re.compile(r"http\S+|www\.\S+")
+_MENTION_RE = re.compile(r"@\w+")
+_TOKEN_RE = re.compile(r"[a-z']+")
+
+
+def clean_texts(texts):
+    """CLEAN_TEXT applied to every item of `texts` (any iterable); returns a list."""
+    out = []
+    append = out.append
+    url_sub = _URL_RE.sub
+    mention_sub = _MENTION_RE.sub
+    find_tokens = _TOKEN_RE.findall
+    drop = DROP_TOKENS
+
+    for text in texts:
+        text = str(text).lower()
+        if "http" in text or "www." in text:
+            text = url_sub(" ", text)
+        if "@" in text:
+            text = mention_sub(" ", text)
+        append(" ".join([t for t in find_tokens(text) if t not in drop]))
+    return out
+
+
+def clean_series(series, workers=None, chunk_rows=CHUNK_ROWS):
+    """
+    Cleaned copy of a pandas Series of tweets (same index).
+    Large series are split into chunks and cleaned in a process pool
+    (workers=None -> all cores, workers=1 -> in this process).
+    """
+    import pandas as pd
+
+    if series.dtype == object:
+        values = series.tolist()
+    else:
+        # e.g. Arrow-backed strings: missing is pd.NA there, make it nan like read_csv gives
+        values = series.to_numpy(dtype=object, na_value=float("nan")).tolist()
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers <= 1 or len(values) < PARALLEL_MIN_ROWS:
+        cleaned = clean_texts(values)
+    else:
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        chunks = [values[i:i + chunk_rows] for i in range(0, len(values), chunk_rows)]
+        cleaned = []
+        # fork (where available) so workers don't re-run the calling script
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context("fork" if "fork" in methods else None)
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            for part in pool.map(clean_texts, chunks):
+                cleaned.extend(part)
+
+    return pd.Series(cleaned, index=series.index, name=series.name, dtype=object)
@@ -0,0 +1,256 @@
+# ============================================================
+# DAY08 – LOW-LATENCY TOXICITY SCORER (BATCH API + HTTP SERVICE)
+# ============================================================
+#
+# Scorer       : loads a saved artifact (model_artifact.py) once and scores
+#                a list of tweets with one clean -> transform -> predict_proba
+# MicroBatcher : collects concurrent requests for up to MAX_WAIT_MS (or until
+#                MAX_BATCH tweets) and scores them together in one call
+# HTTP server  : POST /score {"tweets": ["...", ...]} -> {"scores": [...], "version": "..."}
+#                GET  /health
+#                on TCP (--port) or a Unix socket (--unix PATH)
+#
+# Usage:
+#   python day08/toxicity_scorer.py --port 8808
+#   curl -s localhost:8808/score -d '{"tweets": ["you are an idiot", "lovely day"]}'
+
+import argparse
+import json
+import os
+import queue
+import socketserver
+import threading
+import time
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from text_cleaning import clean_texts
+
+# =========================
+# CONFIG
+# =========================
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8808
+MAX_BATCH = 512
+MAX_WAIT_MS = 2.0
+MAX_REQUEST_BYTES = 8 * 2 ** 20
+
+
+# =========================
+# BATCH API
+# =========================
+class Scorer:
+    """Toxicity probability for a list of tweets, from a saved artifact."""
+
+    def __init__(self, vectorizer, model, version="unsaved"):
+        self.vectorizer = vectorizer
+        self.model = model
+        self.version = version
+
+    @classmethod
+    def from_artifact(cls, version=None):
+        from model_artifact import load_artifact
+
+        vectorizer, model, meta = load_artifact(version)
+        return cls(vectorizer, model, meta["version"])
+
+    def score(self, tweets):
+        if not tweets:
+            return []
+        X = self.vectorizer.transform(clean_texts(tweets))
+        return self.model.predict_proba(X)[:, 1].tolist()
+
+
+# =========================
+# MICRO-BATCHING
+# =========================
+class MicroBatcher:
+    """
+    Thread-safe front for a scorer: submit() returns a Future; a single worker
+    thread merges everything queued within max_wait_ms into one score() call.
+    """
+
+    def __init__(self, scorer, max_batch=MAX_BATCH, max_wait_ms=MAX_WAIT_MS):
+        self.scorer = scorer
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000.0
+        self.batches = 0
+        self.tweets = 0
+
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(self, tweets):
+        future = Future()
+        self._queue.put((list(tweets), future))
+        return future
+
+    def score(self, tweets, timeout=None):
+        return self.submit(tweets).result(timeout)
+
+    def close(self):
+        self._queue.put(None)
+        self._thread.join()
+
+    def _collect(self, first):
+        pending = [first]
+        size = len(first[0])
+        deadline = time.perf_counter() + self.max_wait
+        while size < self.max_batch:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is None:
+                self._queue.put(None)  # let _run see the shutdown after this batch
+                break
+            pending.append(item)
+            size += len(item[0])
+        return pending
+
+    def _run(self):
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+            pending = self._collect(first)
+
+            tweets = [t for texts, _ in pending for t in texts]
+            try:
+                scores = self.scorer.score(tweets)
+            except Exception as e:  # report to every waiting request, keep serving
+                for _, future in pending:
+                    future.set_exception(e)
+                continue
+
+            self.batches += 1
+            self.tweets += len(tweets)
+            offset = 0
+            for texts, future in pending:
+                future.set_result(scores[offset:offset + len(texts)])
+                offset += len(texts)
+
+
+# =========================
+# HTTP
+# =========================
+class ScoreHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive: clients reuse one connection
+    batcher = None  # set by make_server()
+
+    def _send_json(self, status, payload, close=False):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if close:  # request body left unread: it must not be parsed as the next request
+            self.send_header("Connection", "close")
+            self.close_connection = True
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == "/health":
+            self._send_json(200, {
+                "version": self.batcher.scorer.version,
+                "batches": self.batcher.batches,
+                "tweets": self.batcher.tweets,
+            })
+        else:
+            self._send_json(404, {"error": f"unknown endpoint: {self.path}"})
+
+    def do_POST(self):
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+            if length < 0:
+                raise ValueError
+        except ValueError:
+            self._send_json(400, {"error": "invalid Content-Length"}, close=True)
+            return
+        if length > MAX_REQUEST_BYTES:
+            self._send_json(413, {"error": "request too large"}, close=True)
+            return
+
+        # always consume the body, so the keep-alive connection stays in sync
+        body = self.rfile.read(length)
+        if self.path != "/score":
+            self._send_json(404, {"error": f"unknown endpoint: {self.path}"})
+            return
+        try:
+            tweets = json.loads(body)["tweets"]
+            if not isinstance(tweets, list):
+                raise TypeError
+        except (ValueError, KeyError, TypeError):
+            self._send_json(400, {"error": 'expected JSON body {"tweets": [...]}'})
+            return
+
+        try:
+            scores = self.batcher.score([str(t) for t in tweets])
+        except Exception as e:  # scorer failure: answer instead of dropping the connection
+            self._send_json(500, {"error": f"scoring failed: {type(e).__name__}: {e}"})
+            return
+        self._send_json(200, {"scores": scores, "version": self.batcher.scorer.version})
+
+    def log_message(self, format, *args):
+        pass
+
+
+class ThreadingUnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+    request_queue_size = 128  # a full Unix socket backlog refuses, it doesn't wait
+
+    def get_request(self):
+        request, _ = super().get_request()
+        return request, ("unix", 0)  # BaseHTTPRequestHandler expects (host, port)
+
+
+def make_server(batcher, host=DEFAULT_HOST, port=DEFAULT_PORT, unix_path=None):
+    """HTTP server on host:port (port 0 = any free port) or on a Unix socket."""
+    if unix_path is not None:
+        handler = type("BoundScoreHandler", (ScoreHandler,), {"batcher": batcher})
+        if os.path.exists(unix_path):
+            os.remove(unix_path)
+        return ThreadingUnixHTTPServer(unix_path, handler)
+
+    # TCP_NODELAY: headers and body are separate writes; with keep-alive,
+    # Nagle + delayed ACK would otherwise add ~40 ms to every response
+    handler = type("BoundScoreHandler", (ScoreHandler,), {"batcher": batcher, "disable_nagle_algorithm": True})
+    server = ThreadingHTTPServer((host, port), handler, bind_and_activate=False)
+    server.request_queue_size = 128
+    server.server_bind()
+    server.server_activate()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Micro-batching toxicity scoring service")
+    parser.add_argument("--version", default=None, help="artifact version or directory (default: LATEST)")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--unix", default=None, help="serve on this Unix socket path instead of TCP")
+    parser.add_argument("--max-batch", type=int, default=MAX_BATCH)
+    parser.add_argument("--max-wait-ms", type=float, default=MAX_WAIT_MS)
+    args = parser.parse_args()
+
+    scorer = Scorer.from_artifact(args.version)
+    batcher = MicroBatcher(scorer, args.max_batch, args.max_wait_ms)
+    server = make_server(batcher, args.host, args.port, args.unix)
+
+    where = args.unix or "http://%s:%d" % server.server_address[:2]
+    print(f"MODEL: {scorer.version}")
+    print(f"SERVING ON {where}  (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        batcher.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+# ============================================================
+# DAY08 – LOCAL CACHE FOR THE PARSED + CLEANED TWEETS FRAME
+# ============================================================
+#
+# The first run downloads the dataset (kagglehub), parses the CSV, cleans the
+# text and stores the resulting frame on disk (Parquet, or pickle when no
+# Parquet engine is installed) with integer columns downcast.
+# Later runs load that file directly: no CSV parsing, no text cleaning and
+# no kagglehub call at all, so it works offline once populated.
+#
+# The cache entry is keyed by the CSV path, its size and mtime, and a
+# "clean version" string that must change whenever the cleaning changes.
+
+import hashlib
+import json
+import os
+import time
+
+import pandas as pd
+
+# =========================
+# CONFIG
+# =========================
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache")
+MANIFEST_FILE = "manifest.json"
+
+
+# =========================
+# HELPERS
+# =========================
+def _manifest_path(cache_dir):
+    return os.path.join(cache_dir, MANIFEST_FILE)
+
+
+def _read_manifest(cache_dir):
+    try:
+        with open(_manifest_path(cache_dir), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {"datasets": {}, "hits": 0, "misses": 0}
+
+
+def _write_manifest(cache_dir, manifest):
+    tmp_path = _manifest_path(cache_dir) + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, _manifest_path(cache_dir))
+
+
+def _source_signature(csv_path):
+    st = os.stat(csv_path)
+    return {"csv_path": os.path.abspath(csv_path), "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+
+def _cache_key(signature, clean_version, variant=None):
+    parts = [signature, clean_version] if variant is None else [signature, clean_version, variant]
+    raw = json.dumps(parts, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(raw).hexdigest()[:16]
+
+
+def _parquet_available():
+    try:
+        import pyarrow  # noqa: F401
+        return True
+    except ImportError:
+        try:
+            import fastparquet  # noqa: F401
+            return True
+        except ImportError:
+            return False
+
+
+def _save_frame(df, path_no_ext):
+    if _parquet_available():
+        path = path_no_ext + ".parquet"
+        df.to_parquet(path, index=False)
+    else:
+        path = path_no_ext + ".pkl"
+        df.to_pickle(path)
+    return path
+
+
+def _load_frame(path):
+    if path.endswith(".parquet"):
+        return pd.read_parquet(path)
+    return pd.read_pickle(path)
+
+
+def downcast_int_columns(df):
+    """Downcasts integer columns (e.g. 0/1 labels -> int8) to the smallest type that fits."""
+    for col in df.columns:
+        if pd.api.types.is_integer_dtype(df[col]):
+            df[col] = pd.to_numeric(df[col], downcast="integer")
+    return df
+
+
+# =========================
+# PUBLIC API
+# =========================
+def load_clean_tweets(
+    dataset_ref,
+    csv_file,
+    text_col,
+    clean_series,
+    clean_version,
+    clean_col="CLEAN_TWEET",
+    cache_dir=CACHE_DIR,
+    read_options=None,
+    string_dtype=None,
+):
+    """
+    Returns the tweets DataFrame with `clean_col` added, from the cache when possible.
+
+    clean_series:  function(pd.Series of raw text) -> pd.Series of cleaned text
+    clean_version: any string; bump it when the cleaning logic changes
+    read_options:  extra pd.read_csv arguments (e.g. usecols / dtype), JSON-serializable
+    string_dtype:  e.g. "string[pyarrow]" to store the text columns as that dtype
+    Frames read with different read_options / string_dtype are cached separately.
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    manifest = _read_manifest(cache_dir)
+
+    variant = None
+    entry_name = dataset_ref
+    if read_options or string_dtype:
+        variant = {"read_options": read_options, "string_dtype": string_dtype}
+        entry_name = dataset_ref + "|" + json.dumps(variant, sort_keys=True)
+    entry = manifest["datasets"].get(entry_name)
+
+    # 1) known source: check it is unchanged without touching kagglehub
+    csv_path = None
+    if entry is not None:
+        recorded_csv = entry["signature"]["csv_path"]
+        cached_file = entry.get("file")
+        cached_ok = cached_file is not None and os.path.exists(cached_file)
+
+        if os.path.exists(recorded_csv):
+            signature = _source_signature(recorded_csv)
+            if cached_ok and entry["key"] == _cache_key(signature, clean_version, variant):
+                return _hit(cache_dir, manifest, cached_file, "source unchanged")
+            csv_path = recorded_csv
+        elif cached_ok and entry.get("clean_version") == clean_version:
+            # offline / dataset removed from the kagglehub cache
+            return _hit(cache_dir, manifest, cached_file, "source not available, using cached frame")
+
+    # 2) miss: (download,) parse, clean, store
+    if csv_path is None:
+        import kagglehub  # only needed on a cold cache
+
+        dataset_path = kagglehub.dataset_download(dataset_ref)
+        csv_path = os.path.join(dataset_path, csv_file)
+
+    start = time.perf_counter()
+    df = pd.read_csv(csv_path, **(read_options or {}))
+    df[clean_col] = clean_series(df[text_col])
+    if string_dtype is not None:
+        df[text_col] = df[text_col].astype(string_dtype)
+        df[clean_col] = df[clean_col].astype(string_dtype)
+    df = downcast_int_columns(df)
+
+    signature = _source_signature(csv_path)
+    key = _cache_key(signature, clean_version, variant)
+    cached_file = _save_frame(df, os.path.join(cache_dir, key))
+    # return the frame as stored, so a miss and a later hit have the same dtypes
+    # (e.g. Parquet gives object text columns back as StringDtype on pandas 3)
+    df = _load_frame(cached_file)
+
+    if entry is not None and entry.get("file") not in (None, cached_file) and os.path.exists(entry["file"]):
+        os.remove(entry["file"])  # stale entry for this dataset
+
+    manifest["datasets"][entry_name] = {
+        "signature": signature,
+        "clean_version": clean_version,
+        "key": key,
+        "file": cached_file,
+    }
+    manifest["misses"] += 1
+    _write_manifest(cache_dir, manifest)
+
+    print(f"CACHE MISS: parsed + cleaned {csv_path} in {time.perf_counter() - start:.1f}s -> {cached_file}")
+    print(f"CACHE STATS: hits={manifest['hits']} misses={manifest['misses']}")
+    return df
+
+
+def _hit(cache_dir, manifest, cached_file, reason):
+    start = time.perf_counter()
+    df = _load_frame(cached_file)
+    manifest["hits"] += 1
+    _write_manifest(cache_dir, manifest)
+    print(f"CACHE HIT ({reason}): loaded {cached_file} in {time.perf_counter() - start:.2f}s")
+    print(f"CACHE STATS: hits={manifest['hits']} misses={manifest['misses']}")
+    return df
@@ -0,0 +1,106 @@
+# ============================================================
+# DAY08 – WORD CLOUDS FROM SPARSE TERM COUNTS
+# ============================================================
+#
+# Instead of " ".join-ing every cleaned tweet of a class into one huge string
+# (which WordCloud then re-tokenizes):
+#   1) ONE CountVectorizer pass over all tweets -> sparse counts (tweets x terms)
+#   2) ONE sparse product with a (classes x tweets) label indicator matrix
+#      -> term counts per class
+#   3) top max_words terms per class -> WordCloud.generate_from_frequencies
+#   4) the clouds are rendered in parallel processes and written straight to
+#      PNG files
+#
+# Tokens follow WordCloud's own defaults (regexp \w[\w']*, its STOPWORDS,
+# no pure numbers), so the clouds show the same words. Unlike generate(), no
+# bigram "collocations" are added and plurals are not merged.
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+# =========================
+# CONFIG
+# =========================
+MAX_WORDS = 200
+WORDCLOUD_OPTIONS = {
+    "width": 800,
+    "height": 400,
+    "background_color": "white",
+}
+TOKEN_PATTERN = r"\w[\w']*"
+
+
+# =========================
+# TERM FREQUENCIES
+# =========================
+def class_term_frequencies(texts, labels, max_words=MAX_WORDS):
+    """
+    Returns {label: {term: count}} with the max_words most frequent terms of
+    every label, from a single sparse count matrix.
+    """
+    from scipy import sparse
+    from sklearn.feature_extraction.text import CountVectorizer
+    from wordcloud import STOPWORDS
+
+    labels = np.asarray(labels)
+    classes, label_idx = np.unique(labels, return_inverse=True)
+
+    vectorizer = CountVectorizer(
+        token_pattern=TOKEN_PATTERN,
+        stop_words=sorted(STOPWORDS),
+        lowercase=False,  # already lowercased by the cleaning
+        dtype=np.int32,
+    )
+    X = vectorizer.fit_transform(texts)
+    terms = vectorizer.get_feature_names_out()
+
+    # (classes x tweets) @ (tweets x terms) -> (classes x terms)
+    indicator = sparse.csr_matrix(
+        (np.ones(len(labels), dtype=np.int32), (label_idx, np.arange(len(labels)))),
+        shape=(len(classes), len(labels)),
+    )
+    counts = (indicator @ X).toarray()
+    counts[:, np.char.isdigit(terms.astype(str))] = 0
+
+    frequencies = {}
+    for i, label in enumerate(classes):
+        row = counts[i]
+        k = min(max_words, np.count_nonzero(row))
+        if k == 0:
+            frequencies[label.item()] = {}
+            continue
+        top = np.argpartition(row, -k)[-k:]
+        top = top[np.argsort(row[top])[::-1]]
+        frequencies[label.item()] = {str(terms[j]): int(row[j]) for j in top}
+    return frequencies
+
+
+# =========================
+# RENDERING
+# =========================
+def render_wordcloud(frequencies, path, max_words=MAX_WORDS):
+    """Renders one cloud from {term: count} and saves it as an image; returns path."""
+    from wordcloud import WordCloud
+
+    WordCloud(max_words=max_words, **WORDCLOUD_OPTIONS).generate_from_frequencies(frequencies).to_file(path)
+    return path
+
+
+def render_wordclouds(clouds, out_dir, max_words=MAX_WORDS, workers=None):
+    """
+    clouds: {file name: {term: count}}. Renders all clouds in parallel
+    processes into out_dir; returns {file name: path}.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    names = list(clouds)
+    paths = [os.path.join(out_dir, name) for name in names]
+    workers = workers or min(len(names), os.cpu_count() or 1)
+
+    if workers <= 1:
+        done = [render_wordcloud(clouds[n], p, max_words) for n, p in zip(names, paths)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            done = list(pool.map(render_wordcloud, [clouds[n] for n in names], paths, [max_words] * len(names)))
+    return dict(zip(names, done))
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+DAY09 – report.py SCALING BENCHMARK
+
+Generates realistic synthetic subjects.txt files (10k, 100k and 1M lines by
+default, plus 10M with --include-10m; all title shapes from bench_titles.py)
+and times every stage of the report separately:
+  pipeline        : the streaming path main() uses (read + normalize + all outputs)
+  read            : read_subjects_txt
+  normalize       : normalize_title for every line, into a NormalizedRowTable
+  csv_write       : write_normalized_csv
+  compute_missing : compute_missing
+  coverage        : compute_assignment_coverage
+  markdown        : write_report_md
+
+Each size runs in a fresh process; after every stage the process peak RSS
+so far is recorded. Results are saved as JSON (with the git commit), so runs
+can be compared across commits with --compare.
+
+Usage:
+  python day09/bench_report.py
+  python day09/bench_report.py --include-10m
+  python day09/bench_report.py --sizes 10000 100000 --compare day09/bench_results/old.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+import report
+from bench_titles import synthetic_titles
+
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+LARGE_SIZE = 10_000_000  # opt-in: ~1 GB of input and minutes per stage
+RESULTS_DIR = report.BASE_DIR / "bench_results"
+
+
+# -----------------------------
+# SYNTHETIC INPUT
+# -----------------------------
+def generate_subjects(path: Path, n: int, seed: int = 0) -> Path:
+    """
+    Writes n lines shaped like a GitHub issues export:
+      issue_id<TAB>state<TAB>title<TAB>labels<TAB>timestamp
+    newest issue first, as in the real subjects.txt.
+    """
+    rng = random.Random(seed)
+    start = datetime(2025, 10, 1, tzinfo=timezone.utc)
+    with path.open("w", encoding="utf-8") as f:
+        for i, title in enumerate(synthetic_titles(n, seed)):
+            issue_id = n - i
+            state = "CLOSED" if rng.random() < 0.3 else "OPEN"
+            ts = start + timedelta(seconds=issue_id * 37 + rng.randint(0, 3600))
+            f.write(f"{issue_id}\t{state}\t{title}\t\t{ts.strftime('%Y-%m-%dT%H:%M:%SZ')}\n")
+    return path
+
+
+def subjects_file(work_dir: Path, n: int, seed: int) -> Path:
+    """Generated files are kept in work_dir and reused."""
+    path = work_dir / f"subjects_{n}_{seed}.txt"
+    if not path.exists():
+        tmp = generate_subjects(path.with_suffix(".tmp"), n, seed)
+        tmp.replace(path)
+    return path
+
+
+# -----------------------------
+# MEASUREMENT (runs in a fresh process per size)
+# -----------------------------
+def _peak_rss_mb() -> Optional[float]:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / 2**20 if sys.platform == "darwin" else peak / 2**10
+
+
+def run_size(path: Path, out_dir: Path) -> Dict:
+    required = report.REQUIRED_ASSIGNMENTS
+    stages: Dict[str, Dict] = {}
+
+    def timed(name: str, fn: Callable):
+        start = time.perf_counter()
+        result = fn()
+        stages[name] = {"seconds": time.perf_counter() - start, "peak_rss_mb": _peak_rss_mb()}
+        return result
+
+    def pipeline() -> None:
+        rows = report.stream_normalized_titles(path, out_dir / "normalized_titles.csv")
+        submissions, missing = report.compute_missing(rows, required)
+        report.write_missing_csv(missing, out_dir / "missing_submissions.csv")
+        report.write_report_md(submissions, missing, required, out_dir / "missing_submissions_report.md")
+
+    # first, so its peak RSS isn't hidden by the materialized stages below
+    timed("pipeline", pipeline)
+    report.normalize_title.cache_clear()
+
+    records = timed("read", lambda: report.read_subjects_txt(path))
+    rows = timed("normalize", lambda: report.NormalizedRowTable(report.iter_normalized_rows(records)))
+    del records
+    timed("csv_write", lambda: report.write_normalized_csv(rows, out_dir / "normalized_titles.csv"))
+    submissions, missing = timed("compute_missing", lambda: report.compute_missing(rows, required))
+    timed("coverage", lambda: report.compute_assignment_coverage(submissions, required))
+    timed(
+        "markdown",
+        lambda: report.write_report_md(submissions, missing, required, out_dir / "missing_submissions_report.md"),
+    )
+
+    lines = len(rows)
+    return {
+        "lines": lines,
+        "file_bytes": path.stat().st_size,
+        "students": len(submissions),
+        "lines_per_sec": lines / stages["pipeline"]["seconds"] if stages["pipeline"]["seconds"] else None,
+        "stages": stages,
+    }
+
+
+# -----------------------------
+# RESULTS
+# -----------------------------
+def _git_commit() -> str:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=report.BASE_DIR, capture_output=True, text=True, check=True,
+        )
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def print_results(results: List[Dict], baseline: Optional[Dict] = None) -> None:
+    base_by_lines = {r["lines"]: r for r in (baseline or {}).get("results", [])}
+    for r in results:
+        print(f"\n{r['lines']:,} lines ({r['file_bytes'] / 2**20:.1f} MiB), {r['students']:,} students")
+        base = base_by_lines.get(r["lines"])
+        for name, st in r["stages"].items():
+            rss = f"{st['peak_rss_mb']:>9.1f} MiB" if st["peak_rss_mb"] is not None else "      n/a"
+            line = f"  {name:<16} {st['seconds']:>9.3f} s   peak RSS {rss}"
+            if base and name in base["stages"] and st["seconds"]:
+                line += f"   x{base['stages'][name]['seconds'] / st['seconds']:.2f} vs baseline"
+            print(line)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="day09 report.py scaling benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="lines per synthetic file")
+    parser.add_argument("--include-10m", action="store_true", help=f"also run {LARGE_SIZE:,} lines")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--work-dir", type=Path, default=Path(tempfile.gettempdir()) / "day09_bench",
+                        help="where synthetic inputs and outputs are written (inputs are reused)")
+    parser.add_argument("--out", type=Path, default=None, help="results JSON (default: bench_results/<commit>-<time>.json)")
+    parser.add_argument("--compare", type=Path, default=None, help="earlier results JSON to compare against")
+    args = parser.parse_args()
+    sizes = list(args.sizes)
+    if args.include_10m and LARGE_SIZE not in sizes:
+        sizes.append(LARGE_SIZE)
+
+    args.work_dir.mkdir(parents=True, exist_ok=True)
+    commit = _git_commit()
+
+    results: List[Dict] = []
+    for n in sizes:
+        path = subjects_file(args.work_dir, n, args.seed)
+        out_dir = args.work_dir / f"out_{n}"
+        out_dir.mkdir(exist_ok=True)
+        # fresh process per size: clean peak RSS and cold normalize_title cache
+        with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as pool:
+            result = pool.submit(run_size, path, out_dir).result()
+        results.append(result)
+        print(f"done: {n:,} lines in {sum(s['seconds'] for s in result['stages'].values()):.1f} s")
+
+    data = {
+        "commit": commit,
+        "created": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": args.seed,
+        "results": results,
+    }
+
+    out = args.out
+    if out is None:
+        RESULTS_DIR.mkdir(exist_ok=True)
+        out = RESULTS_DIR / f"{commit}-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
+    out.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+    baseline = json.loads(args.compare.read_text(encoding="utf-8")) if args.compare else None
+    print_results(results, baseline)
+    print(f"\nWrote: {out}")
+
+
+if __name__ == "__main__":
+    main()
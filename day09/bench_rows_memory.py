@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+DAY09 – NormalizedRow MEMORY BENCHMARK
+
+Builds N normalized rows from synthetic titles (see bench_titles.py) and
+measures, with tracemalloc, how much memory holding them takes as:
+  - legacy : List of the original NormalizedRow (frozen dataclass, no __slots__)
+  - slotted: List of report.NormalizedRow (__slots__)
+  - table  : report.NormalizedRowTable (interned, columnar arrays)
+
+Usage:
+  python day09/bench_rows_memory.py            # 1,000,000 rows
+  python day09/bench_rows_memory.py -n 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import tracemalloc
+from dataclasses import dataclass
+from typing import Callable, Iterable, Iterator, List, Tuple
+
+import report
+from bench_titles import synthetic_titles
+
+
+# -----------------------------
+# LEGACY REFERENCE (before __slots__ / columnar storage)
+# -----------------------------
+@dataclass(frozen=True)
+class LegacyNormalizedRow:
+    issue_id: int
+    state: str
+    raw_title: str
+    student: str
+    assignments: Tuple[str, ...]
+    format_tag: str
+
+
+def _fresh(s: str) -> str:
+    """A new, equal str object (like one decoded from a file line)."""
+    return (s + " ")[:-1]
+
+
+def synthetic_records(n: int, seed: int = 0) -> Iterator[Tuple[int, str, str]]:
+    """(issue_id, state, title) like iter_subjects_txt yields; every string is a fresh object."""
+    for i, title in enumerate(synthetic_titles(n, seed)):
+        yield i, _fresh("OPEN" if i % 3 else "CLOSED"), _fresh(title)
+
+
+def _normalized(records: Iterable[Tuple[int, str, str]], row_cls) -> Iterator:
+    for issue_id, state, raw_title in records:
+        student, assignments, format_tag = report.normalize_title(raw_title)
+        # fresh copies, as if every row had been normalized on its own
+        yield row_cls(issue_id, state, raw_title, _fresh(student), tuple(assignments), _fresh(format_tag))
+
+
+# -----------------------------
+# BENCHMARK
+# -----------------------------
+def measure(build: Callable[[], object]) -> Tuple[int, int]:
+    """Returns (retained bytes, peak bytes) while building and holding the result."""
+    report.normalize_title.cache_clear()
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    # don't count the normalize_title cache as row storage
+    report.normalize_title.cache_clear()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return retained, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="NormalizedRow memory benchmark")
+    parser.add_argument("-n", type=int, default=1_000_000, help="number of rows")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    cases: List[Tuple[str, Callable[[], object]]] = [
+        ("legacy", lambda: list(_normalized(synthetic_records(args.n, args.seed), LegacyNormalizedRow))),
+        ("slotted", lambda: list(_normalized(synthetic_records(args.n, args.seed), report.NormalizedRow))),
+        ("table", lambda: report.NormalizedRowTable(
+            _normalized(synthetic_records(args.n, args.seed), report.NormalizedRow)
+        )),
+    ]
+
+    print(f"Rows: {args.n:,}")
+    baseline = None
+    for name, build in cases:
+        retained, peak = measure(build)
+        baseline = baseline or retained
+        print(
+            f"{name:<8} retained {retained / 2**20:>9.1f} MiB"
+            f"  ({retained / args.n:>6.1f} B/row, x{baseline / retained:.2f} smaller)"
+            f"  peak {peak / 2**20:>9.1f} MiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+DAY09 – normalize_title() THROUGHPUT BENCHMARK
+
+Generates a synthetic corpus of issue titles (same shapes as subjects.txt)
+and measures titles/sec for:
+  - legacy : the original regex-per-check implementation (kept below as reference)
+  - compiled: report.normalize_title without its cache
+  - cached  : report.normalize_title with its LRU cache (cold start)
+
+Usage:
+  python day09/bench_titles.py            # 1,000,000 titles
+  python day09/bench_titles.py -n 200000 --seed 7
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import time
+from typing import Callable, Iterator, List, Tuple
+
+import report
+
+
+# -----------------------------
+# SYNTHETIC CORPUS
+# -----------------------------
+FIRST_NAMES = [
+    "Noya", "Lior", "Guy", "Einav", "Rachel", "Noam", "Yana", "Shelly", "Adi", "Inbar",
+    "Raz", "Neta", "David", "Aileen", "Evyatar", "Lihi", "Arad", "Sana", "Achinoam", "Hallel",
+    "Avigail", "Daniela", "Rony", "Ariel", "Shoshana", "Anvita", "Adib", "Sriashwin", "Maya", "Omer",
+]
+LAST_NAMES = [
+    "Levy", "Batat", "Shemesh", "Litvak", "Steinitz Eliyahu", "Ariel", "Lerner", "Gilad", "Moses",
+    "Perets", "Leibson", "Hanuka", "Ganem", "Cohen", "Shaked", "Bolokan", "Zulti", "Khatib",
+    "Shoham", "Azulai", "Yariv", "Huppert Revach", "Holdengreber", "Hindi", "Sernik", "Pant",
+    "Masharqa", "Sridharan", "Vosco", "Steinitz-Eliyahu",
+]
+
+# every shape normalize_title knows about (plus a few it doesn't)
+TITLE_SHAPES = [
+    "Day{d:02d} by {name}",
+    "day{d:02d} by {name}",
+    "day {d:02d} by {name}",
+    "Day {d} by {name}",
+    "day{d:02d}-{name}",
+    "Day {d:02d} - {name}",
+    "day{d:02d} {name}",
+    "Day {d} {name}",
+    "day {d:02d} and {e:02d} - {name}",
+    "Day{d:02d} and Day{e:02d} by {name}",
+    "Final Project proposal by {name}",
+    "day {d:02d} and proposal for final project-{name}",
+    "Project submission by {name}",
+    "question about day{d:02d}",
+    "Help needed",
+]
+
+
+def synthetic_titles(n: int, seed: int = 0) -> Iterator[str]:
+    """
+    Yields n random titles. Names and day numbers come from small pools,
+    so (like the real data) many titles repeat.
+    """
+    rng = random.Random(seed)
+    for _ in range(n):
+        name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+        if rng.random() < 0.1:
+            name = name.lower()
+        d = rng.randint(1, 12)
+        yield rng.choice(TITLE_SHAPES).format(d=d, e=d + 1, name=name)
+
+
+# -----------------------------
+# LEGACY REFERENCE (before precompiling + caching)
+# -----------------------------
+def _legacy_normalize_spaces(s: str) -> str:
+    return re.sub(r"\s+", " ", (s or "").strip())
+
+
+def _legacy_normalize_student_name(name: str) -> str:
+    if not name:
+        return "UNKNOWN"
+    s = _legacy_normalize_spaces(name)
+    s = re.sub(r"\s*-\s*", " ", s)
+    s = _legacy_normalize_spaces(s)
+    return " ".join(part.capitalize() for part in s.split(" "))
+
+
+def legacy_normalize_title(raw_title: str) -> Tuple[str, Tuple[str, ...], str]:
+    t = _legacy_normalize_spaces(raw_title)
+    tl = t.lower()
+
+    assignments: List[str] = []
+
+    if (
+        "final project proposal" in tl
+        or "project proposal" in tl
+        or "proposal for final project" in tl
+        or ("proposal" in tl and "final project" in tl)
+    ):
+        assignments.append("final_project_proposal")
+
+    if "project submission" in tl:
+        assignments.append("project_submission")
+
+    day_nums = [int(x) for x in re.findall(r"\bday\s*(\d+)\b", tl)]
+
+    m_and = re.search(r"\bday\s*(\d+)\s*(?:and|&)\s*(\d+)\b", tl)
+    if m_and:
+        day_nums.append(int(m_and.group(2)))
+
+    for n in day_nums:
+        key = f"day{n:02d}"
+        if key not in assignments:
+            assignments.append(key)
+
+    if not assignments:
+        assignments = ["unknown_assignment"]
+
+    student = "UNKNOWN"
+    format_tag = "other"
+
+    m = re.search(r"\bby\b\s+(.+)$", t, flags=re.IGNORECASE)
+    if m:
+        student = m.group(1).strip()
+        format_tag = "has_by"
+    else:
+        if "-" in t:
+            candidate = t.split("-")[-1].strip()
+            if candidate and not re.search(r"\bday\b|\bproject\b", candidate, re.IGNORECASE):
+                student = candidate
+                format_tag = "has_dash"
+        else:
+            m2 = re.match(r"^\s*(day\s*\d+|day\d+)\s+(.+?)\s*$", t, flags=re.IGNORECASE)
+            if m2:
+                student = m2.group(2).strip()
+                format_tag = "day_then_name"
+
+    student = _legacy_normalize_student_name(student)
+
+    return student, tuple(assignments), format_tag
+
+
+# -----------------------------
+# BENCHMARK
+# -----------------------------
+def measure(fn: Callable[[str], object], titles: List[str]) -> float:
+    """Returns titles/sec for fn over titles."""
+    start = time.perf_counter()
+    for t in titles:
+        fn(t)
+    elapsed = time.perf_counter() - start
+    return len(titles) / elapsed if elapsed else float("inf")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="normalize_title() throughput benchmark")
+    parser.add_argument("-n", type=int, default=1_000_000, help="number of synthetic titles")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    titles = list(synthetic_titles(args.n, args.seed))
+    print(f"Corpus: {len(titles):,} titles, {len(set(titles)):,} distinct")
+
+    uncached = report.normalize_title.__wrapped__
+    mismatches = sum(1 for t in set(titles) if uncached(t) != legacy_normalize_title(t))
+    print(f"Mismatches vs legacy: {mismatches}")
+
+    legacy_rate = measure(legacy_normalize_title, titles)
+    compiled_rate = measure(uncached, titles)
+    report.normalize_title.cache_clear()
+    cached_rate = measure(report.normalize_title, titles)
+
+    print(f"{'legacy':<10} {legacy_rate:>14,.0f} titles/sec")
+    print(f"{'compiled':<10} {compiled_rate:>14,.0f} titles/sec  (x{compiled_rate / legacy_rate:.2f})")
+    print(f"{'cached':<10} {cached_rate:>14,.0f} titles/sec  (x{cached_rate / legacy_rate:.2f})")
+    print(report.normalize_title.cache_info())
+
+
+if __name__ == "__main__":
+    main()
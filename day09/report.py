@@ -9,6 +9,9 @@ OUTPUT (written into the same folder):
   - normalized_titles.csv
   - missing_submissions.csv
   - missing_submissions_report.md
+  - report_checkpoint.json  (state for --incremental re-runs)
+  - student_aliases.json    (canonical student names, with --dedupe-names)
+  - snapshot_diff.csv + missing_delta.csv  (with --diff OLD_SUBJECTS)
 
 What the report includes:
   - per-student missing required assignments (based on REQUIRED_ASSIGNMENTS list)
@@ -17,13 +20,25 @@ What the report includes:
 
 from __future__ import annotations
 
+import argparse
 import csv
+import hashlib
+import heapq
+import json
+import mmap
 import re
+import shutil
+import tempfile
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from collections import defaultdict
+from functools import lru_cache
+from itertools import islice
+from collections import defaultdict, deque
+from collections.abc import Mapping, Sequence
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Set, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 
 # -----------------------------
@@ -59,6 +74,8 @@ REPORT_MD_PATH = BASE_DIR / "missing_submissions_report.md"
 # -----------------------------
 @dataclass(frozen=True)
 class NormalizedRow:
+    __slots__ = ("issue_id", "state", "raw_title", "student", "assignments", "format_tag")
+
     issue_id: int
     state: str
     raw_title: str
@@ -66,12 +83,104 @@ class NormalizedRow:
     assignments: Tuple[str, ...]
     format_tag: str
 
+    def __reduce__(self):
+        # frozen + __slots__ can't be restored by the default pickle path
+        return (NormalizedRow, (self.issue_id, self.state, self.raw_title, self.student, self.assignments, self.format_tag))
+
+
+class _Interner:
+    """Maps equal values to one shared object and a small integer code."""
+
+    def __init__(self) -> None:
+        self.values: List = []
+        self.codes: Dict = {}
+
+    def code(self, value) -> int:
+        c = self.codes.get(value)
+        if c is None:
+            c = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return c
+
+
+class NormalizedRowTable(Sequence):
+    """
+    Compact, columnar storage for many NormalizedRow's.
+
+    Every column is an array of integer codes into an interned value table
+    (states, titles, students, assignment tuples, format tags are shared),
+    plus one array of issue ids. Indexing / iterating gives back
+    NormalizedRow objects, so code written for List[NormalizedRow] works as is.
+    """
+
+    def __init__(self, rows: Iterable[NormalizedRow] = ()) -> None:
+        self.issue_ids = array("q")
+        self.state_codes = array("I")
+        self.title_codes = array("I")
+        self.student_codes = array("I")
+        self.assignment_codes = array("I")
+        self.format_codes = array("I")
+
+        self._states = _Interner()
+        self._titles = _Interner()
+        self._students = _Interner()
+        self._assignments = _Interner()
+        self._formats = _Interner()
+
+        for r in rows:
+            self.append(r)
+
+    def append(self, r: NormalizedRow) -> None:
+        self.issue_ids.append(r.issue_id)
+        self.state_codes.append(self._states.code(r.state))
+        self.title_codes.append(self._titles.code(r.raw_title))
+        self.student_codes.append(self._students.code(r.student))
+        self.assignment_codes.append(self._assignments.code(r.assignments))
+        self.format_codes.append(self._formats.code(r.format_tag))
+
+    def __len__(self) -> int:
+        return len(self.issue_ids)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        return NormalizedRow(
+            issue_id=self.issue_ids[i],
+            state=self._states.values[self.state_codes[i]],
+            raw_title=self._titles.values[self.title_codes[i]],
+            student=self._students.values[self.student_codes[i]],
+            assignments=self._assignments.values[self.assignment_codes[i]],
+            format_tag=self._formats.values[self.format_codes[i]],
+        )
+
 
 # -----------------------------
 # NORMALIZATION HELPERS
 # -----------------------------
+# normalize_title() results are memoized per raw title (titles repeat a lot:
+# re-filed / reopened issues). Bounded so huge exports can't grow it forever.
+TITLE_CACHE_SIZE = 65536
+
+_SPACES_RE = re.compile(r"\s+")
+_DASH_RE = re.compile(r"\s*-\s*")
+
+# Single scan over the lower-cased title. Each match is either:
+#   - a keyword (zero-width lookahead, so overlapping phrases such as
+#     "final project proposal" are all seen), or
+#   - "day NN", optionally followed by "and MM" / "& MM".
+#     group 3 is set only when "day NN" ends on a word boundary.
+_TITLE_TOKEN_RE = re.compile(
+    r"(?=(project proposal|project submission|final project|proposal))"
+    r"|\bday\s*(\d+)(\b)?(?:\s*(?:and|&)\s*(\d+)\b)?"
+)
+
+_BY_NAME_RE = re.compile(r"\bby\b\s+(.+)$", re.IGNORECASE)
+_DAY_OR_PROJECT_RE = re.compile(r"\bday\b|\bproject\b", re.IGNORECASE)
+_DAY_THEN_NAME_RE = re.compile(r"^\s*(day\s*\d+|day\d+)\s+(.+?)\s*$", re.IGNORECASE)
+
+
 def normalize_spaces(s: str) -> str:
-    return re.sub(r"\s+", " ", (s or "").strip())
+    return _SPACES_RE.sub(" ", (s or "").strip())
 
 
 def normalize_student_name(name: str) -> str:
@@ -88,55 +197,78 @@ def normalize_student_name(name: str) -> str:
     s = normalize_spaces(name)
 
     # normalize dash spacing: turn "Rachel - Steinitz" into "Rachel Steinitz"
-    s = re.sub(r"\s*-\s*", " ", s)
+    s = _DASH_RE.sub(" ", s)
     s = normalize_spaces(s)
 
     # title-case each word (keeps it simple and stable)
     return " ".join(part.capitalize() for part in s.split(" "))
 
 
+def is_known_student(student: str) -> bool:
+    """False for titles without a usable name ("UNKNOWN", or empty as in "Day01 by -")."""
+    return bool(student) and student != "UNKNOWN"
+
+
 def _norm_day(n: int) -> str:
     return f"day{n:02d}"
 
 
-def normalize_title(raw_title: str) -> Tuple[str, Tuple[str, ...], str]:
+def _parse_assignments(tl: str) -> List[str]:
     """
-    Returns:
-      student, assignments(tuple), format_tag
-
-    assignments are normalized to:
-      dayXX, final_project_proposal, project_submission, unknown_assignment
+    Detects assignments in a lower-cased, space-normalized title
+    with one pass of _TITLE_TOKEN_RE.
     """
-    t = normalize_spaces(raw_title)
-    tl = t.lower()
+    keywords: Set[str] = set()
+    day_nums: List[int] = []
+    and_num: Optional[int] = None
+
+    for m in _TITLE_TOKEN_RE.finditer(tl):
+        keyword, day, day_boundary, second_day = m.groups()
+        if keyword:
+            keywords.add(keyword)
+            continue
+        # day numbers (day 05, day05, Day 8, etc.)
+        if day_boundary is not None:
+            day_nums.append(int(day))
+        # catch: "day 05 and 06" (first occurrence only)
+        if second_day is not None and and_num is None:
+            and_num = int(second_day)
 
     assignments: List[str] = []
 
     # detect proposal-like
-    if (
-        "final project proposal" in tl
-        or "project proposal" in tl
-        or "proposal for final project" in tl
-        or ("proposal" in tl and "final project" in tl)
-    ):
+    if "project proposal" in keywords or ("proposal" in keywords and "final project" in keywords):
         assignments.append("final_project_proposal")
 
-    if "project submission" in tl:
+    if "project submission" in keywords:
         assignments.append("project_submission")
 
-    # day numbers (day 05, day05, Day 8, etc.)
-    day_nums = [int(x) for x in re.findall(r"\bday\s*(\d+)\b", tl)]
-
-    # catch: "day 05 and 06"
-    m_and = re.search(r"\bday\s*(\d+)\s*(?:and|&)\s*(\d+)\b", tl)
-    if m_and:
-        day_nums.append(int(m_and.group(2)))
+    if and_num is not None:
+        day_nums.append(and_num)
 
     for n in day_nums:
         key = _norm_day(n)
         if key not in assignments:
             assignments.append(key)
 
+    return assignments
+
+
+@lru_cache(maxsize=TITLE_CACHE_SIZE)
+def normalize_title(raw_title: str) -> Tuple[str, Tuple[str, ...], str]:
+    """
+    Returns:
+      student, assignments(tuple), format_tag
+
+    assignments are normalized to:
+      dayXX, final_project_proposal, project_submission, unknown_assignment
+
+    Results are cached per raw title (see TITLE_CACHE_SIZE);
+    normalize_title.cache_info() / cache_clear() work as usual.
+    """
+    t = normalize_spaces(raw_title)
+
+    assignments = _parse_assignments(t.lower())
     if not assignments:
         assignments = ["unknown_assignment"]
 
@@ -145,21 +277,21 @@ def normalize_title(raw_title: str) -> Tuple[str, Tuple[str, ...], str]:
     format_tag = "other"
 
     # "... by NAME"
-    m = re.search(r"\bby\b\s+(.+)$", t, flags=re.IGNORECASE)
+    m = _BY_NAME_RE.search(t)
     if m:
         student = m.group(1).strip()
         format_tag = "has_by"
     else:
         # "...-NAME" (dash at end)
         if "-" in t:
-            candidate = t.split("-")[-1].strip()
+            candidate = t.rsplit("-", 1)[-1].strip()
             # avoid taking "project ..." etc as name
-            if candidate and not re.search(r"\bday\b|\bproject\b", candidate, re.IGNORECASE):
+            if candidate and not _DAY_OR_PROJECT_RE.search(candidate):
                 student = candidate
                 format_tag = "has_dash"
         else:
             # "day06 NAME"
-            m2 = re.match(r"^\s*(day\s*\d+|day\d+)\s+(.+?)\s*$", t, flags=re.IGNORECASE)
+            m2 = _DAY_THEN_NAME_RE.match(t)
             if m2:
                 student = m2.group(2).strip()
                 format_tag = "day_then_name"
@@ -172,197 +304,1212 @@ def normalize_title(raw_title: str) -> Tuple[str, Tuple[str, ...], str]:
 # -----------------------------
 # STEP 1: READ + CLEAN INPUT
 # -----------------------------
-def read_subjects_txt(subjects_path: Path) -> List[Tuple[int, str, str]]:
+def _parse_subject_line(line: str) -> Optional[Tuple[int, str, str]]:
     """
-    Reads subjects.txt which is expected to be tab-separated.
-    We only need:
-      issue_id, state, title
+    Parses one tab-separated line into (issue_id, state, title).
+    Returns None for empty/bad lines.
+    """
+    if not line.strip():
+        return None
 
-    Accepts lines with >=3 columns; ignores empty/bad lines safely.
+    parts = line.split("\t")
+    if len(parts) < 3:
+        return None
+
+    try:
+        issue_id = int(parts[0].strip())
+    except ValueError:
+        return None
+
+    state = normalize_spaces(parts[1])
+    title = parts[2].strip()
+
+    return issue_id, state, title
+
+
+@dataclass
+class ReadCursor:
+    """
+    Tracks how far iter_subjects_txt() got in the file:
+      offset: byte offset just after the last line read
+      ends_with_newline: False if the last line read had no trailing newline
+      max_issue_id: highest issue_id seen
     """
+    offset: int = 0
+    ends_with_newline: bool = True
+    max_issue_id: Optional[int] = None
+
+
+def _require_subjects_file(subjects_path: Path) -> None:
     if not subjects_path.exists():
         raise FileNotFoundError(
             f"Cannot find input file: {subjects_path}\n"
             f"Tip: put 'subjects.txt' next to this script ({BASE_DIR})."
         )
 
-    lines = subjects_path.read_text(encoding="utf-8").splitlines()
-    out: List[Tuple[int, str, str]] = []
 
-    for line in lines:
-        if not line.strip():
-            continue
+def iter_subjects_txt(
+    subjects_path: Path,
+    start: int = 0,
+    cursor: Optional[ReadCursor] = None,
+    complete_lines_only: bool = False,
+    stop: Optional[int] = None,
+) -> Iterator[Tuple[int, str, str]]:
+    """
+    Lazily reads subjects.txt which is expected to be tab-separated.
+    We only need:
+      issue_id, state, title
 
-        parts = line.split("\t")
-        if len(parts) < 3:
-            continue
+    Lines are read one at a time, so memory does not grow with the file size.
+    Reading starts at byte offset `start` (must be the start of a line);
+    if a cursor is given it is updated as lines are consumed.
+    With complete_lines_only, a last line without newline (still being
+    written) is left unread. With `stop` (a line start), reading ends there.
+    Accepts lines with >=3 columns; ignores empty/bad lines safely.
+    """
+    _require_subjects_file(subjects_path)
 
-        try:
-            issue_id = int(parts[0].strip())
-        except ValueError:
-            continue
+    if cursor is None:
+        cursor = ReadCursor()
+    cursor.offset = start
 
-        state = normalize_spaces(parts[1])
-        title = parts[2].strip()
+    def _records() -> Iterator[Tuple[int, str, str]]:
+        with subjects_path.open("rb") as f:
+            f.seek(start)
+            for raw in f:
+                if stop is not None and cursor.offset >= stop:
+                    break
+                if complete_lines_only and not raw.endswith(b"\n"):
+                    break
+                cursor.offset += len(raw)
+                cursor.ends_with_newline = raw.endswith(b"\n")
+                record = _parse_subject_line(raw.decode("utf-8").rstrip("\r\n"))
+                if record is None:
+                    continue
+                if cursor.max_issue_id is None or record[0] > cursor.max_issue_id:
+                    cursor.max_issue_id = record[0]
+                yield record
+
+    return _records()
+
+
+_ISO_TIMESTAMP_RE = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z$")
+
+
+def iter_subject_records(subjects_path: Path) -> Iterator[Tuple[int, str, str, Optional[str]]]:
+    """
+    Like iter_subjects_txt(), but also keeps the timestamp column:
+      issue_id, state, title, timestamp
+    timestamp is the last column that looks like an ISO time
+    ("2026-01-03T18:44:38Z"), or None.
+    """
+    _require_subjects_file(subjects_path)
+
+    def _records() -> Iterator[Tuple[int, str, str, Optional[str]]]:
+        with subjects_path.open("rb") as f:
+            for raw in f:
+                line = raw.decode("utf-8").rstrip("\r\n")
+                record = _parse_subject_line(line)
+                if record is None:
+                    continue
+                timestamp = None
+                for col in reversed(line.split("\t")[3:]):
+                    col = col.strip()
+                    if _ISO_TIMESTAMP_RE.match(col):
+                        timestamp = col
+                        break
+                yield record + (timestamp,)
+
+    return _records()
 
-        out.append((issue_id, state, title))
 
-    return out
+def read_subjects_txt(subjects_path: Path) -> List[Tuple[int, str, str]]:
+    """
+    Same as iter_subjects_txt(), but returns a full list.
+    """
+    return list(iter_subjects_txt(subjects_path))
 
 
 # -----------------------------
 # STEP 2: NORMALIZE + WRITE normalized_titles.csv
 # -----------------------------
-def build_normalized_titles(subjects_path: Path, normalized_csv_path: Path) -> List[NormalizedRow]:
-    raw_rows = read_subjects_txt(subjects_path)
+NORMALIZED_CSV_HEADER = ["issue_id", "state", "raw_title", "student", "assignments", "format_tag"]
+
+# outputs are streamed through large write buffers instead of being built in memory
+OUTPUT_BUFFER_BYTES = 1 << 20
+
 
-    rows: List[NormalizedRow] = []
-    for issue_id, state, raw_title in raw_rows:
+def _normalized_csv_fields(r: NormalizedRow) -> list:
+    return [r.issue_id, r.state, r.raw_title, r.student, ";".join(r.assignments), r.format_tag]
+
+
+def write_normalized_csv(rows: Iterable[NormalizedRow], out_path: Path) -> None:
+    with out_path.open("w", encoding="utf-8", newline="", buffering=OUTPUT_BUFFER_BYTES) as f:
+        w = csv.writer(f)
+        w.writerow(NORMALIZED_CSV_HEADER)
+        w.writerows(_normalized_csv_fields(r) for r in rows)
+
+
+def iter_normalized_rows(records: Iterable[Tuple[int, str, str]]) -> Iterator[NormalizedRow]:
+    for issue_id, state, raw_title in records:
         student, assignments, format_tag = normalize_title(raw_title)
-        rows.append(
-            NormalizedRow(
-                issue_id=issue_id,
-                state=state,
-                raw_title=raw_title,
-                student=student,
-                assignments=assignments,
-                format_tag=format_tag,
-            )
+        yield NormalizedRow(
+            issue_id=issue_id,
+            state=state,
+            raw_title=raw_title,
+            student=student,
+            assignments=assignments,
+            format_tag=format_tag,
         )
 
-    with normalized_csv_path.open("w", encoding="utf-8", newline="") as f:
-        w = csv.writer(f)
-        w.writerow(["issue_id", "state", "raw_title", "student", "assignments", "format_tag"])
-        for r in rows:
-            w.writerow([r.issue_id, r.state, r.raw_title, r.student, ";".join(r.assignments), r.format_tag])
 
-    return rows
+# -----------------------------
+# STEP 2b: PARALLEL NORMALIZATION (--workers N)
+# -----------------------------
+# The file is memory-mapped and cut into newline-aligned byte ranges; each
+# range is parsed + normalized in a worker process and the results are
+# consumed in file order, so the output is identical to the serial run.
+# At most IN_FLIGHT_PER_WORKER ranges per worker are submitted or finished
+# but not yet consumed, so a slow consumer doesn't let results pile up.
+CHUNK_MIN_BYTES = 1 << 20
+CHUNKS_PER_WORKER = 4
+IN_FLIGHT_PER_WORKER = 2
+
+
+def split_line_ranges(
+    subjects_path: Path,
+    n_chunks: int,
+    start: int = 0,
+    min_chunk_bytes: int = CHUNK_MIN_BYTES,
+) -> List[Tuple[int, int]]:
+    """
+    Splits subjects.txt[start:] into at most n_chunks [begin, end) byte ranges.
+    Every range starts at the beginning of a line and ends just after a newline
+    (or at the end of the file).
+    """
+    size = subjects_path.stat().st_size
+    if size <= start:
+        return []
+
+    chunk_bytes = max(min_chunk_bytes, -(-(size - start) // max(1, n_chunks)))
+    ranges: List[Tuple[int, int]] = []
+
+    with subjects_path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        begin = start
+        while begin < size:
+            nl = mm.find(b"\n", min(begin + chunk_bytes, size) - 1)
+            end = size if nl == -1 else nl + 1
+            ranges.append((begin, end))
+            begin = end
+
+    return ranges
+
+
+def _normalize_range(task: Tuple[str, int, int]) -> Tuple[List[tuple], Optional[int]]:
+    """
+    Worker: parses + normalizes the lines in one byte range.
+    Returns (rows as plain tuples (cheaper to pickle), max issue_id in the range).
+    """
+    path, begin, end = task
+    rows: List[tuple] = []
+    max_issue_id: Optional[int] = None
+
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        pos = begin
+        while pos < end:
+            nl = mm.find(b"\n", pos, end)
+            line_end = end if nl == -1 else nl + 1
+            record = _parse_subject_line(mm[pos:line_end].decode("utf-8").rstrip("\r\n"))
+            pos = line_end
+            if record is None:
+                continue
+            if max_issue_id is None or record[0] > max_issue_id:
+                max_issue_id = record[0]
+            issue_id, state, raw_title = record
+            rows.append((issue_id, state, raw_title) + normalize_title(raw_title))
+
+    return rows, max_issue_id
+
+
+def iter_normalized_rows_parallel(
+    subjects_path: Path,
+    workers: int,
+    start: int = 0,
+    cursor: Optional[ReadCursor] = None,
+    min_chunk_bytes: int = CHUNK_MIN_BYTES,
+) -> Iterator[NormalizedRow]:
+    """
+    Same rows, in the same order, as iter_normalized_rows(iter_subjects_txt(...)),
+    but normalized in a pool of `workers` processes. At most
+    IN_FLIGHT_PER_WORKER * workers ranges are in flight at any time.
+    """
+    _require_subjects_file(subjects_path)
+
+    if cursor is None:
+        cursor = ReadCursor()
+    cursor.offset = start
+
+    ranges = split_line_ranges(subjects_path, workers * CHUNKS_PER_WORKER, start, min_chunk_bytes)
+    tasks = [(str(subjects_path), begin, end) for begin, end in ranges]
+
+    def _rows() -> Iterator[NormalizedRow]:
+        pending: Iterator[Tuple[str, int, int]] = iter(tasks)
+        in_flight: deque = deque()
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for task in islice(pending, IN_FLIGHT_PER_WORKER * workers):
+                in_flight.append((task[2], pool.submit(_normalize_range, task)))
+            # consumed in submission order -> deterministic merge; one new range
+            # is submitted per range consumed, so the window stays bounded
+            while in_flight:
+                end, future = in_flight.popleft()
+                rows, max_issue_id = future.result()
+                for task in islice(pending, 1):
+                    in_flight.append((task[2], pool.submit(_normalize_range, task)))
+                for row in rows:
+                    yield NormalizedRow(*row)
+                if max_issue_id is not None and (cursor.max_issue_id is None or max_issue_id > cursor.max_issue_id):
+                    cursor.max_issue_id = max_issue_id
+                cursor.offset = end
+
+        if tasks:
+            with subjects_path.open("rb") as f:
+                f.seek(cursor.offset - 1)
+                cursor.ends_with_newline = f.read(1) == b"\n"
+
+    return _rows()
+
+
+def stream_normalized_titles(
+    subjects_path: Path,
+    normalized_csv_path: Path,
+    start: int = 0,
+    cursor: Optional[ReadCursor] = None,
+    workers: int = 1,
+    stop: Optional[int] = None,
+) -> Iterator[NormalizedRow]:
+    """
+    One-pass pipeline: reads subjects.txt lazily, normalizes each line,
+    writes it to normalized_titles.csv and yields it to the caller
+    (e.g. compute_missing). Only one row is held in memory at a time
+    (with workers > 1: at most IN_FLIGHT_PER_WORKER chunks per worker).
+
+    With start > 0 only the lines after that byte offset are read and the
+    rows are appended to an existing normalized_titles.csv.
+
+    With stop (newest-first export, see load_checkpoint) only the new lines
+    before that byte offset are read; their rows are written in front of the
+    existing normalized_titles.csv rows, and the cursor is moved to the end
+    of the file (the rest was processed by the previous run).
+    """
+    if stop is not None:
+        return _prepend_normalized_titles(subjects_path, normalized_csv_path, stop, cursor)
+    if workers > 1:
+        normalized = iter_normalized_rows_parallel(subjects_path, workers, start=start, cursor=cursor)
+    else:
+        normalized = iter_normalized_rows(iter_subjects_txt(subjects_path, start=start, cursor=cursor))
+    append = start > 0
+
+    def _rows() -> Iterator[NormalizedRow]:
+        mode = "a" if append else "w"
+        with normalized_csv_path.open(mode, encoding="utf-8", newline="", buffering=OUTPUT_BUFFER_BYTES) as f:
+            w = csv.writer(f)
+            if not append:
+                w.writerow(NORMALIZED_CSV_HEADER)
+            for r in normalized:
+                w.writerow(_normalized_csv_fields(r))
+                yield r
+
+    return _rows()
+
+
+def _prepend_normalized_titles(
+    subjects_path: Path,
+    normalized_csv_path: Path,
+    stop: int,
+    cursor: ReadCursor,
+) -> Iterator[NormalizedRow]:
+    processed_bytes, ends_with_newline = cursor.offset, cursor.ends_with_newline
+    normalized = iter_normalized_rows(iter_subjects_txt(subjects_path, cursor=cursor, stop=stop))
+
+    def _rows() -> Iterator[NormalizedRow]:
+        tmp_path = normalized_csv_path.with_suffix(".tmp")
+        with tmp_path.open("w", encoding="utf-8", newline="", buffering=OUTPUT_BUFFER_BYTES) as f:
+            w = csv.writer(f)
+            w.writerow(NORMALIZED_CSV_HEADER)
+            for r in normalized:
+                w.writerow(_normalized_csv_fields(r))
+                yield r
+        with normalized_csv_path.open("rb") as old, tmp_path.open("ab") as new:
+            old.readline()  # header
+            shutil.copyfileobj(old, new, OUTPUT_BUFFER_BYTES)
+        tmp_path.replace(normalized_csv_path)
+
+        cursor.offset = stop + processed_bytes
+        cursor.ends_with_newline = ends_with_newline
+
+    return _rows()
+
+
+def build_normalized_titles(subjects_path: Path, normalized_csv_path: Path) -> NormalizedRowTable:
+    return NormalizedRowTable(stream_normalized_titles(subjects_path, normalized_csv_path))
 
 
 # -----------------------------
 # STEP 3: COMPUTE "MISSING"
 # -----------------------------
-def compute_missing(rows: List[NormalizedRow], required: List[str]) -> Tuple[Dict[str, Set[str]], Dict[str, List[str]]]:
+def _required_list(required: Iterable[str]) -> List[str]:
+    return [x.strip().lower() for x in required if x.strip()]
+
+
+class SubmissionMatrix(Mapping):
+    """
+    Student x assignment matrix stored as bitsets.
+
+      - students and assignments are interned to integer indices
+      - student_masks[i]: bitmask of the assignments student i submitted
+      - assignment_counts[j]: column sum, i.e. how many students submitted j
+        (updated only when a student's mask gains a new bit)
+
+    Coverage reads the column sums, missing lists come from
+    (required_mask & ~student_mask). It also behaves like the old
+    Dict[str, Set[str]] (student -> set of assignments), read-only.
+    """
+
+    def __init__(self) -> None:
+        self.students: List[str] = []
+        self.student_index: Dict[str, int] = {}
+        self.student_masks: List[int] = []
+        self.assignments: List[str] = []
+        self.assignment_index: Dict[str, int] = {}
+        self.assignment_counts: List[int] = []
+
+    @classmethod
+    def from_dict(cls, submissions: Mapping) -> "SubmissionMatrix":
+        matrix = cls()
+        for student, submitted in submissions.items():
+            matrix.add(student, submitted)
+        return matrix
+
+    def _intern_assignment(self, assignment: str) -> int:
+        j = self.assignment_index.get(assignment)
+        if j is None:
+            j = len(self.assignments)
+            self.assignment_index[assignment] = j
+            self.assignments.append(assignment)
+            self.assignment_counts.append(0)
+        return j
+
+    def _intern_student(self, student: str) -> int:
+        i = self.student_index.get(student)
+        if i is None:
+            i = len(self.students)
+            self.student_index[student] = i
+            self.students.append(student)
+            self.student_masks.append(0)
+        return i
+
+    def add(self, student: str, assignments: Iterable[str]) -> None:
+        i = self._intern_student(student)
+        mask = self.student_masks[i]
+        for a in assignments:
+            j = self._intern_assignment(a.strip().lower())
+            bit = 1 << j
+            if not mask & bit:
+                mask |= bit
+                self.assignment_counts[j] += 1
+        self.student_masks[i] = mask
+
+    def required_mask(self, required: Iterable[str]) -> int:
+        """Bitmask of the required assignments (interning unseen ones)."""
+        mask = 0
+        for a in _required_list(required):
+            mask |= 1 << self._intern_assignment(a)
+        return mask
+
+    def _decode(self, mask: int) -> Set[str]:
+        return {a for j, a in enumerate(self.assignments) if mask >> j & 1}
+
+    def submission_counts(self) -> Dict[str, int]:
+        """student -> number of distinct assignments submitted"""
+        return {s: bin(mask).count("1") for s, mask in zip(self.students, self.student_masks)}
+
+    def merge_students(self, canonical: Mapping) -> "SubmissionMatrix":
+        """
+        Returns a new matrix where every student is renamed to canonical.get(student, student)
+        and the submissions of merged students are OR-ed together.
+        """
+        merged = SubmissionMatrix()
+        merged.assignments = list(self.assignments)
+        merged.assignment_index = dict(self.assignment_index)
+        merged.assignment_counts = [0] * len(self.assignments)
+
+        for student, mask in zip(self.students, self.student_masks):
+            i = merged._intern_student(canonical.get(student, student))
+            merged.student_masks[i] |= mask
+
+        for mask in merged.student_masks:
+            while mask:
+                low = mask & -mask
+                merged.assignment_counts[low.bit_length() - 1] += 1
+                mask ^= low
+        return merged
+
+    # --- Mapping API: student -> set(assignments submitted) ---
+    def __getitem__(self, student: str) -> Set[str]:
+        return self._decode(self.student_masks[self.student_index[student]])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.students)
+
+    def __len__(self) -> int:
+        return len(self.students)
+
+    def __contains__(self, student: object) -> bool:
+        return student in self.student_index
+
+    # --- aggregates ---
+    def missing(self, required: Iterable[str]) -> Dict[str, List[str]]:
+        """student -> sorted list(missing required assignments)"""
+        req_mask = self.required_mask(required)
+        # decode each distinct "missing" bit pattern once, in name order
+        by_name = sorted((a, 1 << self.assignment_index[a]) for a in set(_required_list(required)))
+        decoded: Dict[int, List[str]] = {}
+
+        missing: Dict[str, List[str]] = {}
+        for student, mask in zip(self.students, self.student_masks):
+            miss_mask = req_mask & ~mask
+            miss = decoded.get(miss_mask)
+            if miss is None:
+                miss = decoded[miss_mask] = [a for a, bit in by_name if miss_mask & bit]
+            missing[student] = list(miss)
+        return missing
+
+    def complete_students(self, required: Iterable[str]) -> List[str]:
+        """Students who submitted every required assignment (sorted)."""
+        req_mask = self.required_mask(required)
+        return sorted(s for s, mask in zip(self.students, self.student_masks) if req_mask & ~mask == 0)
+
+    def coverage(self, required: Iterable[str]) -> List[Tuple[str, int, int, float]]:
+        """(assignment, submitted, total, rate) per required assignment, lowest rate first."""
+        total = len(self.students)
+        results: List[Tuple[str, int, int, float]] = []
+        for a in _required_list(required):
+            j = self.assignment_index.get(a)
+            submitted_count = self.assignment_counts[j] if j is not None else 0
+            rate = (submitted_count / total) if total else 0.0
+            results.append((a, submitted_count, total, rate))
+
+        results.sort(key=lambda x: (x[3], x[0]))
+        return results
+
+
+def compute_missing(
+    rows: Iterable[NormalizedRow],
+    required: List[str],
+    submissions: Optional[Mapping] = None,
+) -> Tuple[SubmissionMatrix, Dict[str, List[str]]]:
     """
     Returns:
-      submissions: student -> set(assignments submitted)
+      submissions: SubmissionMatrix (student -> set(assignments submitted))
       missing: student -> sorted list(missing required assignments)
+
+    rows can be any iterable (e.g. the stream_normalized_titles() generator),
+    it is consumed once and never stored.
+    submissions (optional) seeds the result, e.g. from a checkpoint.
     """
-    required_set = {x.strip().lower() for x in required if x.strip()}
-    submissions: Dict[str, Set[str]] = defaultdict(set)
+    if isinstance(submissions, SubmissionMatrix):
+        matrix = submissions
+    else:
+        matrix = SubmissionMatrix.from_dict(submissions or {})
 
     for r in rows:
-        if r.student and r.student != "UNKNOWN":
-            for a in r.assignments:
-                submissions[r.student].add(a.strip().lower())
+        if is_known_student(r.student):
+            matrix.add(r.student, r.assignments)
 
-    missing: Dict[str, List[str]] = {}
-    for student, submitted in submissions.items():
-        miss = sorted(required_set - submitted)
-        missing[student] = miss
-
-    return submissions, missing
+    return matrix, matrix.missing(required)
 
 
 def compute_assignment_coverage(
-    submissions: Dict[str, Set[str]],
+    submissions: Mapping,
     required: List[str],
 ) -> List[Tuple[str, int, int, float]]:
-    required_list = [x.strip().lower() for x in required if x.strip()]
-    students = sorted(submissions.keys())
-    total = len(students)
+    if not isinstance(submissions, SubmissionMatrix):
+        submissions = SubmissionMatrix.from_dict(submissions)
+    return submissions.coverage(required)
+
+
+# -----------------------------
+# STEP 3b: DEDUPLICATE STUDENT NAMES (--dedupe-names)
+# -----------------------------
+# Typos and name variants ("Rachel Steinitz" vs "Rachel Steinitz Eliyahu")
+# are clustered into one canonical name. Candidates come from a blocking
+# index: two names can only match if they agree on two tokens (exactly, or
+# one of them up to a one-character typo), so every name is indexed under
+# keys built from token pairs and one-deletion variants of its tokens.
+# Each name is then only compared to the few names sharing a key with it,
+# which keeps the whole pass roughly linear in the number of names.
+# The resulting map is saved to student_aliases.json and reused (and can be
+# hand-edited): names already in it are never re-clustered.
+ALIASES_PATH = BASE_DIR / "student_aliases.json"
+ALIASES_VERSION = 1
+TYPO_MIN_TOKEN_LEN = 5
+
+
+def _name_tokens(name: str) -> List[str]:
+    return name.lower().split()
 
-    results: List[Tuple[str, int, int, float]] = []
-    for a in required_list:
-        submitted_count = sum(1 for s in students if a in submissions[s])
-        rate = (submitted_count / total) if total else 0.0
-        results.append((a, submitted_count, total, rate))
 
-    results.sort(key=lambda x: (x[3], x[0]))
-    return results
+def _typo_variants(token: str) -> Set[str]:
+    """
+    token plus every one-character deletion (except the first character).
+    Two tokens are within one edit (not at the first letter) only if
+    their variant sets intersect.
+    """
+    return {token} | {token[:i] + token[i + 1:] for i in range(1, len(token))}
+
+
+def _blocking_keys(name: str) -> Set[Tuple[str, str, str]]:
+    tokens = sorted(set(_name_tokens(name)))
+    keys: Set[Tuple[str, str, str]] = set()
+    for i, a in enumerate(tokens):
+        for b in tokens[i + 1:]:
+            keys.add(("=", a, b))
+        for b in tokens:
+            if b != a and len(b) >= TYPO_MIN_TOKEN_LEN:
+                keys.update(("~", a, v) for v in _typo_variants(b))
+    return keys
+
+
+def _within_one_edit(a: str, b: str) -> bool:
+    if a == b:
+        return True
+    if abs(len(a) - len(b)) > 1:
+        return False
+    if len(a) > len(b):
+        a, b = b, a
+    i = 0
+    while i < len(a) and a[i] == b[i]:
+        i += 1
+    if len(a) == len(b):
+        return a[i + 1:] == b[i + 1:]
+    return a[i:] == b[i + 1:]
+
+
+def names_match(a: str, b: str) -> bool:
+    """
+    Two normalized names are the same student if either:
+    - the tokens of one are a subset of the other's (>= 2 distinct tokens),
+      e.g. "Rachel Steinitz" / "Rachel Steinitz Eliyahu", "Levy Noya" / "Noya Levy"
+    - they have the same tokens except one, and those two differ by a single
+      typo (one edit, not in the first letter, tokens of >= 5 letters),
+      e.g. "Rachel Steinits" / "Rachel Steinitz"
+    """
+    sa, sb = set(_name_tokens(a)), set(_name_tokens(b))
+    if min(len(sa), len(sb)) < 2:
+        return False
+
+    if sa <= sb or sb <= sa:
+        return True
+
+    if len(sa) != len(sb):
+        return False
+    rest_a = sa - sb
+    rest_b = sb - sa
+    if len(rest_a) != 1 or len(rest_b) != 1:
+        return False
+    x, y = rest_a.pop(), rest_b.pop()
+    return min(len(x), len(y)) >= TYPO_MIN_TOKEN_LEN and x[0] == y[0] and _within_one_edit(x, y)
+
+
+def load_aliases(path: Path) -> Dict[str, str]:
+    if not path.exists():
+        return {}
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if data.get("version") != ALIASES_VERSION:
+        return {}
+    return dict(data.get("aliases", {}))
+
+
+def save_aliases(path: Path, aliases: Dict[str, str]) -> None:
+    data = {"version": ALIASES_VERSION, "aliases": dict(sorted(aliases.items()))}
+    path.write_text(json.dumps(data, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+
+
+def find_ambiguous_names(names: Iterable[str]) -> Dict[str, List[str]]:
+    """
+    Names that match two or more longer names which do not match each other,
+    e.g. "Noa Cohen" next to "Noa Cohen Levi" and "Noa Cohen Shapira": they
+    could be either student, so they must not be merged into any of them.
+
+    Returns name -> the conflicting longer names (sorted).
+    """
+    names = list(dict.fromkeys(names))
+    keys_of = {n: _blocking_keys(n) for n in names}
+    index: Dict[Tuple[str, str, str], List[str]] = defaultdict(list)
+    for n in names:
+        for key in keys_of[n]:
+            index[key].append(n)
+
+    ambiguous: Dict[str, List[str]] = {}
+    for n in names:
+        size = len(set(_name_tokens(n)))
+        longer = sorted({
+            other
+            for key in keys_of[n]
+            for other in index[key]
+            if len(set(_name_tokens(other))) > size and names_match(n, other)
+        })
+        conflicts = {
+            x
+            for i, a in enumerate(longer)
+            for b in longer[i + 1:]
+            if not names_match(a, b)
+            for x in (a, b)
+        }
+        if conflicts:
+            ambiguous[n] = sorted(conflicts)
+    return ambiguous
+
+
+def dedupe_student_names(
+    weights: Mapping,
+    aliases: Optional[Mapping] = None,
+    ambiguous: Optional[Dict[str, List[str]]] = None,
+) -> Dict[str, str]:
+    """
+    weights:   student -> how much evidence we have for that spelling
+               (e.g. number of assignments submitted under it)
+    aliases:   previously resolved student -> canonical map (kept as is)
+    ambiguous: find_ambiguous_names() of all the names (computed if None);
+               new names that could belong to two clusters are added to it
+
+    Returns student -> canonical name for every student in weights and aliases.
+    A name only joins a cluster if it matches every member of it (so clusters
+    never chain through a shared short name); ambiguous names stay unmerged.
+    A new cluster's canonical name is its heaviest spelling (then the one
+    with most tokens, then alphabetical).
+    """
+    aliases = dict(aliases or {})
+    if ambiguous is None:
+        ambiguous = find_ambiguous_names(list(aliases) + list(weights))
+
+    # known names first, then new names from "best canonical" to worst
+    new_names = sorted(
+        (n for n in weights if n not in aliases),
+        key=lambda n: (-weights[n], -len(_name_tokens(n)), n),
+    )
+
+    canonical: Dict[str, str] = {}
+    members: Dict[str, List[str]] = defaultdict(list)
+    index: Dict[Tuple[str, str, str], List[str]] = defaultdict(list)
+
+    def add(n: str, target: str) -> None:
+        canonical[n] = target
+        members[target].append(n)
+        for key in _blocking_keys(n):
+            index[key].append(n)
+
+    for n in sorted(aliases):
+        add(n, aliases[n])
+
+    for n in new_names:
+        if n in ambiguous:
+            canonical[n] = n
+            continue
+        clusters = {canonical[other] for key in _blocking_keys(n) for other in index.get(key, ())}
+        accepting = sorted(c for c in clusters if all(names_match(n, m) for m in members[c]))
+        if len(accepting) > 1:
+            ambiguous[n] = accepting
+            canonical[n] = n
+        else:
+            add(n, accepting[0] if accepting else n)
+    return canonical
 
 
 # -----------------------------
 # STEP 4: WRITE OUTPUTS
 # -----------------------------
 def write_missing_csv(missing: Dict[str, List[str]], out_path: Path) -> None:
-    with out_path.open("w", encoding="utf-8", newline="") as f:
+    with out_path.open("w", encoding="utf-8", newline="", buffering=OUTPUT_BUFFER_BYTES) as f:
         w = csv.writer(f)
         w.writerow(["student", "missing_count", "missing_assignments"])
-        for student in sorted(missing.keys()):
-            miss = missing[student]
-            w.writerow([student, len(miss), ";".join(miss)])
+        w.writerows([student, len(miss), ";".join(miss)] for student, miss in sorted(missing.items()))
 
 
 def write_report_md(
-    submissions: Dict[str, Set[str]],
+    submissions: Mapping,
     missing: Dict[str, List[str]],
     required: List[str],
     out_path: Path,
 ) -> None:
+    """
+    Streams the markdown report to out_path line by line.
+    Needs one sort of the student names; everything else reads the
+    aggregates already computed (missing lists, coverage column sums).
+    """
     run_time = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
 
     students = sorted(submissions.keys())
     total_students = len(students)
-
-    missing_students = [s for s in students if missing.get(s)]
-    ok_students = [s for s in students if not missing.get(s)]
+    missing_total = sum(1 for s in students if missing.get(s))
 
     coverage = compute_assignment_coverage(submissions, required)
-    required_str = ", ".join([x.strip().lower() for x in required if x.strip()])
-
-    lines: List[str] = []
-    lines.append("# Missing Submissions Report")
-    lines.append("")
-    lines.append(f"- Generated: **{run_time}**")
-    lines.append(f"- Input file: `{SUBJECTS_PATH.name}`")
-    lines.append(f"- Normalized CSV: `{NORMALIZED_CSV_PATH.name}`")
-    lines.append(f"- Missing CSV: `{MISSING_CSV_PATH.name}`")
-    lines.append("")
-    lines.append("## Summary")
-    lines.append("")
-    lines.append(f"- Total students in dataset: **{total_students}**")
-    lines.append(f"- Students with all required submissions: **{len(ok_students)}**")
-    lines.append(f"- Students missing ≥1 required submission: **{len(missing_students)}**")
-    lines.append("")
-    lines.append("## Required assignments")
-    lines.append("")
-    lines.append(required_str)
-    lines.append("")
-    lines.append("## Assignment coverage (lowest first)")
-    lines.append("")
-    lines.append("| Assignment | Submitted | Total | Rate |")
-    lines.append("|---|---:|---:|---:|")
-    for a, submitted_count, total, rate in coverage:
-        lines.append(f"| {a} | {submitted_count} | {total} | {rate:.1%} |")
-    lines.append("")
-    lines.append("## Students missing submissions")
-    lines.append("")
-    lines.append("| Student | Missing count | Missing assignments |")
-    lines.append("|---|---:|---|")
-    for student in students:
-        miss_list = missing.get(student, [])
-        if miss_list:
-            lines.append(f"| {student} | {len(miss_list)} | {', '.join(miss_list)} |")
-    lines.append("")
-    lines.append("## Students with all required submissions")
-    lines.append("")
-    for student in ok_students:
-        lines.append(f"- {student}")
-    lines.append("")
-
-    out_path.write_text("\n".join(lines), encoding="utf-8")
+    required_str = ", ".join(_required_list(required))
+
+    with out_path.open("w", encoding="utf-8", buffering=OUTPUT_BUFFER_BYTES) as f:
+        def emit(line: str) -> None:
+            f.write(line)
+            f.write("\n")
+
+        emit("# Missing Submissions Report")
+        emit("")
+        emit(f"- Generated: **{run_time}**")
+        emit(f"- Input file: `{SUBJECTS_PATH.name}`")
+        emit(f"- Normalized CSV: `{NORMALIZED_CSV_PATH.name}`")
+        emit(f"- Missing CSV: `{MISSING_CSV_PATH.name}`")
+        emit("")
+        emit("## Summary")
+        emit("")
+        emit(f"- Total students in dataset: **{total_students}**")
+        emit(f"- Students with all required submissions: **{total_students - missing_total}**")
+        emit(f"- Students missing ≥1 required submission: **{missing_total}**")
+        emit("")
+        emit("## Required assignments")
+        emit("")
+        emit(required_str)
+        emit("")
+        emit("## Assignment coverage (lowest first)")
+        emit("")
+        emit("| Assignment | Submitted | Total | Rate |")
+        emit("|---|---:|---:|---:|")
+        for a, submitted_count, total, rate in coverage:
+            emit(f"| {a} | {submitted_count} | {total} | {rate:.1%} |")
+        emit("")
+        emit("## Students missing submissions")
+        emit("")
+        emit("| Student | Missing count | Missing assignments |")
+        emit("|---|---:|---|")
+        for student in students:
+            miss_list = missing.get(student)
+            if miss_list:
+                emit(f"| {student} | {len(miss_list)} | {', '.join(miss_list)} |")
+        emit("")
+        emit("## Students with all required submissions")
+        emit("")
+        for student in students:
+            if not missing.get(student):
+                emit(f"- {student}")
 
 
 # -----------------------------
-# MAIN
+# INCREMENTAL CHECKPOINT
 # -----------------------------
-def main() -> None:
-    # 1) normalize
-    rows = build_normalized_titles(SUBJECTS_PATH, NORMALIZED_CSV_PATH)
+# Saved after every run. With --incremental, only the lines that are new
+# since the checkpoint are parsed. Two layouts are recognised:
+#   - lines appended after the processed part (a file that grows at the end)
+#   - newer issues prepended in front of it (newest-first GitHub exports):
+#     the leading lines with issue_id > the checkpoint's max_issue_id
+# In both cases the processed part must be byte-for-byte unchanged (sha256
+# of the whole range, so edits anywhere are caught); otherwise, e.g. when
+# an old issue changed state in a re-export, we rebuild from scratch.
+CHECKPOINT_PATH = BASE_DIR / "report_checkpoint.json"
+CHECKPOINT_VERSION = 2
+FINGERPRINT_BYTES = 64 * 1024
+HASH_BLOCK_BYTES = 1 << 20
+
+
+def file_fingerprint(path: Path, offset: int) -> Tuple[str, str]:
+    """
+    sha256 of the first and of the last FINGERPRINT_BYTES before `offset`.
+    Cheap enough to check on every poll (report_server), but a same-length
+    edit in the middle of a file longer than 2 * FINGERPRINT_BYTES goes
+    unnoticed; the checkpoint uses range_sha256() of everything instead.
+    """
+    with path.open("rb") as f:
+        head = f.read(min(offset, FINGERPRINT_BYTES))
+        tail_start = max(0, offset - FINGERPRINT_BYTES)
+        f.seek(tail_start)
+        tail = f.read(offset - tail_start)
+    return hashlib.sha256(head).hexdigest(), hashlib.sha256(tail).hexdigest()
+
+
+def range_sha256(path: Path, start: int, end: int) -> str:
+    """sha256 of bytes [start, end) of the file, read in blocks."""
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        f.seek(start)
+        remaining = end - start
+        while remaining > 0:
+            block = f.read(min(HASH_BLOCK_BYTES, remaining))
+            if not block:
+                break
+            digest.update(block)
+            remaining -= len(block)
+    return digest.hexdigest()
+
+
+def new_leading_lines_end(path: Path, max_issue_id: int) -> int:
+    """
+    Byte offset just after the leading lines of a newest-first export whose
+    issue_id is above max_issue_id (0 if the file does not start with any).
+    """
+    end = pos = 0
+    with path.open("rb") as f:
+        for raw in f:
+            record = _parse_subject_line(raw.decode("utf-8").rstrip("\r\n"))
+            if record is not None and record[0] <= max_issue_id:
+                break
+            pos += len(raw)
+            if record is not None:
+                end = pos
+    return end
+
+
+def save_checkpoint(
+    checkpoint_path: Path,
+    subjects_path: Path,
+    cursor: ReadCursor,
+    submissions: Dict[str, Set[str]],
+) -> None:
+    data = {
+        "version": CHECKPOINT_VERSION,
+        "input": subjects_path.name,
+        "offset": cursor.offset,
+        "ends_with_newline": cursor.ends_with_newline,
+        "max_issue_id": cursor.max_issue_id,
+        "sha256": range_sha256(subjects_path, 0, cursor.offset),
+        "submissions": {s: sorted(submitted) for s, submitted in sorted(submissions.items())},
+    }
+    tmp_path = checkpoint_path.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps(data), encoding="utf-8")
+    tmp_path.replace(checkpoint_path)
+
+
+def load_checkpoint(
+    checkpoint_path: Path,
+    subjects_path: Path,
+) -> Optional[Tuple[ReadCursor, Dict[str, Set[str]], Optional[int]]]:
+    """
+    Returns (cursor, submissions, new_head_end) if the checkpoint can be
+    resumed from, or None if a full rebuild is needed (no/old checkpoint,
+    or the bytes we already processed changed).
+
+    new_head_end is None when new lines were appended (parse from
+    cursor.offset to the end), or the byte offset where the new leading
+    lines of a newest-first export end (parse from 0 to there).
+    """
+    if not checkpoint_path.exists() or not subjects_path.exists():
+        return None
+
+    try:
+        data = json.loads(checkpoint_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+    if data.get("version") != CHECKPOINT_VERSION or data.get("input") != subjects_path.name:
+        return None
+
+    offset = data["offset"]
+    size = subjects_path.stat().st_size
+    cursor = ReadCursor(
+        offset=offset,
+        ends_with_newline=data["ends_with_newline"],
+        max_issue_id=data["max_issue_id"],
+    )
+    submissions = {s: set(submitted) for s, submitted in data["submissions"].items()}
+
+    # appended: the file still starts with the processed bytes
+    # (a last line without newline may have been extended: can't resume mid-line)
+    if size >= offset and (data["ends_with_newline"] or size == offset):
+        if range_sha256(subjects_path, 0, offset) == data["sha256"]:
+            return cursor, submissions, None
+
+    # prepended: newer issues, then exactly the processed bytes
+    if cursor.max_issue_id is not None:
+        head_end = new_leading_lines_end(subjects_path, cursor.max_issue_id)
+        if head_end and size - head_end == offset and range_sha256(subjects_path, head_end, size) == data["sha256"]:
+            return cursor, submissions, head_end
+
+    return None
+
+
+# -----------------------------
+# SNAPSHOT DIFF (--diff OLD_SUBJECTS)
+# -----------------------------
+# Compares two exports by a merge-join on issue_id: both files are streamed
+# in descending issue_id order (the order GitHub exports them in), so memory
+# does not depend on the number of issues. A file that is not in that order
+# is first sorted externally (sorted runs in temp files + heapq.merge).
+DIFF_CSV_PATH = BASE_DIR / "snapshot_diff.csv"
+MISSING_DELTA_CSV_PATH = BASE_DIR / "missing_delta.csv"
+EXTERNAL_SORT_CHUNK_ROWS = 200_000
+
+DIFF_CSV_HEADER = [
+    "issue_id", "change",
+    "old_state", "new_state",
+    "old_title", "new_title",
+    "old_student", "new_student",
+    "old_assignments", "new_assignments",
+]
+
+
+def _is_sorted_desc(subjects_path: Path) -> bool:
+    """Streams the file once and checks issue ids strictly decrease."""
+    prev = None
+    for issue_id, _, _ in iter_subjects_txt(subjects_path):
+        if prev is not None and issue_id >= prev:
+            return False
+        prev = issue_id
+    return True
+
+
+def _write_run(records: List[Tuple[int, str, str]], tmp_dir: Path, n: int) -> Path:
+    path = tmp_dir / f"run_{n}.tsv"
+    with path.open("w", encoding="utf-8", newline="\n") as f:
+        for issue_id, state, title in records:
+            f.write(f"{issue_id}\t{state}\t{title}\n")
+    return path
 
-    # 2) compute missing
-    submissions, missing = compute_missing(rows, REQUIRED_ASSIGNMENTS)
+
+def iter_records_desc(
+    subjects_path: Path,
+    tmp_dir: Path,
+    chunk_rows: Optional[int] = None,
+) -> Iterator[Tuple[int, str, str]]:
+    """
+    (issue_id, state, title) in descending issue_id order, streamed.
+    Unsorted input is sorted externally: runs of chunk_rows records are
+    sorted and written to tmp_dir, then merged lazily.
+    """
+    if _is_sorted_desc(subjects_path):
+        return iter_subjects_txt(subjects_path)
+    chunk_rows = chunk_rows or EXTERNAL_SORT_CHUNK_ROWS
+
+    runs: List[Path] = []
+    chunk: List[Tuple[int, str, str]] = []
+    for record in iter_subjects_txt(subjects_path):
+        chunk.append(record)
+        if len(chunk) >= chunk_rows:
+            chunk.sort(key=lambda r: -r[0])
+            runs.append(_write_run(chunk, tmp_dir, len(runs)))
+            chunk = []
+    chunk.sort(key=lambda r: -r[0])
+    if not runs:
+        return iter(chunk)
+    runs.append(_write_run(chunk, tmp_dir, len(runs)))
+    return heapq.merge(*(iter_subjects_txt(run) for run in runs), key=lambda r: -r[0])
+
+
+def _unique_ids(records: Iterator[Tuple[int, str, str]]) -> Iterator[Tuple[int, str, str]]:
+    """Drops repeated issue ids (keeps the first one)."""
+    prev = None
+    for record in records:
+        if record[0] != prev:
+            prev = record[0]
+            yield record
+
+
+def diff_snapshots(
+    old_path: Path,
+    new_path: Path,
+    required: List[str],
+    diff_csv_path: Path,
+    delta_csv_path: Path,
+) -> Dict[str, int]:
+    """
+    Writes the change log (new / removed issues, state flips, title edits that
+    change the parsed student or assignments) and the resulting change in
+    missing submissions per student. Returns counts per change type.
+    """
+    counts = {"new": 0, "removed": 0, "state": 0, "reparsed": 0}
+    old_matrix = SubmissionMatrix()
+    new_matrix = SubmissionMatrix()
+
+    def _add(matrix: SubmissionMatrix, parsed: Tuple[str, Tuple[str, ...], str]) -> None:
+        if is_known_student(parsed[0]):
+            matrix.add(parsed[0], parsed[1])
+
+    with tempfile.TemporaryDirectory() as tmp, \
+            diff_csv_path.open("w", encoding="utf-8", newline="", buffering=OUTPUT_BUFFER_BYTES) as f:
+        w = csv.writer(f)
+        w.writerow(DIFF_CSV_HEADER)
+
+        old_dir = Path(tmp) / "old"
+        new_dir = Path(tmp) / "new"
+        old_dir.mkdir()
+        new_dir.mkdir()
+        old_it = _unique_ids(iter_records_desc(old_path, old_dir))
+        new_it = _unique_ids(iter_records_desc(new_path, new_dir))
+        old = next(old_it, None)
+        new = next(new_it, None)
+
+        while old is not None or new is not None:
+            if new is not None and (old is None or new[0] > old[0]):
+                parsed = normalize_title(new[2])
+                _add(new_matrix, parsed)
+                w.writerow([new[0], "new", "", new[1], "", new[2], "", parsed[0], "", ";".join(parsed[1])])
+                counts["new"] += 1
+                new = next(new_it, None)
+            elif old is not None and (new is None or old[0] > new[0]):
+                parsed = normalize_title(old[2])
+                _add(old_matrix, parsed)
+                w.writerow([old[0], "removed", old[1], "", old[2], "", parsed[0], "", ";".join(parsed[1]), ""])
+                counts["removed"] += 1
+                old = next(old_it, None)
+            else:
+                old_parsed = normalize_title(old[2])
+                new_parsed = normalize_title(new[2])
+                _add(old_matrix, old_parsed)
+                _add(new_matrix, new_parsed)
+                changes = []
+                if old[1] != new[1]:
+                    changes.append("state")
+                if old_parsed[:2] != new_parsed[:2]:
+                    changes.append("reparsed")
+                for change in changes:
+                    counts[change] += 1
+                if changes:
+                    w.writerow([
+                        old[0], "+".join(changes),
+                        old[1], new[1],
+                        old[2], new[2],
+                        old_parsed[0], new_parsed[0],
+                        ";".join(old_parsed[1]), ";".join(new_parsed[1]),
+                    ])
+                old = next(old_it, None)
+                new = next(new_it, None)
+
+    write_missing_delta(old_matrix, new_matrix, required, delta_csv_path)
+    return counts
+
+
+def write_missing_delta(
+    old: SubmissionMatrix,
+    new: SubmissionMatrix,
+    required: List[str],
+    out_path: Path,
+) -> None:
+    """
+    Per student whose missing list changed:
+      status (new_student / removed_student / changed), missing counts before/after,
+      resolved (no longer missing) and newly_missing assignments.
+    """
+    old_missing = old.missing(required)
+    new_missing = new.missing(required)
+
+    with out_path.open("w", encoding="utf-8", newline="", buffering=OUTPUT_BUFFER_BYTES) as f:
+        w = csv.writer(f)
+        w.writerow(["student", "status", "missing_before", "missing_after", "resolved", "newly_missing"])
+        for student in sorted(set(old_missing) | set(new_missing)):
+            before = old_missing.get(student)
+            after = new_missing.get(student)
+            if before == after:
+                continue
+            if before is None:
+                status = "new_student"
+            elif after is None:
+                status = "removed_student"
+            else:
+                status = "changed"
+            before_set = set(before or [])
+            after_set = set(after or [])
+            w.writerow([
+                student, status,
+                "" if before is None else len(before),
+                "" if after is None else len(after),
+                ";".join(sorted(before_set - after_set)) if after is not None else "",
+                ";".join(sorted(after_set - before_set)),
+            ])
+
+
+# -----------------------------
+# MAIN
+# -----------------------------
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Missing submissions report for subjects.txt")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help=f"only parse lines appended since the last run (uses {CHECKPOINT_PATH.name})",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        metavar="N",
+        help="normalize in N processes (output is identical to the serial run)",
+    )
+    parser.add_argument(
+        "--dedupe-names",
+        action="store_true",
+        help=f"merge near-duplicate student names (map cached in {ALIASES_PATH.name})",
+    )
+    parser.add_argument(
+        "--diff",
+        type=Path,
+        default=None,
+        metavar="OLD_SUBJECTS",
+        help=f"compare an older export with {SUBJECTS_PATH.name} instead of writing the report "
+             f"(writes {DIFF_CSV_PATH.name} and {MISSING_DELTA_CSV_PATH.name})",
+    )
+    args = parser.parse_args(argv)
+
+    if args.diff is not None:
+        counts = diff_snapshots(args.diff, SUBJECTS_PATH, REQUIRED_ASSIGNMENTS, DIFF_CSV_PATH, MISSING_DELTA_CSV_PATH)
+        print("Snapshot Diff")
+        print("=" * 13)
+        print(f"New issues: {counts['new']}")
+        print(f"Removed issues: {counts['removed']}")
+        print(f"State changes: {counts['state']}")
+        print(f"Titles re-parsed differently: {counts['reparsed']}")
+        print(f"Wrote: {DIFF_CSV_PATH}")
+        print(f"Wrote: {MISSING_DELTA_CSV_PATH}")
+        return
+
+    # 0) resume from checkpoint? (falls back to a full rebuild)
+    resumed = None
+    if args.incremental and NORMALIZED_CSV_PATH.exists():
+        resumed = load_checkpoint(CHECKPOINT_PATH, SUBJECTS_PATH)
+
+    new_head_end = None
+    if resumed is not None:
+        cursor, seed, new_head_end = resumed
+        start = cursor.offset if new_head_end is None else 0
+    else:
+        cursor, seed, start = ReadCursor(), None, 0
+        if args.incremental:
+            print("No usable checkpoint (missing or input rewritten): full rebuild")
+
+    # 1+2) normalize (streamed into normalized_titles.csv) and compute missing in one pass
+    rows = stream_normalized_titles(
+        SUBJECTS_PATH, NORMALIZED_CSV_PATH, start=start, cursor=cursor, workers=args.workers, stop=new_head_end
+    )
+    submissions, missing = compute_missing(rows, REQUIRED_ASSIGNMENTS, submissions=seed)
+    # the checkpoint keeps the names as parsed, dedupe is re-applied on every run
+    raw_submissions = submissions
+
+    # 2b) merge near-duplicate student names
+    if args.dedupe_names:
+        weights = submissions.submission_counts()
+        aliases = load_aliases(ALIASES_PATH)
+        ambiguous = {
+            n: names for n, names in find_ambiguous_names(list(aliases) + list(weights)).items()
+            if n not in aliases
+        }
+        canonical = dedupe_student_names(weights, aliases, ambiguous)
+        # ambiguous names are not saved, so they are re-checked (or hand-mapped) next run
+        save_aliases(ALIASES_PATH, {n: c for n, c in canonical.items() if n not in ambiguous})
+        submissions = submissions.merge_students(canonical)
+        missing = submissions.missing(REQUIRED_ASSIGNMENTS)
+        for name, target in sorted(canonical.items()):
+            if name != target and name in raw_submissions:
+                print(f"Merged student name: {name!r} -> {target!r}")
+        for name, candidates in sorted(ambiguous.items()):
+            if name in raw_submissions:
+                print(f"Ambiguous student name (not merged): {name!r} could be " + ", ".join(map(repr, candidates)))
 
     # 3) write outputs
     write_missing_csv(missing, MISSING_CSV_PATH)
@@ -370,7 +1517,7 @@ def main() -> None:
 
     # 4) print short summary
     total_students = len(submissions)
-    missing_count = sum(1 for s in submissions if missing.get(s))
+    missing_count = sum(1 for miss in missing.values() if miss)
 
     print("Missing Submissions Report")
     print("=" * 26)
@@ -380,6 +1527,13 @@ def main() -> None:
     print(f"Wrote: {MISSING_CSV_PATH}")
     print(f"Wrote: {REPORT_MD_PATH}")
 
+    # 5) checkpoint for the next --incremental run
+    save_checkpoint(CHECKPOINT_PATH, SUBJECTS_PATH, cursor, raw_submissions)
+    if new_head_end is not None:
+        print(f"Incremental: parsed new leading bytes 0..{new_head_end} (newest-first export)")
+    elif resumed is not None:
+        print(f"Incremental: parsed bytes {start}..{cursor.offset}")
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+DAY09 REPORT SERVER (resident query daemon)
+
+Builds the student x assignment index from subjects.txt once, keeps it in
+memory and follows lines appended to the file (like `tail -f`). Queries are
+answered from memory over a local HTTP server (JSON responses):
+
+  GET /health                      -> students, lines read, index version
+  GET /missing?assignment=day08    -> students missing day08
+  GET /missing                     -> student -> missing required assignments
+  GET /coverage                    -> assignment coverage (lowest first)
+  GET /student?name=Noya%20Levy    -> submitted + missing for one student
+
+Answers are cached until the index changes, so repeated dashboard queries
+are a dict lookup. If subjects.txt is rewritten (shrinks / its processed
+prefix changes), the index is rebuilt from scratch.
+
+Usage:
+  python day09/report_server.py --port 8765
+  curl 'http://127.0.0.1:8765/missing?assignment=day08'
+"""
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+import report
+
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_POLL_SECONDS = 0.5
+
+
+# -----------------------------
+# IN-MEMORY INDEX
+# -----------------------------
+class SubmissionIndex:
+    """
+    SubmissionMatrix for one subjects.txt, kept up to date with refresh().
+    All public methods are thread-safe.
+    """
+
+    def __init__(self, subjects_path: Path, required: Optional[List[str]] = None) -> None:
+        self.subjects_path = subjects_path
+        self.required = list(required if required is not None else report.REQUIRED_ASSIGNMENTS)
+        self.version = 0
+
+        self._lock = threading.Lock()           # guards the state below (queries + swap)
+        self._refresh_lock = threading.Lock()   # one refresh at a time
+        self._cache: Dict[Tuple, object] = {}
+        self._matrix = report.SubmissionMatrix()
+        self._cursor = report.ReadCursor()
+        self._fingerprint: Optional[Tuple[str, str]] = None
+
+        self.refresh()
+
+    def _rewritten(self, cursor: report.ReadCursor, fingerprint: Optional[Tuple[str, str]]) -> bool:
+        size = self.subjects_path.stat().st_size
+        if size < cursor.offset:
+            return True
+        return fingerprint is not None and (
+            report.file_fingerprint(self.subjects_path, cursor.offset) != fingerprint
+        )
+
+    def refresh(self) -> int:
+        """
+        Reads complete lines appended since the last refresh.
+        Returns the number of rows added (after a rebuild: all rows).
+
+        The file is read (and on a rebuild the whole new matrix built)
+        without holding the query lock; only the swap / the few appended
+        rows are applied under it, so queries never wait for a rebuild.
+        """
+        with self._refresh_lock:
+            with self._lock:
+                cursor = dataclasses.replace(self._cursor)
+                fingerprint = self._fingerprint
+
+            rebuilt = None
+            if self._rewritten(cursor, fingerprint):
+                rebuilt = report.SubmissionMatrix()
+                cursor, fingerprint = report.ReadCursor(), None
+
+            start = cursor.offset
+            records = report.iter_subjects_txt(
+                self.subjects_path, start=start, cursor=cursor, complete_lines_only=True
+            )
+            appended = []
+            added = 0
+            for r in report.iter_normalized_rows(records):
+                if report.is_known_student(r.student):
+                    if rebuilt is not None:
+                        rebuilt.add(r.student, r.assignments)
+                    else:
+                        appended.append((r.student, r.assignments))
+                added += 1
+
+            changed = cursor.offset != start or fingerprint is None
+            if changed:
+                fingerprint = report.file_fingerprint(self.subjects_path, cursor.offset)
+
+            with self._lock:
+                if rebuilt is not None:
+                    self._matrix = rebuilt
+                for student, assignments in appended:
+                    self._matrix.add(student, assignments)
+                self._cursor = cursor
+                self._fingerprint = fingerprint
+                if changed:
+                    self._cache.clear()
+                    self.version += 1
+            return added
+
+    def _cached(self, key: Tuple, compute):
+        with self._lock:
+            if key not in self._cache:
+                self._cache[key] = compute()
+            return self._cache[key]
+
+    # --- queries ---
+    def health(self) -> Dict:
+        with self._lock:
+            return {
+                "subjects": str(self.subjects_path),
+                "students": len(self._matrix),
+                "bytes_read": self._cursor.offset,
+                "max_issue_id": self._cursor.max_issue_id,
+                "version": self.version,
+            }
+
+    def missing(self) -> Dict[str, List[str]]:
+        """student -> missing required assignments (only students missing something)."""
+        def compute():
+            missing = self._matrix.missing(self.required)
+            return {s: miss for s, miss in sorted(missing.items()) if miss}
+        return self._cached(("missing",), compute)
+
+    def missing_assignment(self, assignment: str) -> List[str]:
+        """Sorted students who did not submit `assignment`."""
+        assignment = assignment.strip().lower()
+
+        def compute():
+            j = self._matrix.assignment_index.get(assignment)
+            if j is None:
+                return sorted(self._matrix.students)
+            bit = 1 << j
+            return sorted(s for s, mask in zip(self._matrix.students, self._matrix.student_masks) if not mask & bit)
+        return self._cached(("missing", assignment), compute)
+
+    def coverage(self) -> List[Dict]:
+        def compute():
+            return [
+                {"assignment": a, "submitted": submitted, "total": total, "rate": rate}
+                for a, submitted, total, rate in self._matrix.coverage(self.required)
+            ]
+        return self._cached(("coverage",), compute)
+
+    def student(self, name: str) -> Optional[Dict]:
+        name = report.normalize_student_name(name)
+
+        def compute():
+            if name not in self._matrix:
+                return None
+            submitted = self._matrix[name]
+            required = {a.strip().lower() for a in self.required if a.strip()}
+            return {
+                "student": name,
+                "submitted": sorted(submitted),
+                "missing": sorted(required - submitted),
+            }
+        return self._cached(("student", name), compute)
+
+
+# -----------------------------
+# TAIL FOLLOWER
+# -----------------------------
+class TailFollower(threading.Thread):
+    """Calls index.refresh() every `interval` seconds until stop()."""
+
+    def __init__(self, index: SubmissionIndex, interval: float = DEFAULT_POLL_SECONDS) -> None:
+        super().__init__(daemon=True)
+        self.index = index
+        self.interval = interval
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            try:
+                self.index.refresh()
+            except OSError as e:  # file temporarily missing while being replaced
+                print(f"refresh failed: {e}")
+
+    def stop(self) -> None:
+        self._stop_event.set()
+
+
+# -----------------------------
+# HTTP
+# -----------------------------
+class QueryHandler(BaseHTTPRequestHandler):
+    index: SubmissionIndex  # set by make_server()
+
+    def _send_json(self, status: int, payload) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        url = urlparse(self.path)
+        params = {k: v[0] for k, v in parse_qs(url.query).items()}
+
+        if url.path == "/health":
+            self._send_json(200, self.index.health())
+        elif url.path == "/missing":
+            if "assignment" in params:
+                assignment = params["assignment"]
+                self._send_json(200, {"assignment": assignment, "students": self.index.missing_assignment(assignment)})
+            else:
+                self._send_json(200, self.index.missing())
+        elif url.path == "/coverage":
+            self._send_json(200, self.index.coverage())
+        elif url.path == "/student":
+            result = self.index.student(params.get("name", ""))
+            if result is None:
+                self._send_json(404, {"error": f"unknown student: {params.get('name', '')}"})
+            else:
+                self._send_json(200, result)
+        else:
+            self._send_json(404, {"error": f"unknown endpoint: {url.path}"})
+
+    def log_message(self, format: str, *args) -> None:
+        # keep the console quiet; dashboards poll a lot
+        pass
+
+
+def make_server(index: SubmissionIndex, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> ThreadingHTTPServer:
+    """HTTP server bound to host:port (port 0 = pick a free one) answering from `index`."""
+    handler = type("BoundQueryHandler", (QueryHandler,), {"index": index})
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Resident query server for the day09 missing-submissions report")
+    parser.add_argument("--subjects", type=Path, default=report.SUBJECTS_PATH)
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--poll", type=float, default=DEFAULT_POLL_SECONDS, help="seconds between checks for new lines")
+    parser.add_argument("--required", nargs="+", default=None, help="required assignments (default: REQUIRED_ASSIGNMENTS)")
+    args = parser.parse_args()
+
+    index = SubmissionIndex(args.subjects, args.required)
+    follower = TailFollower(index, args.poll)
+    follower.start()
+
+    server = make_server(index, args.host, args.port)
+    host, port = server.server_address[:2]
+    print(f"Indexed {index.health()['students']} students from {args.subjects}")
+    print(f"Serving on http://{host}:{port}  (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        follower.stop()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
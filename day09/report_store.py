@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+DAY09 SUBMISSIONS HISTORY (optional SQLite backend)
+
+Loads normalized subjects.txt snapshots into a SQLite database, so history
+questions can be answered with indexed queries instead of re-parsing text
+files. Every load is a new snapshot (tagged with a semester), which is what
+makes OPEN/CLOSED transitions visible.
+
+Tables:
+  snapshots(snapshot_id, semester, source, loaded_at)
+  issues(snapshot_id, semester, issue_id, state, raw_title, student, format_tag, updated_at)
+  submissions(snapshot_id, semester, issue_id, student, assignment, updated_at)
+
+Timestamps are the ISO time column of subjects.txt ("2026-01-03T18:44:38Z",
+the issue's last update), stored as TEXT so they compare chronologically.
+
+Usage:
+  python day09/report_store.py load day09/subjects.txt --semester 2025-26
+  python day09/report_store.py late --deadline day08=2026-01-01T00:00:00Z
+  python day09/report_store.py window 2025-12-20T00:00:00Z 2025-12-31T00:00:00Z --assignment day08
+  python day09/report_store.py transitions
+"""
+
+from __future__ import annotations
+
+import argparse
+import sqlite3
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import report
+
+
+DB_PATH = report.BASE_DIR / "submissions_history.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    snapshot_id INTEGER PRIMARY KEY,
+    semester    TEXT NOT NULL,
+    source      TEXT NOT NULL,
+    loaded_at   TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS issues (
+    snapshot_id INTEGER NOT NULL REFERENCES snapshots(snapshot_id),
+    semester    TEXT NOT NULL,
+    issue_id    INTEGER NOT NULL,
+    state       TEXT NOT NULL,
+    raw_title   TEXT NOT NULL,
+    student     TEXT NOT NULL,
+    format_tag  TEXT NOT NULL,
+    updated_at  TEXT,
+    PRIMARY KEY (snapshot_id, issue_id)
+);
+CREATE TABLE IF NOT EXISTS submissions (
+    snapshot_id INTEGER NOT NULL REFERENCES snapshots(snapshot_id),
+    semester    TEXT NOT NULL,
+    issue_id    INTEGER NOT NULL,
+    student     TEXT NOT NULL,
+    assignment  TEXT NOT NULL,
+    updated_at  TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_issues_history ON issues (semester, issue_id, snapshot_id);
+CREATE INDEX IF NOT EXISTS idx_submissions_student ON submissions (student, snapshot_id);
+CREATE INDEX IF NOT EXISTS idx_submissions_assignment ON submissions (assignment, updated_at);
+CREATE INDEX IF NOT EXISTS idx_submissions_time ON submissions (updated_at);
+CREATE INDEX IF NOT EXISTS idx_submissions_snapshot ON submissions (snapshot_id);
+
+-- newest snapshot of every semester
+CREATE VIEW IF NOT EXISTS latest_snapshots AS
+    SELECT MAX(snapshot_id) AS snapshot_id, semester FROM snapshots GROUP BY semester;
+"""
+
+INSERT_BATCH_ROWS = 10_000
+
+
+# -----------------------------
+# CONNECTION + LOAD
+# -----------------------------
+def connect(db_path: Path = DB_PATH) -> sqlite3.Connection:
+    conn = sqlite3.connect(str(db_path))
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def _batches(rows: Iterator[tuple], size: int = INSERT_BATCH_ROWS) -> Iterator[List[tuple]]:
+    batch: List[tuple] = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def load_snapshot(conn: sqlite3.Connection, subjects_path: Path, semester: str) -> int:
+    """
+    Normalizes subjects_path and bulk-loads it as a new snapshot, in one
+    transaction. Returns the snapshot_id.
+    """
+    records = report.iter_subject_records(subjects_path)
+    loaded_at = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    with conn:
+        cur = conn.execute(
+            "INSERT INTO snapshots (semester, source, loaded_at) VALUES (?, ?, ?)",
+            (semester, str(subjects_path), loaded_at),
+        )
+        snapshot_id = cur.lastrowid
+
+        for batch in _batches(iter(records)):
+            issue_rows = []
+            submission_rows = []
+            for issue_id, state, raw_title, updated_at in batch:
+                student, assignments, format_tag = report.normalize_title(raw_title)
+                issue_rows.append((snapshot_id, semester, issue_id, state, raw_title, student, format_tag, updated_at))
+                if report.is_known_student(student):
+                    submission_rows.extend(
+                        (snapshot_id, semester, issue_id, student, a, updated_at) for a in assignments
+                    )
+            conn.executemany("INSERT OR REPLACE INTO issues VALUES (?, ?, ?, ?, ?, ?, ?, ?)", issue_rows)
+            conn.executemany("INSERT INTO submissions VALUES (?, ?, ?, ?, ?, ?)", submission_rows)
+
+    return snapshot_id
+
+
+# -----------------------------
+# QUERIES (latest snapshot of each semester unless noted)
+# -----------------------------
+def late_submissions(
+    conn: sqlite3.Connection,
+    deadlines: Dict[str, str],
+    semester: Optional[str] = None,
+) -> List[Tuple[str, str, str, int, str]]:
+    """
+    deadlines: assignment -> ISO time ("2026-01-01T00:00:00Z")
+    Returns (semester, assignment, student, issue_id, updated_at) for
+    submissions updated after their assignment's deadline.
+    """
+    results: List[Tuple[str, str, str, int, str]] = []
+    for assignment, deadline in sorted(deadlines.items()):
+        results.extend(conn.execute(
+            """
+            SELECT s.semester, s.assignment, s.student, s.issue_id, s.updated_at
+            FROM submissions s JOIN latest_snapshots l ON s.snapshot_id = l.snapshot_id
+            WHERE s.assignment = ? AND s.updated_at > ? AND (? IS NULL OR s.semester = ?)
+            ORDER BY s.semester, s.updated_at
+            """,
+            (assignment.strip().lower(), deadline, semester, semester),
+        ))
+    return results
+
+
+def late_counts(
+    conn: sqlite3.Connection,
+    deadlines: Dict[str, str],
+    semester: Optional[str] = None,
+) -> List[Tuple[str, int]]:
+    """(assignment, number of late submissions) per assignment, counted in SQL."""
+    normalized = {a.strip().lower(): deadline for a, deadline in deadlines.items()}
+    if not normalized:
+        return []
+    values = ", ".join("(?, ?)" for _ in normalized)
+    params: List[Optional[str]] = [x for item in sorted(normalized.items()) for x in item]
+    return list(conn.execute(
+        f"""
+        WITH deadlines(assignment, deadline) AS (VALUES {values})
+        SELECT d.assignment, COUNT(s.issue_id)
+        FROM deadlines d
+        LEFT JOIN submissions s
+          ON s.assignment = d.assignment AND s.updated_at > d.deadline
+         AND s.snapshot_id IN (SELECT snapshot_id FROM latest_snapshots)
+         AND (? IS NULL OR s.semester = ?)
+        GROUP BY d.assignment
+        ORDER BY d.assignment
+        """,
+        params + [semester, semester],
+    ))
+
+
+def submissions_between(
+    conn: sqlite3.Connection,
+    start: str,
+    end: str,
+    assignment: Optional[str] = None,
+    semester: Optional[str] = None,
+) -> List[Tuple[str, str, str, int, str]]:
+    """(semester, assignment, student, issue_id, updated_at) with start <= updated_at < end."""
+    if assignment is not None:
+        assignment = assignment.strip().lower()
+    return list(conn.execute(
+        """
+        SELECT s.semester, s.assignment, s.student, s.issue_id, s.updated_at
+        FROM submissions s JOIN latest_snapshots l ON s.snapshot_id = l.snapshot_id
+        WHERE s.updated_at >= ? AND s.updated_at < ?
+          AND (? IS NULL OR s.assignment = ?)
+          AND (? IS NULL OR s.semester = ?)
+        ORDER BY s.updated_at, s.issue_id
+        """,
+        (start, end, assignment, assignment, semester, semester),
+    ))
+
+
+def state_transitions(
+    conn: sqlite3.Connection,
+    semester: Optional[str] = None,
+) -> List[Tuple[str, int, str, str, int, Optional[str]]]:
+    """
+    Issues whose state changed between consecutive snapshots (all snapshots).
+    Returns (semester, issue_id, from_state, to_state, snapshot_id, updated_at).
+    """
+    return list(conn.execute(
+        """
+        SELECT semester, issue_id, prev_state, state, snapshot_id, updated_at FROM (
+            SELECT semester, issue_id, state, snapshot_id, updated_at,
+                   LAG(state) OVER (PARTITION BY semester, issue_id ORDER BY snapshot_id) AS prev_state
+            FROM issues
+            WHERE ? IS NULL OR semester = ?
+        )
+        WHERE prev_state IS NOT NULL AND prev_state != state
+        ORDER BY semester, snapshot_id, issue_id
+        """,
+        (semester, semester),
+    ))
+
+
+# -----------------------------
+# CLI
+# -----------------------------
+def _print_rows(rows) -> None:
+    for row in rows:
+        print("\t".join("" if v is None else str(v) for v in row))
+
+
+def _parse_deadlines(items: List[str]) -> Dict[str, str]:
+    deadlines: Dict[str, str] = {}
+    for item in items:
+        assignment, sep, when = item.partition("=")
+        if not sep:
+            raise SystemExit(f"Bad --deadline {item!r}, expected ASSIGNMENT=2026-01-01T00:00:00Z")
+        deadlines[assignment] = when
+    return deadlines
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="SQLite history store for day09 submissions")
+    parser.add_argument("--db", type=Path, default=DB_PATH)
+    parser.add_argument("--semester", default=None, help="semester tag (load) / filter (queries)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_load = sub.add_parser("load", help="load a subjects.txt snapshot")
+    p_load.add_argument("subjects", type=Path, nargs="?", default=report.SUBJECTS_PATH)
+
+    p_late = sub.add_parser("late", help="submissions updated after their deadline")
+    p_late.add_argument("--deadline", action="append", required=True, metavar="ASSIGNMENT=ISO_TIME")
+    p_late.add_argument("--counts", action="store_true", help="only print counts per assignment")
+
+    p_window = sub.add_parser("window", help="submissions in a time window [start, end)")
+    p_window.add_argument("start")
+    p_window.add_argument("end")
+    p_window.add_argument("--assignment", default=None)
+
+    sub.add_parser("transitions", help="OPEN/CLOSED changes between snapshots")
+
+    args = parser.parse_args()
+    conn = connect(args.db)
+    try:
+        if args.command == "load":
+            semester = args.semester or "default"
+            snapshot_id = load_snapshot(conn, args.subjects, semester)
+            print(f"Loaded {args.subjects} as snapshot {snapshot_id} ({semester}) into {args.db}")
+        elif args.command == "late":
+            deadlines = _parse_deadlines(args.deadline)
+            if args.counts:
+                _print_rows(late_counts(conn, deadlines, args.semester))
+            else:
+                _print_rows(late_submissions(conn, deadlines, args.semester))
+        elif args.command == "window":
+            _print_rows(submissions_between(conn, args.start, args.end, args.assignment, args.semester))
+        elif args.command == "transitions":
+            _print_rows(state_transitions(conn, args.semester))
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
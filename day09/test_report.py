@@ -0,0 +1,399 @@
+import csv
+
+import report
+
+
+SAMPLE_LINES = [
+    "3\tOPEN\tDay08 by Noya Levy\t\t2026-01-01T10:00:00Z",
+    "",
+    "not-a-number\tOPEN\tDay08 by Nobody\t\t2026-01-01T10:00:00Z",
+    "2\tCLOSED\tday 05 and 06 - Lior Batat\t\t2025-12-01T10:00:00Z",
+    "1\tOPEN\tFinal Project proposal by Noya Levy\t\t2025-11-01T10:00:00Z",
+]
+
+
+def write_subjects(tmp_path, lines=SAMPLE_LINES):
+    path = tmp_path / "subjects.txt"
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return path
+
+
+def test_iter_subjects_txt_skips_bad_lines(tmp_path):
+    path = write_subjects(tmp_path)
+    records = list(report.iter_subjects_txt(path))
+    assert records == [
+        (3, "OPEN", "Day08 by Noya Levy"),
+        (2, "CLOSED", "day 05 and 06 - Lior Batat"),
+        (1, "OPEN", "Final Project proposal by Noya Levy"),
+    ]
+    assert report.read_subjects_txt(path) == records
+
+
+def test_iter_subjects_txt_missing_file_fails_early(tmp_path):
+    try:
+        report.iter_subjects_txt(tmp_path / "nope.txt")
+        assert False, "Expected FileNotFoundError"
+    except FileNotFoundError:
+        assert True
+
+
+def test_stream_normalized_titles_writes_csv_and_feeds_aggregation(tmp_path):
+    path = write_subjects(tmp_path)
+    csv_path = tmp_path / "normalized_titles.csv"
+
+    rows = report.stream_normalized_titles(path, csv_path)
+    submissions, missing = report.compute_missing(rows, ["day05", "day08"])
+
+    assert submissions["Noya Levy"] == {"day08", "final_project_proposal"}
+    assert missing["Noya Levy"] == ["day05"]
+    assert missing["Lior Batat"] == ["day08"]
+
+    with csv_path.open(encoding="utf-8", newline="") as f:
+        written = list(csv.reader(f))
+    assert written[0] == report.NORMALIZED_CSV_HEADER
+    assert len(written) == 4
+    assert written[2] == ["2", "CLOSED", "day 05 and 06 - Lior Batat", "Lior Batat", "day05;day06", "has_dash"]
+
+
+def test_normalize_title_matches_legacy_parser():
+    import bench_titles
+
+    titles = set(bench_titles.synthetic_titles(5000, seed=1))
+    titles.update(title for _, _, title in report.iter_subjects_txt(report.SUBJECTS_PATH))
+    titles.update([
+        "day05and06 by X",
+        "Day 5 & 6 by Y",
+        "day 1 and day 2 and 3 - Z",
+        "Final project submission-Someone",
+        "proposal: final project by Q",
+        "",
+    ])
+    for t in titles:
+        assert report.normalize_title.__wrapped__(t) == bench_titles.legacy_normalize_title(t), t
+
+
+def test_normalize_title_is_cached():
+    report.normalize_title.cache_clear()
+    first = report.normalize_title("Day08 by Noya Levy")
+    second = report.normalize_title("Day08 by Noya Levy")
+    assert first is second
+    assert report.normalize_title.cache_info().hits == 1
+
+
+def use_tmp_paths(monkeypatch, tmp_path):
+    monkeypatch.setattr(report, "SUBJECTS_PATH", tmp_path / "subjects.txt")
+    monkeypatch.setattr(report, "NORMALIZED_CSV_PATH", tmp_path / "normalized_titles.csv")
+    monkeypatch.setattr(report, "MISSING_CSV_PATH", tmp_path / "missing_submissions.csv")
+    monkeypatch.setattr(report, "REPORT_MD_PATH", tmp_path / "missing_submissions_report.md")
+    monkeypatch.setattr(report, "CHECKPOINT_PATH", tmp_path / "report_checkpoint.json")
+
+
+def test_incremental_run_matches_full_rebuild(tmp_path, monkeypatch, capsys):
+    full_dir = tmp_path / "full"
+    inc_dir = tmp_path / "inc"
+    full_dir.mkdir()
+    inc_dir.mkdir()
+
+    use_tmp_paths(monkeypatch, inc_dir)
+    write_subjects(inc_dir, SAMPLE_LINES[:2])
+    report.main([])
+    with (inc_dir / "subjects.txt").open("a", encoding="utf-8") as f:
+        f.write("\n".join(SAMPLE_LINES[2:]) + "\n")
+    report.main(["--incremental"])
+    assert "Incremental: parsed bytes" in capsys.readouterr().out
+
+    use_tmp_paths(monkeypatch, full_dir)
+    write_subjects(full_dir)
+    report.main([])
+
+    for name in ["normalized_titles.csv", "missing_submissions.csv", "report_checkpoint.json"]:
+        assert (inc_dir / name).read_bytes() == (full_dir / name).read_bytes(), name
+
+
+def test_incremental_run_handles_newest_first_exports(tmp_path, monkeypatch, capsys):
+    full_dir = tmp_path / "full"
+    inc_dir = tmp_path / "inc"
+    full_dir.mkdir()
+    inc_dir.mkdir()
+    newer = ["5\tOPEN\tDay09 by Noya Levy\t\t2026-01-05T10:00:00Z", "4\tOPEN\tDay01 by Someone Else"]
+
+    use_tmp_paths(monkeypatch, inc_dir)
+    write_subjects(inc_dir)
+    report.main([])
+    # a re-export: newer issues are prepended, the rest is unchanged
+    write_subjects(inc_dir, newer + SAMPLE_LINES)
+    report.main(["--incremental"])
+    assert "parsed new leading bytes" in capsys.readouterr().out
+
+    use_tmp_paths(monkeypatch, full_dir)
+    write_subjects(full_dir, newer + SAMPLE_LINES)
+    report.main([])
+
+    for name in ["normalized_titles.csv", "missing_submissions.csv", "report_checkpoint.json"]:
+        assert (inc_dir / name).read_bytes() == (full_dir / name).read_bytes(), name
+
+
+def test_incremental_run_rebuilds_when_input_rewritten(tmp_path, monkeypatch, capsys):
+    use_tmp_paths(monkeypatch, tmp_path)
+    write_subjects(tmp_path)
+    report.main([])
+
+    # same-length edit in the middle of the processed part
+    lines = list(SAMPLE_LINES)
+    lines[3] = lines[3].replace("Lior Batat", "Lior Bitat")
+    write_subjects(tmp_path, lines)
+    report.main(["--incremental"])
+
+    assert "full rebuild" in capsys.readouterr().out
+    missing = (tmp_path / "missing_submissions.csv").read_text(encoding="utf-8")
+    assert "Lior Bitat" in missing and "Lior Batat" not in missing
+
+
+def test_parallel_normalization_matches_serial(tmp_path):
+    import bench_titles
+
+    lines = [f"{i}\tOPEN\t{t}\t\t2026-01-01T10:00:00Z" for i, t in enumerate(bench_titles.synthetic_titles(2000))]
+    lines[10] = "garbage line"
+    path = tmp_path / "subjects.txt"
+    # CRLF line endings and no newline at the very end
+    path.write_bytes("\r\n".join(lines).encode("utf-8"))
+
+    serial_cursor = report.ReadCursor()
+    serial = list(report.iter_normalized_rows(report.iter_subjects_txt(path, cursor=serial_cursor)))
+
+    parallel_cursor = report.ReadCursor()
+    parallel = list(report.iter_normalized_rows_parallel(path, 3, cursor=parallel_cursor, min_chunk_bytes=512))
+
+    assert len(report.split_line_ranges(path, 12, min_chunk_bytes=512)) > 3
+    assert parallel == serial
+    assert parallel_cursor == serial_cursor
+
+
+def test_parallel_normalization_keeps_a_bounded_window(tmp_path, monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+
+    submitted = []
+
+    class RecordingExecutor(ThreadPoolExecutor):
+        def submit(self, fn, *args):
+            submitted.append(args[0])
+            return super().submit(fn, *args)
+
+    monkeypatch.setattr(report, "ProcessPoolExecutor", RecordingExecutor)
+    lines = [f"{i}\tOPEN\tDay{i % 9 + 1:02d} by Student {i}" for i in range(2000)]
+    path = write_subjects(tmp_path, lines)
+    n_ranges = len(report.split_line_ranges(path, 2 * report.CHUNKS_PER_WORKER, min_chunk_bytes=512))
+
+    rows = report.iter_normalized_rows_parallel(path, 2, min_chunk_bytes=512)
+    first = next(rows)
+    # the initial window + one range submitted when the first one was taken
+    assert len(submitted) == 2 * report.IN_FLIGHT_PER_WORKER + 1 < n_ranges
+    assert [first] + list(rows) == list(report.iter_normalized_rows(report.iter_subjects_txt(path)))
+    assert len(submitted) == n_ranges
+
+
+def test_split_line_ranges_cover_file_on_line_boundaries(tmp_path):
+    path = write_subjects(tmp_path)
+    data = path.read_bytes()
+    ranges = report.split_line_ranges(path, 4, min_chunk_bytes=1)
+
+    assert ranges[0][0] == 0 and ranges[-1][1] == len(data)
+    for (_, end), (begin, _) in zip(ranges, ranges[1:]):
+        assert end == begin and data[end - 1:end] == b"\n"
+    assert report.split_line_ranges(path, 4, start=len(data)) == []
+
+
+def test_submission_matrix_matches_set_based_aggregation():
+    import random
+
+    rng = random.Random(3)
+    assignments = [f"day{n:02d}" for n in range(1, 30)] + ["final_project_proposal"]
+    required = assignments[::2] + ["never_submitted"]
+    submissions = {
+        f"Student {i}": set(rng.sample(assignments, rng.randint(1, len(assignments))))
+        for i in range(300)
+    }
+
+    matrix = report.SubmissionMatrix.from_dict(submissions)
+
+    required_set = set(required)
+    assert dict(matrix) == submissions
+    assert matrix.missing(required) == {s: sorted(required_set - sub) for s, sub in submissions.items()}
+    assert matrix.complete_students(required[:-1]) == sorted(
+        s for s, sub in submissions.items() if set(required[:-1]) <= sub
+    )
+    expected_coverage = sorted(
+        (
+            (a, sum(1 for sub in submissions.values() if a in sub), 300,
+             sum(1 for sub in submissions.values() if a in sub) / 300)
+            for a in required
+        ),
+        key=lambda x: (x[3], x[0]),
+    )
+    assert matrix.coverage(required) == expected_coverage
+    assert report.compute_assignment_coverage(submissions, required) == expected_coverage
+
+
+def test_names_match_rules():
+    assert report.names_match("Rachel Steinitz", "Rachel Steinitz Eliyahu")
+    assert report.names_match("Levy Noya", "Noya Levy")
+    assert report.names_match("Rachel Steinits", "Rachel Steinitz")
+    assert not report.names_match("Dana Cohen", "Dina Cohen")
+    assert not report.names_match("Ariel Ariel", "Ariel Levy")
+    assert not report.names_match("Guy Shemesh", "Guy Vosco")
+    assert not report.names_match("Noam Ariel", "Noa Ariel")
+    assert not report.names_match("Noam", "Noam Ariel")
+
+
+def test_dedupe_student_names_clusters_and_reuses_cache(tmp_path):
+    weights = {
+        "Rachel Steinitz Eliyahu": 5,
+        "Rachel Steinitz": 1,
+        "Noya Levy": 3,
+        "Levy Noya": 1,
+        "Guy Shemesh": 4,
+    }
+    canonical = report.dedupe_student_names(weights)
+    assert canonical == {
+        "Rachel Steinitz Eliyahu": "Rachel Steinitz Eliyahu",
+        "Rachel Steinitz": "Rachel Steinitz Eliyahu",
+        "Noya Levy": "Noya Levy",
+        "Levy Noya": "Noya Levy",
+        "Guy Shemesh": "Guy Shemesh",
+    }
+
+    path = tmp_path / "student_aliases.json"
+    report.save_aliases(path, canonical)
+    cached = report.load_aliases(path)
+    assert cached == canonical
+
+    # cached names keep their mapping even if the weights flip,
+    # new variants join the existing cluster
+    again = report.dedupe_student_names({"Levy Noya": 9, "Noya Levy": 1, "Guy Shemmesh": 1}, cached)
+    assert again["Levy Noya"] == "Noya Levy"
+    assert again["Noya Levy"] == "Noya Levy"
+    assert again["Guy Shemmesh"] == "Guy Shemesh"
+
+
+def test_dedupe_keeps_short_name_shared_by_two_students_unmerged():
+    weights = {"Noa Cohen": 4, "Noa Cohen Levi": 3, "Noa Cohen Shapira": 2}
+
+    ambiguous = report.find_ambiguous_names(weights)
+    canonical = report.dedupe_student_names(weights, ambiguous=ambiguous)
+
+    assert ambiguous == {"Noa Cohen": ["Noa Cohen Levi", "Noa Cohen Shapira"]}
+    assert canonical == {n: n for n in weights}
+
+
+def test_dedupe_does_not_chain_clusters_through_a_longer_name():
+    weights = {"David Cohen Levi": 3, "David Cohen": 2, "Levi David": 1}
+
+    canonical = report.dedupe_student_names(weights)
+
+    assert canonical["David Cohen"] == "David Cohen Levi"
+    assert canonical["Levi David"] != canonical["David Cohen"]
+
+
+def test_merge_students_ors_submissions():
+    matrix = report.SubmissionMatrix.from_dict({
+        "Rachel Steinitz": {"day01"},
+        "Rachel Steinitz Eliyahu": {"day02", "day03"},
+        "Guy Vosco": {"day01"},
+    })
+    merged = matrix.merge_students({"Rachel Steinitz": "Rachel Steinitz Eliyahu"})
+
+    assert dict(merged) == {
+        "Rachel Steinitz Eliyahu": {"day01", "day02", "day03"},
+        "Guy Vosco": {"day01"},
+    }
+    assert merged.coverage(["day01"]) == [("day01", 2, 2, 1.0)]
+
+
+def test_normalized_row_table_round_trips_rows(tmp_path):
+    import pickle
+
+    path = write_subjects(tmp_path)
+    table = report.build_normalized_titles(path, tmp_path / "normalized_titles.csv")
+    rows = list(report.iter_normalized_rows(report.iter_subjects_txt(path)))
+
+    assert isinstance(table, report.NormalizedRowTable)
+    assert len(table) == len(rows)
+    assert list(table) == rows
+    assert table[-1] == rows[-1] and table[1:] == rows[1:]
+    assert not hasattr(rows[0], "__dict__")
+    assert pickle.loads(pickle.dumps(rows[0])) == rows[0]
+
+    submissions, _ = report.compute_missing(table, ["day08"])
+    assert set(submissions) == {"Noya Levy", "Lior Batat"}
+
+
+def test_bench_report_runs_every_stage(tmp_path):
+    import bench_report
+
+    path = bench_report.generate_subjects(tmp_path / "subjects.txt", 500)
+    result = bench_report.run_size(path, tmp_path)
+
+    assert result["lines"] == 500
+    assert list(result["stages"]) == [
+        "pipeline", "read", "normalize", "csv_write", "compute_missing", "coverage", "markdown",
+    ]
+    assert all(stage["seconds"] >= 0 for stage in result["stages"].values())
+
+
+def test_write_report_md_streams_full_report(tmp_path):
+    submissions = report.SubmissionMatrix.from_dict({"A B": {"day01"}, "C D": {"day01", "day02"}})
+    missing = submissions.missing(["day01", "day02"])
+    out = tmp_path / "report.md"
+
+    report.write_report_md(submissions, missing, ["day01", "day02"], out)
+
+    text = out.read_text(encoding="utf-8")
+    assert text.endswith("## Students with all required submissions\n\n- C D\n")
+    assert "- Students missing ≥1 required submission: **1**" in text
+    assert "| day02 | 1 | 2 | 50.0% |" in text
+    assert "| A B | 1 | day02 |" in text
+
+
+def test_diff_snapshots_change_log_and_missing_delta(tmp_path, monkeypatch):
+    old = write_subjects(tmp_path)  # ids 3, 2, 1
+    new = tmp_path / "new_subjects.txt"
+    # unsorted on purpose, with tiny runs to go through the external sort
+    new.write_text("\n".join([
+        "1\tOPEN\tFinal Project proposal by Noya Levy",
+        "5\tOPEN\tDay05 by Noya Levy",
+        "3\tCLOSED\tDay08 by Noya Levy",
+        "4\tOPEN\tDay08 by Guy Vosco",
+        "6\tOPEN\tDay05 by -",
+    ]) + "\n", encoding="utf-8")
+    monkeypatch.setattr(report, "EXTERNAL_SORT_CHUNK_ROWS", 2)
+
+    diff_path = tmp_path / "snapshot_diff.csv"
+    delta_path = tmp_path / "missing_delta.csv"
+    counts = report.diff_snapshots(old, new, ["day05", "day08"], diff_path, delta_path)
+
+    assert counts == {"new": 3, "removed": 1, "state": 1, "reparsed": 0}
+    with diff_path.open(encoding="utf-8", newline="") as f:
+        changes = [(int(r["issue_id"]), r["change"]) for r in csv.DictReader(f)]
+    assert changes == [(6, "new"), (5, "new"), (4, "new"), (3, "state"), (2, "removed")]
+
+    with delta_path.open(encoding="utf-8", newline="") as f:
+        delta = {r["student"]: r for r in csv.DictReader(f)}
+    assert delta["Noya Levy"]["resolved"] == "day05"
+    assert delta["Guy Vosco"]["status"] == "new_student"
+    assert delta["Guy Vosco"]["newly_missing"] == "day05"
+    assert delta["Lior Batat"]["status"] == "removed_student"
+    assert "" not in delta  # "Day05 by -" has no student, like in the report
+
+
+def test_iter_records_desc_matches_sorted(tmp_path):
+    import bench_titles
+    import random
+
+    ids = list(range(1, 301))
+    random.Random(2).shuffle(ids)
+    titles = bench_titles.synthetic_titles(300)
+    path = tmp_path / "subjects.txt"
+    path.write_text("".join(f"{i}\tOPEN\t{t}\n" for i, t in zip(ids, titles)), encoding="utf-8")
+
+    merged = list(report.iter_records_desc(path, tmp_path, chunk_rows=7))
+    assert merged == sorted(report.iter_subjects_txt(path), key=lambda r: -r[0])
@@ -0,0 +1,113 @@
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+
+import report
+import report_server
+
+
+LINES = [
+    "3\tOPEN\tDay08 by Noya Levy\t\t2026-01-01T10:00:00Z",
+    "2\tCLOSED\tday 05 and 06 - Lior Batat\t\t2025-12-01T10:00:00Z",
+]
+
+
+def start_server(index):
+    server = report_server.make_server(index, port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address[:2]
+    return server, f"http://{host}:{port}"
+
+
+def get(url):
+    try:
+        with urllib.request.urlopen(url, timeout=5) as resp:
+            return resp.status, json.loads(resp.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+def test_queries_over_http_follow_appended_lines(tmp_path):
+    path = tmp_path / "subjects.txt"
+    path.write_text("\n".join(LINES) + "\n", encoding="utf-8")
+    index = report_server.SubmissionIndex(path, ["day05", "day08"])
+    server, base = start_server(index)
+    try:
+        assert get(base + "/missing?assignment=day08") == (200, {"assignment": "day08", "students": ["Lior Batat"]})
+        assert get(base + "/student?name=noya%20levy") == (
+            200, {"student": "Noya Levy", "submitted": ["day08"], "missing": ["day05"]},
+        )
+        assert get(base + "/student?name=nobody")[0] == 404
+
+        # half-written line is not read until its newline arrives
+        with path.open("a", encoding="utf-8") as f:
+            f.write("4\tOPEN\tDay08 by Lior")
+        index.refresh()
+        assert get(base + "/missing?assignment=day08")[1]["students"] == ["Lior Batat"]
+
+        with path.open("a", encoding="utf-8") as f:
+            f.write(" Batat\t\t2026-01-02T10:00:00Z\n")
+        index.refresh()
+        assert get(base + "/missing?assignment=day08")[1]["students"] == []
+        assert get(base + "/coverage")[1] == [
+            {"assignment": "day05", "submitted": 1, "total": 2, "rate": 0.5},
+            {"assignment": "day08", "submitted": 2, "total": 2, "rate": 1.0},
+        ]
+        assert get(base + "/missing")[1] == {"Noya Levy": ["day05"]}
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_tail_follower_picks_up_new_lines_and_rewrites(tmp_path):
+    path = tmp_path / "subjects.txt"
+    path.write_text(LINES[0] + "\n", encoding="utf-8")
+    index = report_server.SubmissionIndex(path, ["day08"])
+    follower = report_server.TailFollower(index, interval=0.01)
+    follower.start()
+    try:
+        with path.open("a", encoding="utf-8") as f:
+            f.write(LINES[1] + "\n")
+        deadline = time.time() + 5
+        while index.health()["students"] < 2 and time.time() < deadline:
+            time.sleep(0.01)
+        assert index.missing_assignment("day08") == ["Lior Batat"]
+
+        # rewritten file -> rebuilt index
+        path.write_text("9\tOPEN\tDay08 by Guy Vosco\n", encoding="utf-8")
+        while "Noya Levy" in str(index.missing()) or index.health()["students"] != 1:
+            assert time.time() < deadline
+            time.sleep(0.01)
+        assert index.student("Guy Vosco")["missing"] == []
+        assert index.student("Noya Levy") is None
+    finally:
+        follower.stop()
+
+
+def test_queries_are_answered_while_the_index_is_rebuilt(tmp_path, monkeypatch):
+    path = tmp_path / "subjects.txt"
+    path.write_text("\n".join(LINES) + "\n", encoding="utf-8")
+    index = report_server.SubmissionIndex(path, ["day08"])
+
+    release = threading.Event()
+    normalize = report.iter_normalized_rows
+
+    def slow_rows(records):
+        release.wait(5)
+        yield from normalize(records)
+
+    monkeypatch.setattr(report, "iter_normalized_rows", slow_rows)
+    path.write_text("9\tOPEN\tDay08 by Guy Vosco\n", encoding="utf-8")
+    refresher = threading.Thread(target=index.refresh)
+    refresher.start()
+    try:
+        time.sleep(0.05)
+        # the rebuild is stuck reading; queries still see the old index right away
+        assert index.missing_assignment("day08") == ["Lior Batat"]
+    finally:
+        release.set()
+        refresher.join()
+    assert index.missing_assignment("day08") == []
+    assert index.student("Guy Vosco") is not None
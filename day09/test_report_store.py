@@ -0,0 +1,50 @@
+import report_store
+
+
+SNAPSHOT_1 = [
+    "3\tOPEN\tDay08 by Noya Levy\t\t2026-01-03T10:00:00Z",
+    "2\tOPEN\tday 05 and 06 - Lior Batat\t\t2025-12-01T10:00:00Z",
+    "1\tOPEN\tDay08 by Lior Batat\t\t2025-12-20T10:00:00Z",
+]
+SNAPSHOT_2 = [
+    "4\tOPEN\tDay08 by Guy Vosco\t\t2026-01-05T10:00:00Z",
+    "3\tCLOSED\tDay08 by Noya Levy\t\t2026-01-04T10:00:00Z",
+] + SNAPSHOT_1[1:]
+
+
+def load(conn, tmp_path, name, lines, semester="2025-26"):
+    path = tmp_path / name
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return report_store.load_snapshot(conn, path, semester)
+
+
+def test_history_queries(tmp_path):
+    conn = report_store.connect(tmp_path / "history.db")
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    first = load(conn, tmp_path, "s1.txt", SNAPSHOT_1)
+    second = load(conn, tmp_path, "s2.txt", SNAPSHOT_2)
+    load(conn, tmp_path, "other.txt", [
+        "2\tOPEN\tDay08 by -\t\t2026-01-10T00:00:00Z",
+        "1\tOPEN\tDay08 by Someone Else\t\t2026-01-09T00:00:00Z",
+    ], "2026-27")
+
+    late = report_store.late_submissions(conn, {"day08": "2026-01-01T00:00:00Z"}, semester="2025-26")
+    assert [(r[2], r[3]) for r in late] == [("Noya Levy", 3), ("Guy Vosco", 4)]
+    assert report_store.late_counts(conn, {"day08": "2026-01-01T00:00:00Z", "day05": "2026-01-01T00:00:00Z"}) == [
+        ("day05", 0), ("day08", 3),
+    ]
+    assert report_store.late_counts(conn, {" Day08 ": "2026-01-01T00:00:00Z"}, semester="2025-26") == [("day08", 2)]
+    assert report_store.late_counts(conn, {}) == []
+
+    window = report_store.submissions_between(conn, "2025-12-01T00:00:00Z", "2025-12-02T00:00:00Z")
+    assert [(r[1], r[2]) for r in window] == [("day05", "Lior Batat"), ("day06", "Lior Batat")]
+    assert report_store.submissions_between(
+        conn, "2025-12-01T00:00:00Z", "2026-12-31T00:00:00Z", assignment="DAY08", semester="2026-27"
+    ) == [("2026-27", "day08", "Someone Else", 1, "2026-01-09T00:00:00Z")]
+
+    assert report_store.state_transitions(conn) == [
+        ("2025-26", 3, "OPEN", "CLOSED", second, "2026-01-04T10:00:00Z"),
+    ]
+    assert first < second
+    conn.close()